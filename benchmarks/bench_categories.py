@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Show list_tool_categories(category=...) latency staying flat as the category count grows.
+"""
+import os
+import sys
+import json
+import time
+import asyncio
+import logging
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+logging.disable(logging.CRITICAL)
+
+import fullstack_webdev_server as server  # noqa: E402
+
+
+def synthetic_catalog(categories: int, tools_per_category: int):
+    """Build a catalog with the given number of categories, each holding the same number of tools."""
+    tools = []
+    for category in range(categories):
+        for position in range(tools_per_category):
+            tools.append(
+                {
+                    "key": f"tool-{category}-{position}",
+                    "aliases": [],
+                    "label": f"Tool {category}-{position}",
+                    "category": f"Category {category} & Group {category}",
+                    "homepage": f"https://example.com/{category}/{position}",
+                    "summary": "Synthetic benchmark entry.",
+                    "cli": [f"npm install tool-{category}-{position}"],
+                }
+            )
+    return server._Catalog(
+        tools,
+        server.FRAMEWORK_STARTERS,
+        server.DEPLOYMENT_PLAYBOOKS,
+        server.STACK_RECIPES,
+        server.DESIGN_KNOWLEDGE_DATA,
+        source=f"synthetic-{categories}",
+    )
+
+
+def legacy_lookup(catalog, category: str):
+    """The previous implementation: normalize every category name per request, then sort members."""
+    normalized = server._normalize_key(category)
+    for key in catalog.category_lookup:
+        if server._normalize_key(key) == normalized:
+            return sorted(catalog.category_lookup[key])
+    return None
+
+
+def per_call_us(func, iterations: int) -> float:
+    """Return the mean microseconds per call of func over iterations."""
+    started = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - started) / iterations * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    parser.add_argument("--sizes", default="10,100,1000,10000", help="comma-separated category counts")
+    parser.add_argument("--tools-per-category", type=int, default=5)
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+
+    loop = asyncio.new_event_loop()
+    results = []
+    for size in (int(value) for value in args.sizes.split(",")):
+        catalog = synthetic_catalog(size, args.tools_per_category).build_all()
+        server._CATALOG = catalog
+        target = f"category {size - 1} & group {size - 1}"
+        alias = f"group {size - 1}"
+
+        def indexed():
+            loop.run_until_complete(server.list_tool_categories(category=target))
+
+        def indexed_uncached():
+            server._RESPONSE_CACHE.clear()
+            loop.run_until_complete(server.list_tool_categories(category=alias, limit="2"))
+
+        results.append(
+            {
+                "categories": size,
+                "indexed_us": round(per_call_us(indexed, args.iterations), 2),
+                "indexed_uncached_us": round(per_call_us(indexed_uncached, args.iterations), 2),
+                "legacy_scan_us": round(
+                    per_call_us(lambda: legacy_lookup(catalog, target), max(1, args.iterations // 10)), 2
+                ),
+            }
+        )
+    loop.close()
+    print(json.dumps({"benchmark": "list_tool_categories", "results": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
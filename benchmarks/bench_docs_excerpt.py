@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Time fetch_docs_excerpt against a local stub server: a full download, a disk cache hit, and a 304
+revalidation, plus peak memory while streaming a page far larger than the download byte cap.
+"""
+import os
+import sys
+import json
+import time
+import shutil
+import asyncio
+import logging
+import argparse
+import tempfile
+import threading
+import tracemalloc
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+CACHE_DIR = tempfile.mkdtemp(prefix="bench-docs-")
+os.environ["FULLSTACK_WEBDEV_DOCS_CACHE_DIR"] = CACHE_DIR
+os.environ.setdefault("FULLSTACK_WEBDEV_STATUS_PREFETCH", "0")
+logging.disable(logging.CRITICAL)
+
+import fullstack_webdev_server as server  # noqa: E402
+
+
+class DocsHandler(BaseHTTPRequestHandler):
+    """Serve an HTML page with an ETag at /page/*, and an endless page at /huge."""
+
+    page = b""
+    requests = 0
+    not_modified = 0
+
+    def do_GET(self):
+        DocsHandler.requests += 1
+        if self.path == "/huge":
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html")
+            self.end_headers()
+            chunk = b"<p>" + b"x" * 65536 + b"</p>"
+            try:
+                for _ in range(4096):
+                    self.wfile.write(chunk)
+            except (BrokenPipeError, ConnectionResetError):
+                pass
+            return
+        if self.headers.get("If-None-Match") == '"v1"':
+            DocsHandler.not_modified += 1
+            self.send_response(304)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(self.page)))
+        self.send_header("ETag", '"v1"')
+        self.end_headers()
+        self.wfile.write(self.page)
+
+    def log_message(self, *args):
+        pass
+
+
+def build_page(kib: int) -> bytes:
+    """Return an HTML documentation page of roughly kib KiB."""
+    paragraph = "<p>Install the package, configure the client, and call the API from a route handler.</p>"
+    body = paragraph * max(1, kib * 1024 // len(paragraph))
+    return f"<html><head><title>Stub Docs</title><script>var a = 1;</script></head><body><nav>Menu</nav>" \
+        f"<main><h1>Getting started</h1>{body}</main></body></html>".encode()
+
+
+async def timed(rounds: int, call) -> float:
+    """Return the mean milliseconds of rounds awaited calls."""
+    started = time.perf_counter()
+    for index in range(rounds):
+        await call(index)
+    return round((time.perf_counter() - started) / rounds * 1000, 3)
+
+
+async def run(args) -> dict:
+    DocsHandler.page = build_page(args.page_kib)
+    stub = ThreadingHTTPServer(("127.0.0.1", 0), DocsHandler)
+    stub.daemon_threads = True
+    threading.Thread(target=stub.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{stub.server_address[1]}"
+    tools = [dict(entry, homepage=f"{base}/page/{index}") for index, entry in enumerate(server.RAW_TOOL_DATA)]
+    tools.append(dict(server.RAW_TOOL_DATA[0], key="huge-page", aliases=[], label="Huge Page", homepage=f"{base}/huge"))
+    server._swap_catalog(
+        server._Catalog(
+            tools,
+            server.FRAMEWORK_STARTERS,
+            server.DEPLOYMENT_PLAYBOOKS,
+            server.STACK_RECIPES,
+            server.DESIGN_KNOWLEDGE_DATA,
+            source="bench-docs",
+        ).build_all()
+    )
+    names = [entry["key"] for entry in server.RAW_TOOL_DATA]
+
+    async def fetch(index, refresh=""):
+        await server.fetch_docs_excerpt(names[index % len(names)], refresh=refresh)
+
+    download_ms = await timed(len(names), fetch)
+    requests_before = DocsHandler.requests
+    hit_ms = await timed(args.rounds, fetch)
+    hit_requests = DocsHandler.requests - requests_before
+    revalidate_ms = await timed(args.rounds, lambda index: fetch(index, refresh="true"))
+
+    tracemalloc.start()
+    started = time.perf_counter()
+    reply = await server.fetch_docs_excerpt("huge-page", refresh="true", output_format="json")
+    huge_ms = round((time.perf_counter() - started) * 1000, 1)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    await server._close_http_client()
+    stub.shutdown()
+    shutil.rmtree(CACHE_DIR, ignore_errors=True)
+    return {
+        "benchmark": "fetch_docs_excerpt",
+        "page_kib": args.page_kib,
+        "download_ms": download_ms,
+        "disk_hit_ms": hit_ms,
+        "disk_hit_network_requests": hit_requests,
+        "revalidate_304_ms": revalidate_ms,
+        "not_modified_replies": DocsHandler.not_modified,
+        "huge_page": {
+            "served_mib": round(4096 * 65543 / 1024 / 1024),
+            "byte_cap_mib": round(server.DOCS_MAX_BYTES / 1024 / 1024, 1),
+            "read_bytes": json.loads(reply).get("bytes"),
+            "ms": huge_ms,
+            "peak_traced_mib": round(peak / 1024 / 1024, 1),
+        },
+        "cache": server._DOCS_CACHE.stats(),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    parser.add_argument("--rounds", type=int, default=200)
+    parser.add_argument("--page-kib", type=int, default=256, help="size of each stub documentation page")
+    args = parser.parse_args()
+    print(json.dumps(asyncio.run(run(args)), indent=2))
+
+
+if __name__ == "__main__":
+    main()
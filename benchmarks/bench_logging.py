@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Measure tool throughput with logging off, plain text, and queued JSON with and without sampling.
+"""
+import os
+import sys
+import json
+import argparse
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PROBE = """
+import sys
+import time
+import asyncio
+import fullstack_webdev_server as server
+
+CALLS = (
+    ("fetch_tool_reference", {"tool": "prisma"}),
+    ("framework_quickstart", {"framework": "next.js", "package_manager": "pnpm"}),
+    ("search_catalog", {"query": "postgres orm"}),
+)
+
+
+async def main(rounds):
+    for name, arguments in CALLS:
+        await server.mcp.call_tool(name, arguments)
+    started = time.perf_counter()
+    for index in range(rounds):
+        name, arguments = CALLS[index % len(CALLS)]
+        await server.mcp.call_tool(name, arguments)
+    elapsed = time.perf_counter() - started
+    server._stop_logging()
+    print(rounds / elapsed)
+
+
+asyncio.run(main(int(sys.argv[1])))
+"""
+
+CONFIGS = {
+    "off": {"FULLSTACK_WEBDEV_LOG_LEVEL": "WARNING"},
+    "text": {"FULLSTACK_WEBDEV_LOG_FORMAT": "text", "FULLSTACK_WEBDEV_LOG_QUEUE": "0"},
+    "text_queued": {"FULLSTACK_WEBDEV_LOG_FORMAT": "text", "FULLSTACK_WEBDEV_LOG_QUEUE": "1"},
+    "json_queued": {"FULLSTACK_WEBDEV_LOG_FORMAT": "json"},
+    "json_queued_sampled": {"FULLSTACK_WEBDEV_LOG_FORMAT": "json", "FULLSTACK_WEBDEV_LOG_SAMPLING": "*=0.1"},
+}
+
+
+def run(config: dict, rounds: int, stderr) -> float:
+    """Return tool calls per second for one logging configuration in a fresh interpreter."""
+    env = dict(os.environ, PYTHONPATH=ROOT, FULLSTACK_WEBDEV_STATUS_PREFETCH="0", **config)
+    for key in ("FULLSTACK_WEBDEV_LOG_LEVEL", "FULLSTACK_WEBDEV_LOG_FORMAT", "FULLSTACK_WEBDEV_LOG_QUEUE",
+                "FULLSTACK_WEBDEV_LOG_SAMPLING"):
+        if key not in config:
+            env.pop(key, None)
+    output = subprocess.run(
+        [sys.executable, "-c", PROBE, str(rounds)], env=env, stdout=subprocess.PIPE, stderr=stderr, text=True, check=True
+    ).stdout
+    return float(output)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    parser.add_argument("--rounds", type=int, default=5000, help="tool calls per configuration")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per configuration; the best is reported")
+    parser.add_argument("--log-file", default=os.devnull, help="where the server's stderr goes (default: discard)")
+    args = parser.parse_args()
+
+    results = {}
+    with open(args.log_file, "w") as stderr:
+        for name, config in CONFIGS.items():
+            results[name] = round(max(run(config, args.rounds, stderr) for _ in range(args.repeat)), 1)
+    print(json.dumps({"rounds": args.rounds, "calls_per_second": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
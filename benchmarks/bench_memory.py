@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Compare the memory and access cost of catalog entries held as dicts versus slotted records.
+"""
+import os
+import gc
+import sys
+import json
+import time
+import logging
+import argparse
+import tracemalloc
+from operator import attrgetter, itemgetter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+logging.disable(logging.CRITICAL)
+
+import fullstack_webdev_server as server  # noqa: E402
+
+SECTIONS = {
+    "tools": (server.ToolEntry, lambda: server.RAW_TOOL_DATA, "key"),
+    "frameworks": (server.FrameworkStarter, lambda: server.FRAMEWORK_STARTERS.values(), "key"),
+    "deployments": (server.Playbook, lambda: server.DEPLOYMENT_PLAYBOOKS.values(), "key"),
+    "recipes": (server.Recipe, lambda: server.STACK_RECIPES, "id"),
+    "design": (server.DesignCategory, lambda: server.DESIGN_KNOWLEDGE_DATA, "key"),
+}
+
+
+def synthetic_entries(section: str, count: int) -> list:
+    """Return count entries for a section, decoded from JSON like a catalog file so no strings are shared."""
+    _, source, id_field = SECTIONS[section]
+    templates = list(source())
+    entries = []
+    for position in range(count):
+        template = templates[position % len(templates)]
+        entries.append({"key": f"{section}-{position}", **template, id_field: f"{section}-{position}"})
+    return json.loads(json.dumps(entries))
+
+
+def retained_bytes(build) -> tuple:
+    """Return what build() returns together with the bytes it still holds once built."""
+    gc.collect()
+    tracemalloc.start()
+    value = build()
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return value, size
+
+
+def access_ns(entries: list, getter, rounds: int) -> float:
+    """Return the mean nanoseconds to read one field from every entry."""
+    started = time.perf_counter()
+    for _ in range(rounds):
+        for _ in map(getter, entries):
+            pass
+    return (time.perf_counter() - started) / (rounds * len(entries)) * 1e9
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    parser.add_argument("--entries", type=int, default=10000, help="entries per catalog section")
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    results = []
+    for section, (record_type, _, id_field) in SECTIONS.items():
+
+        def build_records(record_type=record_type, section=section):
+            return [record_type.from_dict(entry) for entry in synthetic_entries(section, args.entries)]
+
+        build_records()  # grow the interpreter's intern table once so it is not charged to the records
+        dicts, dict_bytes = retained_bytes(lambda: synthetic_entries(section, args.entries))
+        records, record_bytes = retained_bytes(build_records)
+        results.append(
+            {
+                "section": section,
+                "entries": args.entries,
+                "dict_kib": round(dict_bytes / 1024, 1),
+                "record_kib": round(record_bytes / 1024, 1),
+                "saved_percent": round(100 * (1 - record_bytes / dict_bytes), 1),
+                "dict_access_ns": round(access_ns(dicts, itemgetter(id_field), args.rounds), 1),
+                "record_access_ns": round(access_ns(records, attrgetter(id_field), args.rounds), 1),
+            }
+        )
+    print(json.dumps({"benchmark": "catalog_memory", "results": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
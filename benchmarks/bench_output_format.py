@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Compare the text and JSON output formats: server render time, payload size, and client parse time.
+"""
+import os
+import re
+import sys
+import json
+import time
+import asyncio
+import argparse
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.environ.setdefault("FULLSTACK_WEBDEV_LOG_LEVEL", "WARNING")
+
+import fullstack_webdev_server as server  # noqa: E402
+
+CALLS = (
+    ("fetch_tool_reference", {"tool": "prisma"}),
+    ("framework_quickstart", {"framework": "next.js", "package_manager": "pnpm"}),
+    ("deployment_checklist", {"provider": "vercel"}),
+    ("list_tool_categories", {"category": "app frameworks"}),
+    ("design_knowledge_sources", {"category": "typography"}),
+    ("search_catalog", {"query": "postgres orm"}),
+    ("recommend_stack", {"project": "realtime saas dashboard"}),
+)
+
+# What a client has to do to pull fields back out of the text reply.
+TEXT_FIELD = re.compile(r"^(?:- )?([^:\n]+): (.*)$", re.MULTILINE)
+
+
+async def render_seconds(name: str, arguments: dict, output_format: str, rounds: int) -> tuple:
+    """Return (seconds per call, response) for one tool and format."""
+    handler = getattr(server, name)
+    response = await handler(**arguments, output_format=output_format)
+    started = time.perf_counter()
+    for _ in range(rounds):
+        await handler(**arguments, output_format=output_format)
+    return (time.perf_counter() - started) / rounds, response
+
+
+def parse_seconds(parse, response: str, rounds: int) -> float:
+    """Return client-side seconds per parse of a response."""
+    started = time.perf_counter()
+    for _ in range(rounds):
+        parse(response)
+    return (time.perf_counter() - started) / rounds
+
+
+async def run(rounds: int) -> dict:
+    server._get_catalog().build_all()
+    results = {}
+    for name, arguments in CALLS:
+        text_seconds, text = await render_seconds(name, arguments, "text", rounds)
+        json_seconds, payload = await render_seconds(name, arguments, "json", rounds)
+        results[name] = {
+            "text_us": round(text_seconds * 1e6, 2),
+            "json_us": round(json_seconds * 1e6, 2),
+            "text_bytes": len(text.encode()),
+            "json_bytes": len(payload.encode()),
+            "text_parse_us": round(parse_seconds(TEXT_FIELD.findall, text, rounds) * 1e6, 2),
+            "json_parse_us": round(parse_seconds(json.loads, payload, rounds) * 1e6, 2),
+        }
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    parser.add_argument("--rounds", type=int, default=5000, help="calls per tool and format")
+    args = parser.parse_args()
+    print(json.dumps({"rounds": args.rounds, "tools": asyncio.run(run(args.rounds))}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Measure related_tools index build time, memory, and query latency on synthetic catalogs of up to 10,000 tools.
+"""
+import os
+import sys
+import json
+import math
+import time
+import random
+import asyncio
+import logging
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+logging.disable(logging.CRITICAL)
+
+import fullstack_webdev_server as server  # noqa: E402
+
+
+def synthetic_catalog(size: int, seed: int = 7):
+    """Build a catalog of size tools whose summaries mix words drawn from the built-in summaries."""
+    rng = random.Random(seed)
+    vocabulary = sorted({word for entry in server.RAW_TOOL_DATA for word in entry["summary"].rstrip(".").split()})
+    vocabulary += [f"term{position}" for position in range(size // 4)]
+    categories = [f"Category {position}" for position in range(max(1, size // 100))]
+    tools = []
+    for position in range(size):
+        tools.append(
+            {
+                "key": f"tool-{position}",
+                "aliases": [],
+                "label": f"Tool {position}",
+                "category": rng.choice(categories),
+                "homepage": f"https://example.com/{position}",
+                "summary": " ".join(rng.sample(vocabulary, 12)) + ".",
+                "cli": [f"npm install tool-{position}"],
+            }
+        )
+    recipes = []
+    for position in range(max(1, size // 50)):
+        members = ", ".join(f"Tool {member}" for member in rng.sample(range(size), 4))
+        recipes.append(
+            {
+                "id": f"recipe-{position}",
+                "match": [f"recipe{position}"],
+                "summary": "Synthetic benchmark recipe.",
+                "frontend": members,
+                "backend": "",
+                "infrastructure": "",
+            }
+        )
+    return server._Catalog(
+        tools,
+        server.FRAMEWORK_STARTERS,
+        server.DEPLOYMENT_PLAYBOOKS,
+        recipes,
+        server.DESIGN_KNOWLEDGE_DATA,
+        source=f"synthetic-{size}",
+    )
+
+
+def scan_related(index, row: int, limit: int) -> list:
+    """Baseline without the index: cosine against every other tool from the raw feature dicts."""
+
+    def vector(counts):
+        weights = {term: (1 + math.log(count)) * index.idf[term] for term, count in counts.items()}
+        norm = math.sqrt(sum(weight * weight for weight in weights.values())) or 1.0
+        return {term: weight / norm for term, weight in weights.items()}
+
+    query = vector(index.features[row])
+    scores = []
+    for other, counts in enumerate(index.features):
+        if other != row:
+            target = vector(counts)
+            scores.append((sum(weight * target.get(term, 0.0) for term, weight in query.items()), other))
+    scores.sort(key=lambda pair: (-pair[0], pair[1]))
+    return scores[:limit]
+
+
+def timed_ms(func, repeat: int = 1) -> float:
+    """Return the mean milliseconds per call of func over repeat calls."""
+    started = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - started) / repeat * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    parser.add_argument("--sizes", default="100,1000,10000", help="comma-separated tool counts")
+    parser.add_argument("--batch", type=int, default=50, help="tools per batch query")
+    parser.add_argument("--limit", type=int, default=5)
+    args = parser.parse_args()
+
+    loop = asyncio.new_event_loop()
+    results = []
+    for size in (int(value) for value in args.sizes.split(",")):
+        catalog = synthetic_catalog(size).build_all()
+        server._CATALOG = catalog
+        # build_all already made the index the tools use; time a separate build of the same index.
+        started = time.perf_counter()
+        server._RelatedIndex(catalog, server.RELATED_MAX_FEATURES, server.RELATED_CACHE_K)
+        build_ms = (time.perf_counter() - started) * 1000
+        index = catalog.related_index
+        rng = random.Random(size)
+        singles = rng.sample(range(size), min(size, 20))
+        batch = rng.sample(range(size), min(size, args.batch))
+        batch_names = ", ".join(catalog.tools[row].key for row in batch)
+
+        def single_cold():
+            index.neighbors.clear()
+            index.related([rng.choice(singles)], args.limit)
+
+        def batch_cold():
+            index.neighbors.clear()
+            index.related(batch, args.limit)
+
+        def tool_batch_cached():
+            loop.run_until_complete(server.related_tools(tool=batch_names, limit=str(args.limit)))
+
+        results.append(
+            {
+                "tools": size,
+                "features": len(index.columns),
+                "nonzero": len(index.row_values),
+                "index_mb": round(index.nbytes / 1024 / 1024, 2),
+                "build_ms": round(build_ms, 1),
+                "single_cold_ms": round(timed_ms(single_cold, 20), 3),
+                "batch_cold_ms": round(timed_ms(batch_cold, 5), 3),
+                "tool_batch_cached_ms": round(timed_ms(tool_batch_cached, 20), 3),
+                "python_scan_single_ms": round(timed_ms(lambda: scan_related(index, singles[0], args.limit)), 1),
+            }
+        )
+    loop.close()
+    print(json.dumps({"benchmark": "related_tools", "batch": args.batch, "results": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
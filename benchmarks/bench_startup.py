@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Measure cold-start time of the server: interpreter launch, module import, and first catalog build.
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import statistics
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PROBE = """
+import time
+started = time.perf_counter()
+import fullstack_webdev_server as server
+imported = time.perf_counter()
+catalog = server._get_catalog()
+catalog.search_index.search("prisma")
+ready = time.perf_counter()
+print(f"{imported - started} {ready - imported}")
+"""
+
+
+def run_probe() -> tuple:
+    """Start a fresh interpreter and return (total, import, catalog) seconds."""
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    env.pop("FULLSTACK_WEBDEV_CATALOG_DIR", None)
+    started = time.perf_counter()
+    output = subprocess.run(
+        [sys.executable, "-c", PROBE], env=env, capture_output=True, text=True, check=True
+    ).stdout
+    total = time.perf_counter() - started
+    import_seconds, catalog_seconds = output.split()
+    return total, float(import_seconds), float(catalog_seconds)
+
+
+def summarize(samples: list) -> dict:
+    """Reduce probe samples to median timings in milliseconds."""
+    return {
+        "process_ms": round(statistics.median(sample[0] for sample in samples) * 1000, 2),
+        "import_ms": round(statistics.median(sample[1] for sample in samples) * 1000, 2),
+        "catalog_ms": round(statistics.median(sample[2] for sample in samples) * 1000, 3),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    parser.add_argument("--runs", type=int, default=10, help="interpreter launches")
+    args = parser.parse_args()
+    results = summarize([run_probe() for _ in range(args.runs)])
+    results["runs"] = args.runs
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
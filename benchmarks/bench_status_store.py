@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Count outbound status checks when N stdio server processes look up the same tools, with and without
+the shared SQLite status store. Every catalog homepage points at a local stub that counts HEAD requests.
+"""
+import os
+import sys
+import json
+import time
+import asyncio
+import argparse
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from mcp import ClientSession, StdioServerParameters
+from mcp.client.stdio import stdio_client
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SERVER = os.path.join(ROOT, "fullstack_webdev_server.py")
+sys.path.insert(0, ROOT)
+
+import fullstack_webdev_server as server  # noqa: E402
+
+
+class CountingHandler(BaseHTTPRequestHandler):
+    """Answer HEAD requests after a short delay and count them."""
+
+    delay = 0.0
+    count = 0
+    lock = threading.Lock()
+
+    def do_HEAD(self):
+        with self.lock:
+            CountingHandler.count += 1
+        time.sleep(self.delay)
+        self.send_response(200)
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+async def run_session(env: dict, tools: list, start_delay: float) -> float:
+    """Start one stdio server, check the status of every tool once, and return the session's duration."""
+    await asyncio.sleep(start_delay)
+    params = StdioServerParameters(command=sys.executable, args=[SERVER], env=env)
+    started = time.perf_counter()
+    with open(os.devnull, "w") as devnull:
+        async with stdio_client(params, errlog=devnull) as (read, write):
+            async with ClientSession(read, write) as session:
+                await session.initialize()
+                for tool in tools:
+                    await session.call_tool("fetch_tool_reference", {"tool": tool, "include_status": "true"})
+    return time.perf_counter() - started
+
+
+async def run_round(sessions: int, stagger: float, env: dict, tools: list) -> dict:
+    """Run the sessions concurrently, each starting stagger seconds after the previous one."""
+    CountingHandler.count = 0
+    started = time.perf_counter()
+    durations = await asyncio.gather(*(run_session(env, tools, index * stagger) for index in range(sessions)))
+    return {
+        "head_requests": CountingHandler.count,
+        "requests_per_session": round(CountingHandler.count / sessions, 1),
+        "mean_session_s": round(sum(durations) / len(durations), 3),
+        "wall_s": round(time.perf_counter() - started, 3),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    parser.add_argument("--sessions", type=int, default=8, help="concurrent stdio server processes")
+    parser.add_argument("--stagger", type=float, default=0.3, help="seconds between session starts")
+    parser.add_argument("--stub-delay", type=float, default=0.05, help="seconds the stub takes per HEAD request")
+    args = parser.parse_args()
+
+    CountingHandler.delay = args.stub_delay
+    stub = ThreadingHTTPServer(("127.0.0.1", 0), CountingHandler)
+    stub.daemon_threads = True
+    threading.Thread(target=stub.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{stub.server_address[1]}"
+
+    with tempfile.TemporaryDirectory(prefix="bench-store-") as workdir:
+        catalog_dir = os.path.join(workdir, "catalog")
+        os.makedirs(catalog_dir)
+        tools = [dict(entry, homepage=f"{base}/{index}") for index, entry in enumerate(server.RAW_TOOL_DATA)]
+        with open(os.path.join(catalog_dir, "tools.json"), "w") as handle:
+            json.dump(tools, handle)
+        env = {
+            **os.environ,
+            "FULLSTACK_WEBDEV_CATALOG_DIR": catalog_dir,
+            "FULLSTACK_WEBDEV_STATUS_PREFETCH": "0",
+            "FULLSTACK_WEBDEV_LOG_LEVEL": "WARNING",
+        }
+        names = [entry["key"] for entry in tools]
+        results = {
+            "sessions": args.sessions,
+            "tools_per_session": len(names),
+            "without_store": asyncio.run(run_round(args.sessions, args.stagger, env, names)),
+            "with_store": asyncio.run(
+                run_round(
+                    args.sessions,
+                    args.stagger,
+                    {**env, "FULLSTACK_WEBDEV_STATUS_STORE": os.path.join(workdir, "status.sqlite3")},
+                    names,
+                )
+            ),
+        }
+    stub.shutdown()
+    before, after = results["without_store"]["head_requests"], results["with_store"]["head_requests"]
+    results["requests_saved_percent"] = round(100 * (1 - after / before), 1) if before else 0.0
+    print(json.dumps({"benchmark": "status_store", **results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,304 @@
+#!/usr/bin/env python3
+"""
+Benchmark every MCP tool, called directly and through FastMCP dispatch, on the built-in catalog and
+synthetic catalogs scaled 10x/100x/1000x, plus import time and cold start. Status checks hit a local
+stub HTTP server. Results are JSON; pass --compare with an earlier result to flag regressions.
+"""
+import os
+import sys
+import json
+import time
+import asyncio
+import logging
+import argparse
+import platform
+import socket
+import statistics
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.environ.setdefault("FULLSTACK_WEBDEV_STATUS_PREFETCH", "0")
+os.environ.setdefault("FULLSTACK_WEBDEV_DOCS_CACHE_DIR", tempfile.mkdtemp(prefix="bench-docs-"))
+logging.disable(logging.CRITICAL)
+
+import fullstack_webdev_server as server  # noqa: E402
+from bench_startup import run_probe  # noqa: E402
+from check_import_time import MODULE, measure_import  # noqa: E402
+
+# A realistic mix per tool: exact hits, aliases, typos, misses, and paging.
+CASES = {
+    "list_tool_categories": [{}, {"category": "ui"}, {"category": "databases", "limit": "5"}, {"category": "nope"}],
+    "fetch_tool_reference": [{"tool": "prisma"}, {"tool": "tailwind"}, {"tool": "sveltkit"}, {"tool": "unknown"}],
+    "fetch_docs_excerpt": [{"name": "prisma"}, {"name": "tailwind", "max_chars": "200"}, {"name": "unknown"}],
+    "framework_quickstart": [
+        {"framework": "next.js", "package_manager": "pnpm"},
+        {"framework": "vue"},
+        {"framework": "nxt", "package_manager": "bun"},
+    ],
+    "recommend_stack": [
+        {"project": "B2B SaaS dashboard, with billing"},
+        {"project": "online store with live chat", "realtime": "yes"},
+        {"project": "personal blog", "experience": "beginner"},
+    ],
+    "deployment_checklist": [{}, {"provider": "netlify", "preview": "yes"}, {"provider": "netlfy"}],
+    "design_knowledge_sources": [{}, {"category": "typography"}, {"search": "color"}],
+    "search_catalog": [{"query": "postgres orm"}, {"query": "anim", "kind": "tool"}, {"query": "deploy edge"}],
+    "install_plan": [
+        {"tools": "next.js, prisma, tailwind, shadcn, supabase, stripe"},
+        {"tools": "nuxt, vercel, playwright, turborepo", "package_manager": "pnpm"},
+        {"tools": "gsap, three, prsma", "package_manager": "bun"},
+    ],
+    "related_tools": [{"tool": "prisma"}, {"tool": "next.js, tailwind, stripe", "limit": "3"}, {"tool": "unknown"}],
+    "batch_lookup": [
+        {
+            "requests": json.dumps(
+                [
+                    {"type": "tool", "tool": "next.js"},
+                    {"type": "tool", "tool": "stripe"},
+                    {"type": "quickstart", "framework": "astro"},
+                    {"type": "checklist", "provider": "vercel"},
+                ]
+            )
+        }
+    ],
+    "server_metrics": [{}],
+}
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Answer every HEAD request with 200 after an optional delay."""
+
+    delay = 0.0
+
+    def do_HEAD(self):
+        if self.delay:
+            time.sleep(self.delay)
+        self.send_response(200)
+        self.end_headers()
+
+    def do_GET(self):
+        body = b"<html><head><title>Stub</title></head><body><main><p>Stub documentation page.</p></main></body></html>"
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", '"stub"')
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def start_stub(delay: float) -> ThreadingHTTPServer:
+    """Start the stub status server on a free local port."""
+    StubHandler.delay = delay
+    stub = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    stub.daemon_threads = True
+    threading.Thread(target=stub.serve_forever, daemon=True).start()
+    return stub
+
+
+def scaled_catalog(factor: int, stub_url: str):
+    """Copy every built-in section factor times with unique keys; every documentation URL points at the stub."""
+    tools, frameworks, deployments, recipes, design = [], {}, {}, [], []
+    for copy in range(factor):
+        suffix = f"-{copy}" if copy else ""
+        for entry in server.RAW_TOOL_DATA:
+            tools.append(
+                dict(
+                    entry,
+                    key=entry["key"] + suffix,
+                    label=entry["label"] + suffix,
+                    aliases=[alias + suffix for alias in entry["aliases"]],
+                    homepage=f"{stub_url}/{entry['key']}{suffix}",
+                )
+            )
+        for key, starter in server.FRAMEWORK_STARTERS.items():
+            frameworks[key + suffix] = dict(
+                starter, label=starter["label"] + suffix, docs=f"{stub_url}/frameworks/{key}{suffix}"
+            )
+        for key, playbook in server.DEPLOYMENT_PLAYBOOKS.items():
+            deployments[key + suffix] = dict(
+                playbook, label=playbook["label"] + suffix, docs=f"{stub_url}/deployments/{key}{suffix}"
+            )
+        for recipe in server.STACK_RECIPES:
+            recipes.append(dict(recipe, id=recipe["id"] + suffix))
+        for entry in server.DESIGN_KNOWLEDGE_DATA:
+            items = [
+                dict(item, url=f"{stub_url}/design/{entry['key']}{suffix}/{position}")
+                for position, item in enumerate(entry["items"])
+            ]
+            design.append(dict(entry, key=entry["key"] + suffix, label=entry["label"] + suffix, items=items))
+    return server._Catalog(tools, frameworks, deployments, recipes, design, source=f"synthetic-{factor}x")
+
+
+def summarize(samples: list) -> dict:
+    """Reduce per-call seconds to microsecond statistics."""
+    ordered = sorted(samples)
+
+    def at(fraction):
+        return round(ordered[min(len(ordered) - 1, int(fraction * len(ordered)))] * 1e6, 2)
+
+    return {"mean_us": round(statistics.fmean(ordered) * 1e6, 2), "p50_us": at(0.5), "p95_us": at(0.95),
+            "p99_us": at(0.99), "calls": len(ordered)}
+
+
+async def time_calls(call, cases: list, rounds: int) -> dict:
+    """Time rounds calls cycling through the argument mix, after one warm-up pass."""
+    for arguments in cases:
+        await call(arguments)
+    samples = []
+    for index in range(rounds):
+        arguments = cases[index % len(cases)]
+        started = time.perf_counter()
+        await call(arguments)
+        samples.append(time.perf_counter() - started)
+    return summarize(samples)
+
+
+async def bench_tools(rounds: int) -> dict:
+    """Per-tool latency, direct and through mcp.call_tool, on the active catalog."""
+    results = {}
+    for name, cases in CASES.items():
+        handler = getattr(server, name)
+
+        async def direct(arguments, handler=handler):
+            return await handler(**arguments)
+
+        async def dispatch(arguments, name=name):
+            return await server.mcp.call_tool(name, arguments)
+
+        results[name] = {
+            "direct": await time_calls(direct, cases, rounds),
+            "dispatch": await time_calls(dispatch, cases, rounds),
+        }
+    return results
+
+
+async def bench_network(rounds: int, stub_url: str) -> dict:
+    """Status checks against the stub: uncached probes, cached answers, a full health sweep, and a dead host."""
+    tools = server._get_catalog().tools[: min(50, len(server._get_catalog().tools))]
+    names = [{"tool": entry.key, "include_status": "true"} for entry in tools]
+
+    async def uncached(arguments):
+        server._STATUS_CACHE.clear()
+        return await server.fetch_tool_reference(**arguments)
+
+    async def cached(arguments):
+        return await server.fetch_tool_reference(**arguments)
+
+    results = {
+        "status_uncached": await time_calls(uncached, names, rounds),
+        "status_cached": await time_calls(cached, names, rounds),
+    }
+    started = time.perf_counter()
+    await server.check_catalog_health(concurrency="32", host_rate="1000", deadline="60")
+    results["health_sweep_s"] = round(time.perf_counter() - started, 3)
+    # A refused port on another host name, probed until its circuit opens, then timed while it fails fast.
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        dead_url = f"http://localhost:{probe.getsockname()[1]}/"
+    for _ in range(server.CIRCUIT_FAILURES):
+        await server._probe_status(dead_url)
+    results["status_dead_host"] = await time_calls(lambda arguments: server._probe_status(dead_url), [{}], rounds)
+    server._HOST_CIRCUITS._breakers.clear()
+    await server._close_http_client()
+    return results
+
+
+def bench_startup() -> dict:
+    """Import phase (python -X importtime) and cold start."""
+    imports = min((measure_import()[MODULE] for _ in range(3)), key=lambda timing: timing[1])
+    cold = min((run_probe() for _ in range(3)), key=lambda probe: probe[0])
+    return {
+        "import_self_ms": round(imports[0] / 1000, 2),
+        "import_total_ms": round(imports[1] / 1000, 2),
+        "cold_start_ms": round(cold[0] * 1000, 2),
+        "cold_catalog_ms": round(cold[2] * 1000, 2),
+    }
+
+
+async def run(args) -> dict:
+    stub = start_stub(args.stub_delay)
+    stub_url = f"http://127.0.0.1:{stub.server_address[1]}"
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "rounds": args.rounds,
+        "startup": bench_startup() if not args.skip_startup else {},
+        "scales": {},
+    }
+    for factor in args.scales:
+        catalog = scaled_catalog(factor, stub_url)
+        started = time.perf_counter()
+        catalog.build_all()
+        build_seconds = time.perf_counter() - started
+        server._swap_catalog(catalog)
+        server._STATUS_CACHE.clear()
+        rounds = max(20, args.rounds // factor) if args.scale_rounds else args.rounds
+        report["scales"][f"{factor}x"] = {
+            "tools": len(catalog.tools),
+            "build_ms": round(build_seconds * 1000, 2),
+            "tools_latency": await bench_tools(rounds),
+            "network": await bench_network(min(rounds, 200), stub_url) if factor <= 10 else {},
+        }
+    stub.shutdown()
+    return report
+
+
+def flatten(report: dict, prefix: str = "") -> dict:
+    """Flatten nested results to dotted keys for comparison."""
+    flat = {}
+    for key, value in report.items():
+        path = f"{prefix}.{key}" if prefix else key
+        if isinstance(value, dict):
+            flat.update(flatten(value, path))
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            flat[path] = value
+    return flat
+
+
+def compare(current: dict, baseline: dict, threshold: float) -> list:
+    """Return timing metrics that got slower than baseline by more than threshold."""
+    now, before = flatten(current), flatten(baseline)
+    regressions = []
+    for key, value in sorted(now.items()):
+        # Tail percentiles of short runs are too noisy to gate on; compare means, medians and totals.
+        if not key.endswith(("mean_us", "p50_us", "_ms", "_s")) or key not in before or before[key] <= 0:
+            continue
+        change = value / before[key] - 1
+        if change > threshold:
+            regressions.append({"metric": key, "baseline": before[key], "current": value, "change": round(change, 3)})
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    parser.add_argument("--rounds", type=int, default=1000, help="timed calls per tool at 1x scale")
+    parser.add_argument("--scales", type=int, nargs="+", default=[1, 10, 100, 1000], help="catalog size factors")
+    parser.add_argument("--no-scale-rounds", dest="scale_rounds", action="store_false",
+                        help="use --rounds at every scale instead of dividing it by the factor")
+    parser.add_argument("--stub-delay", type=float, default=0.0, help="seconds the stub waits before answering")
+    parser.add_argument("--skip-startup", action="store_true", help="skip the import and cold start probes")
+    parser.add_argument("--output", help="also write the JSON report to this file")
+    parser.add_argument("--compare", help="earlier JSON report to check for regressions")
+    parser.add_argument("--threshold", type=float, default=0.25, help="allowed slowdown before flagging (0.25 = 25%%)")
+    args = parser.parse_args()
+
+    report = asyncio.run(run(args))
+    if args.compare:
+        with open(args.compare) as handle:
+            report["regressions"] = compare(report, json.load(handle), args.threshold)
+    text = json.dumps(report, indent=2)
+    print(text)
+    if args.output:
+        with open(args.output, "w") as handle:
+            handle.write(text + "\n")
+    return 1 if report.get("regressions") else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Fail when importing the server takes longer than a budget (python -X importtime).
+"""
+import os
+import sys
+import json
+import argparse
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MODULE = "fullstack_webdev_server"
+
+LAZY_PROBE = f"""
+import {MODULE} as server
+print(int(server._CATALOG is None), int(server._HTTP_CLIENT is None))
+"""
+
+
+def measure_import() -> dict:
+    """Import the server in a fresh interpreter and return per-module import times in microseconds."""
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {MODULE}"],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    timings = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        fields = line[len("import time:") :].split("|")
+        if not fields[0].strip().isdigit():
+            continue
+        timings[fields[2].strip()] = (int(fields[0]), int(fields[1]))
+    return timings
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    parser.add_argument("--self-budget-ms", type=float, default=100.0, help="budget for the module body itself")
+    parser.add_argument("--total-budget-ms", type=float, default=0.0, help="budget including dependencies (0 = off)")
+    parser.add_argument("--runs", type=int, default=5, help="imports to run; the fastest one is compared")
+    args = parser.parse_args()
+
+    runs = [measure_import() for _ in range(args.runs)]
+    self_us = min(run[MODULE][0] for run in runs)
+    total_us = min(run[MODULE][1] for run in runs)
+    lazy = subprocess.run(
+        [sys.executable, "-c", LAZY_PROBE],
+        env=dict(os.environ, PYTHONPATH=ROOT),
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.split()
+
+    failures = []
+    if self_us / 1000 > args.self_budget_ms:
+        failures.append(f"module body took {self_us / 1000:.1f} ms (budget {args.self_budget_ms:g} ms)")
+    if args.total_budget_ms and total_us / 1000 > args.total_budget_ms:
+        failures.append(f"import took {total_us / 1000:.1f} ms (budget {args.total_budget_ms:g} ms)")
+    if lazy[0] != "1":
+        failures.append("catalog indexes were built at import time")
+    if lazy[1] != "1":
+        failures.append("HTTP client was created at import time")
+
+    print(
+        json.dumps(
+            {
+                "self_ms": round(self_us / 1000, 2),
+                "total_ms": round(total_us / 1000, 2),
+                "self_budget_ms": args.self_budget_ms,
+                "total_budget_ms": args.total_budget_ms,
+                "failures": failures,
+            },
+            indent=2,
+        )
+    )
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
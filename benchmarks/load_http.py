@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Load-test one long-lived HTTP server with many concurrent MCP clients.
+"""
+import os
+import sys
+import json
+import time
+import signal
+import socket
+import asyncio
+import argparse
+import statistics
+import subprocess
+from concurrent.futures import ProcessPoolExecutor
+
+from mcp import ClientSession
+from mcp.client.streamable_http import streamablehttp_client
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SERVER = os.path.join(ROOT, "fullstack_webdev_server.py")
+
+CALLS = (
+    ("fetch_tool_reference", {"tool": "prisma"}),
+    ("framework_quickstart", {"framework": "next.js", "package_manager": "pnpm"}),
+    ("list_tool_categories", {"category": "ui libraries"}),
+    ("search_catalog", {"query": "postgres orm"}),
+    ("deployment_checklist", {"provider": "vercel"}),
+)
+
+
+def free_port() -> int:
+    """Ask the OS for an unused local TCP port."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def wait_for_port(port: int, timeout: float) -> None:
+    """Block until the server accepts TCP connections or the timeout expires."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.2).close()
+            return
+        except OSError:
+            time.sleep(0.05)
+    raise RuntimeError(f"server did not listen on port {port} within {timeout}s")
+
+
+async def run_client(url: str, calls: int, offset: int) -> list:
+    """Open one MCP session and return the latency of each tool call."""
+    latencies = []
+    async with streamablehttp_client(url) as (read, write, _):
+        async with ClientSession(read, write) as session:
+            await session.initialize()
+            for index in range(calls):
+                name, arguments = CALLS[(offset + index) % len(CALLS)]
+                started = time.perf_counter()
+                result = await session.call_tool(name, arguments)
+                latencies.append(time.perf_counter() - started)
+                if result.isError:
+                    raise RuntimeError(f"{name} failed: {result.content}")
+    return latencies
+
+
+async def run_load(url: str, clients: int, calls: int) -> list:
+    """Run clients concurrently on one event loop and return every call latency."""
+    results = await asyncio.gather(*(run_client(url, calls, offset) for offset in range(clients)))
+    return [latency for latencies in results for latency in latencies]
+
+
+def run_process(url: str, clients: int, calls: int) -> list:
+    """Entry point for one client process."""
+    return asyncio.run(run_load(url, clients, calls))
+
+
+def percentile(values: list, fraction: float) -> float:
+    """Return the nearest-rank percentile of values."""
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    parser.add_argument("--clients", type=int, default=50, help="concurrent MCP sessions")
+    parser.add_argument("--calls", type=int, default=20, help="tool calls per session")
+    parser.add_argument("--workers", type=int, default=1, help="server worker processes")
+    parser.add_argument(
+        "--client-processes", type=int, default=1, help="client processes, so the load generator is not the bottleneck"
+    )
+    parser.add_argument("--startup-timeout", type=float, default=15.0)
+    args = parser.parse_args()
+
+    port = free_port()
+    env = dict(os.environ, FULLSTACK_WEBDEV_STATUS_PREFETCH="0")
+    server = subprocess.Popen(
+        [sys.executable, SERVER, "--transport", "http", "--port", str(port), "--workers", str(args.workers)],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        wait_for_port(port, args.startup_timeout)
+        url = f"http://127.0.0.1:{port}/mcp"
+        shares = [args.clients // args.client_processes + (i < args.clients % args.client_processes)
+                  for i in range(args.client_processes)]
+        started = time.perf_counter()
+        with ProcessPoolExecutor(args.client_processes) as pool:
+            results = list(pool.map(run_process, [url] * len(shares), shares, [args.calls] * len(shares)))
+        elapsed = time.perf_counter() - started
+        latencies = [latency for latencies in results for latency in latencies]
+    finally:
+        server.send_signal(signal.SIGTERM)
+        try:
+            exit_code = server.wait(timeout=args.startup_timeout)
+        except subprocess.TimeoutExpired:
+            server.kill()
+            exit_code = None
+
+    print(json.dumps({
+        "workers": args.workers,
+        "clients": args.clients,
+        "client_processes": args.client_processes,
+        "calls": len(latencies),
+        "seconds": round(elapsed, 3),
+        "calls_per_second": round(len(latencies) / elapsed, 1),
+        "p50_ms": round(statistics.median(latencies) * 1000, 2),
+        "p95_ms": round(percentile(latencies, 0.95) * 1000, 2),
+        "p99_ms": round(percentile(latencies, 0.99) * 1000, 2),
+        "graceful_exit": exit_code == 0,
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
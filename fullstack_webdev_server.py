@@ -3,23 +3,261 @@
 Simple Full Stack Web Dev MCP Server - curated docs and stack guidance.
 """
 import os
+import re
+import json
+import hashlib
 import sys
+import gc
+import math
+import time
+import heapq
+import bisect
+import difflib
+import random
+import signal
+import socket
+import select
+import asyncio
+import threading
+import queue
+import atexit
 import logging
+import logging.handlers
+import importlib.util
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from contextlib import asynccontextmanager, nullcontext
+from functools import cached_property, partial, wraps
 from datetime import datetime, timezone
+from urllib.parse import urlsplit
+from html.parser import HTMLParser
+
+from mcp.server.fastmcp import Context, FastMCP
+from mcp.types import CallToolResult, TextContent
+
+LOG_FIELDS = ("tool", "duration_ms", "error", "arguments")
+
+
+class _JsonFormatter(logging.Formatter):
+    """Render each record as one JSON object per line."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "pid": record.process,
+            "message": record.getMessage(),
+        }
+        for field in LOG_FIELDS:
+            if field in record.__dict__:
+                entry[field] = record.__dict__[field]
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str, ensure_ascii=False)
+
+
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """Enqueue records unformatted so the listener thread does all of the formatting."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+_LOG_LISTENER = None
+_LOG_HANDLER = None
+
+
+def _configure_logging() -> None:
+    """Give the server logger the stderr handler chosen by the FULLSTACK_WEBDEV_LOG_* environment variables."""
+    global _LOG_LISTENER, _LOG_HANDLER
+    level = os.environ.get("FULLSTACK_WEBDEV_LOG_LEVEL", "INFO").strip().upper() or "INFO"
+    structured = os.environ.get("FULLSTACK_WEBDEV_LOG_FORMAT", "text").strip().lower() == "json"
+    queued = os.environ.get("FULLSTACK_WEBDEV_LOG_QUEUE", "1" if structured else "0").strip().lower()
+    handler = logging.StreamHandler(sys.stderr)
+    if structured:
+        handler.setFormatter(_JsonFormatter())
+    else:
+        handler.setFormatter(logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s"))
+    if queued not in {"0", "false", "no", "off"}:
+        # The event loop only enqueues records; a background thread does the formatting and the
+        # possibly blocking stderr write, so a slow reader cannot stall tool calls.
+        records = queue.SimpleQueue()
+        _LOG_LISTENER = logging.handlers.QueueListener(records, handler)
+        _LOG_LISTENER.start()
+        handler = _DeferredQueueHandler(records)
+    else:
+        _LOG_LISTENER = None
+    if not isinstance(logging.getLevelName(level), int):
+        level = "INFO"
+    # Scoped to the server logger: the root logger and its handlers belong to FastMCP or an embedding application.
+    if _LOG_HANDLER is not None:
+        logger.removeHandler(_LOG_HANDLER)
+    _LOG_HANDLER = handler
+    logger.addHandler(handler)
+    logger.setLevel(level)
+    logger.propagate = False
+
+
+def _stop_logging() -> None:
+    """Flush queued log records before the process exits."""
+    global _LOG_LISTENER
+    listener, _LOG_LISTENER = _LOG_LISTENER, None
+    if listener is not None:
+        listener.stop()
 
-import httpx
-from mcp.server.fastmcp import FastMCP
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    stream=sys.stderr,
-)
 logger = logging.getLogger("fullstack-webdev-server")
 
-mcp = FastMCP("fullstack_webdev")
+
+_RESOURCE_USERS = 0
+
+
+@asynccontextmanager
+async def _shared_resources():
+    """Load the catalog and start background tasks for the first user; release them after the last."""
+    global _RESOURCE_USERS
+    _RESOURCE_USERS += 1
+    if _RESOURCE_USERS == 1:
+        _warm_response_cache(_get_catalog())
+        if CATALOG_DIR:
+            _CATALOG_WATCHER.start()
+        if STATUS_PREFETCH:
+            _STATUS_PREFETCHER.start()
+        if METRICS_PORT:
+            try:
+                await _METRICS_EXPORTER.start()
+            except OSError as exc:
+                logger.warning("Could not serve metrics on %s:%s: %s", METRICS_HOST, _METRICS_EXPORTER.port, exc)
+    try:
+        yield
+    finally:
+        _RESOURCE_USERS -= 1
+        if _RESOURCE_USERS == 0:
+            await _METRICS_EXPORTER.stop()
+            await _CATALOG_WATCHER.stop()
+            await _STATUS_PREFETCHER.stop()
+            await _close_http_client()
+            _STATUS_STORE.close()
+
+
+@asynccontextmanager
+async def _server_lifespan(server):
+    """Hold the shared catalog, caches and background tasks for one MCP session."""
+    async with _shared_resources():
+        yield {}
+
+
+class _DispatchFastMCP(FastMCP):
+    """FastMCP whose tool calls pass a per-client rate limit and share identical in-flight executions."""
+
+    def client_id(self) -> str:
+        """Identify the client behind the current request for rate limiting."""
+        try:
+            context = self._mcp_server.request_context
+        except LookupError:
+            return "local"
+        request = context.request
+        headers = getattr(request, "headers", None)
+        if headers is not None:
+            # The mcp-session-id header is chosen by the client, so it must not key the rate limit.
+            client = CLIENT_ID_HEADER and headers.get(CLIENT_ID_HEADER)
+            if client:
+                return client
+            if request.client is not None:
+                return request.client.host
+        return f"session-{id(context.session):x}"
+
+    async def call_tool(self, name: str, arguments: dict):
+        """Reject over-limit clients before any work, then run the tool or join the client's identical running call."""
+        client = self.client_id()
+        if _CLIENT_RATE_LIMITER.enabled:
+            retry_after = _CLIENT_RATE_LIMITER.acquire(client)
+            if retry_after:
+                _TOOL_METRICS.count(_TOOL_METRICS.rejected, name)
+                return CallToolResult(
+                    content=[
+                        TextContent(
+                            type="text", text=f"❌ Error: Rate limit exceeded, retry in {retry_after:.1f}s."
+                        )
+                    ],
+                    isError=True,
+                )
+        tool = self._tool_manager.get_tool(name)
+        # Tools that take a Context report progress to their own request, so each call runs by itself.
+        if not COALESCE_CALLS or (tool is not None and tool.context_kwarg):
+            return await super().call_tool(name, arguments)
+        return await _TOOL_COALESCER.run(client, name, arguments, partial(super().call_tool, name, arguments))
+
+
+mcp = _DispatchFastMCP("fullstack_webdev", lifespan=_server_lifespan)
+
+
+def _env_float(name: str, default: float) -> float:
+    """Read a numeric setting from the environment, falling back on bad values."""
+    raw = os.environ.get(name, "").strip()
+    if not raw:
+        return default
+    try:
+        return float(raw)
+    except ValueError:
+        logger.warning("Ignoring invalid %s=%r, using %s", name, raw, default)
+        return default
+
 
 DEFAULT_PROVIDER = os.environ.get("FULLSTACK_WEBDEV_DEFAULT_PROVIDER", "vercel")
+STATUS_TIMEOUT = _env_float("FULLSTACK_WEBDEV_STATUS_TIMEOUT", 5.0)
+STATUS_DEADLINE = _env_float("FULLSTACK_WEBDEV_STATUS_DEADLINE", STATUS_TIMEOUT)
+STATUS_RETRIES = int(_env_float("FULLSTACK_WEBDEV_STATUS_RETRIES", 1))
+CIRCUIT_FAILURES = int(_env_float("FULLSTACK_WEBDEV_CIRCUIT_FAILURES", 3))
+CIRCUIT_RESET = _env_float("FULLSTACK_WEBDEV_CIRCUIT_RESET", 30.0)
+CIRCUIT_MAX_RESET = _env_float("FULLSTACK_WEBDEV_CIRCUIT_MAX_RESET", 600.0)
+STATUS_CACHE_TTL = _env_float("FULLSTACK_WEBDEV_STATUS_TTL", 300.0)
+STATUS_ERROR_TTL = _env_float("FULLSTACK_WEBDEV_STATUS_ERROR_TTL", 30.0)
+HTTP_MAX_CONNECTIONS = int(_env_float("FULLSTACK_WEBDEV_HTTP_MAX_CONNECTIONS", 20))
+STATUS_PREFETCH = os.environ.get("FULLSTACK_WEBDEV_STATUS_PREFETCH", "0").strip().lower() in {"1", "true", "yes", "on"}
+CACHE_ROOT = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"), "fullstack-webdev"
+)
+STATUS_STORE_PATH = os.environ.get("FULLSTACK_WEBDEV_STATUS_STORE", "").strip()
+if STATUS_STORE_PATH.lower() in {"0", "false", "no", "off"}:
+    STATUS_STORE_PATH = ""
+elif STATUS_STORE_PATH.lower() in {"1", "true", "yes", "on"}:
+    STATUS_STORE_PATH = os.path.join(CACHE_ROOT, "status.sqlite3")
+STATUS_STORE_MAX_ENTRIES = int(_env_float("FULLSTACK_WEBDEV_STATUS_STORE_MAX_ENTRIES", 10000))
+STATUS_PREFETCH_INTERVAL = _env_float("FULLSTACK_WEBDEV_STATUS_PREFETCH_INTERVAL", 240.0)
+HEALTH_CONCURRENCY = int(_env_float("FULLSTACK_WEBDEV_HEALTH_CONCURRENCY", 16))
+HEALTH_HOST_RATE = _env_float("FULLSTACK_WEBDEV_HEALTH_HOST_RATE", 4.0)
+HEALTH_DEADLINE = _env_float("FULLSTACK_WEBDEV_HEALTH_DEADLINE", 20.0)
+BATCH_MAX_ITEMS = int(_env_float("FULLSTACK_WEBDEV_BATCH_MAX_ITEMS", 50))
+CATEGORY_PAGE_SIZE = int(_env_float("FULLSTACK_WEBDEV_CATEGORY_PAGE_SIZE", 50))
+RECIPE_COMPOSE_RATIO = _env_float("FULLSTACK_WEBDEV_RECIPE_COMPOSE_RATIO", 0.5)
+RECIPE_MAX_COMPOSE = 3
+RELATED_MAX_FEATURES = int(_env_float("FULLSTACK_WEBDEV_RELATED_MAX_FEATURES", 2048))
+RELATED_CACHE_K = int(_env_float("FULLSTACK_WEBDEV_RELATED_CACHE_K", 10))
+RESPONSE_CACHE_SIZE = int(_env_float("FULLSTACK_WEBDEV_RESPONSE_CACHE_SIZE", 512))
+RATE_LIMIT = _env_float("FULLSTACK_WEBDEV_RATE_LIMIT", 0.0)
+RATE_BURST = _env_float("FULLSTACK_WEBDEV_RATE_BURST", 20.0)
+RATE_LIMIT_CLIENTS = int(_env_float("FULLSTACK_WEBDEV_RATE_LIMIT_CLIENTS", 4096))
+CLIENT_ID_HEADER = os.environ.get("FULLSTACK_WEBDEV_CLIENT_ID_HEADER", "").strip().lower()
+DOCS_CACHE_DIR = os.environ.get("FULLSTACK_WEBDEV_DOCS_CACHE_DIR", "").strip() or os.path.join(CACHE_ROOT, "docs")
+DOCS_CACHE_BYTES = int(_env_float("FULLSTACK_WEBDEV_DOCS_CACHE_BYTES", 50 * 1024 * 1024))
+DOCS_TTL = _env_float("FULLSTACK_WEBDEV_DOCS_TTL", 86400.0)
+DOCS_TIMEOUT = _env_float("FULLSTACK_WEBDEV_DOCS_TIMEOUT", 15.0)
+DOCS_MAX_BYTES = int(_env_float("FULLSTACK_WEBDEV_DOCS_MAX_BYTES", 2 * 1024 * 1024))
+DOCS_EXCERPT_CHARS = int(_env_float("FULLSTACK_WEBDEV_DOCS_EXCERPT_CHARS", 2000))
+COALESCE_CALLS = os.environ.get("FULLSTACK_WEBDEV_COALESCE", "1").strip().lower() not in {"0", "false", "no", "off"}
+TRANSPORT = os.environ.get("FULLSTACK_WEBDEV_TRANSPORT", "stdio").strip().lower() or "stdio"
+HTTP_HOST = os.environ.get("FULLSTACK_WEBDEV_HOST", "127.0.0.1").strip() or "127.0.0.1"
+HTTP_PORT = int(_env_float("FULLSTACK_WEBDEV_PORT", 8000))
+HTTP_SHUTDOWN_TIMEOUT = _env_float("FULLSTACK_WEBDEV_SHUTDOWN_TIMEOUT", 10.0)
+METRICS_HOST = os.environ.get("FULLSTACK_WEBDEV_METRICS_HOST", "127.0.0.1").strip() or "127.0.0.1"
+METRICS_PORT = int(_env_float("FULLSTACK_WEBDEV_METRICS_PORT", 0))
+HTTP_WORKERS = max(1, int(_env_float("FULLSTACK_WEBDEV_WORKERS", 1)))
+WORKER_HEARTBEAT_INTERVAL = _env_float("FULLSTACK_WEBDEV_WORKER_HEARTBEAT", 2.0)
+WORKER_TIMEOUT = _env_float("FULLSTACK_WEBDEV_WORKER_TIMEOUT", 30.0)
+CATALOG_DIR = os.environ.get("FULLSTACK_WEBDEV_CATALOG_DIR", "").strip()
+CATALOG_POLL_INTERVAL = _env_float("FULLSTACK_WEBDEV_CATALOG_POLL_INTERVAL", 5.0)
 
 
 def _normalize_key(value: str) -> str:
@@ -78,7 +316,7 @@ RAW_TOOL_DATA = [
     },
     {
         "key": "Next.js",
-        "aliases": ["next"],
+        "aliases": ["next", "nextjs"],
         "label": "Next.js",
         "category": "App Frameworks",
         "homepage": "https://nextjs.org/docs/app/getting-started",
@@ -96,7 +334,7 @@ RAW_TOOL_DATA = [
     },
     {
         "key": "Vue.js",
-        "aliases": ["vue"],
+        "aliases": ["vue", "vuejs"],
         "label": "Vue.js",
         "category": "App Frameworks",
         "homepage": "https://vuejs.org/guide/quick-start",
@@ -114,7 +352,7 @@ RAW_TOOL_DATA = [
     },
     {
         "key": "Nuxt",
-        "aliases": ["nuxt", "nuxt.js"],
+        "aliases": ["nuxt", "nuxt.js", "nuxtjs"],
         "label": "Nuxt",
         "category": "App Frameworks",
         "homepage": "https://nuxt.com/docs/4.x/getting-started/introduction",
@@ -267,20 +505,10 @@ RAW_TOOL_DATA = [
     },
 ]
 
-TOOL_LOOKUP = {}
-CATEGORY_LOOKUP = {}
-
-for entry in RAW_TOOL_DATA:
-    normalized = _normalize_key(entry["key"])
-    TOOL_LOOKUP[normalized] = entry
-    for alias in entry["aliases"]:
-        TOOL_LOOKUP[_normalize_key(alias)] = entry
-    category = entry["category"]
-    CATEGORY_LOOKUP.setdefault(category, []).append(entry["label"])
-
 FRAMEWORK_STARTERS = {
     "next.js": {
         "label": "Next.js",
+        "aliases": ["next", "nextjs"],
         "docs": "https://nextjs.org/docs/app/getting-started",
         "commands": {
             "npm": "npx create-next-app@latest my-app",
@@ -311,6 +539,7 @@ FRAMEWORK_STARTERS = {
     },
     "vue.js": {
         "label": "Vue.js",
+        "aliases": ["vue", "vuejs"],
         "docs": "https://vuejs.org/guide/quick-start",
         "commands": {
             "npm": "npm create vue@latest my-app",
@@ -340,6 +569,7 @@ FRAMEWORK_STARTERS = {
     },
     "nuxt": {
         "label": "Nuxt",
+        "aliases": ["nuxt.js", "nuxtjs"],
         "docs": "https://nuxt.com/docs/4.x/getting-started/introduction",
         "commands": {
             "npm": "npx nuxi@latest init my-app",
@@ -355,8 +585,9 @@ FRAMEWORK_STARTERS = {
     },
 }
 
-FRAMEWORK_STARTERS["vue"] = FRAMEWORK_STARTERS["vue.js"]
-FRAMEWORK_STARTERS["nuxt.js"] = FRAMEWORK_STARTERS["nuxt"]
+for _starter in list(FRAMEWORK_STARTERS.values()):
+    for _alias in _starter.get("aliases", ()):
+        FRAMEWORK_STARTERS[_alias] = _starter
 
 DEPLOYMENT_PLAYBOOKS = {
     "vercel": {
@@ -443,6 +674,15 @@ STACK_RECIPES = [
         "infrastructure": "Deploy to Vercel or Netlify, connect Stripe for checkout",
         "extras": ["Use Auth.js for customer sessions", "Add LogRocket for session replay"],
     },
+    {
+        "id": "realtime-collaboration",
+        "match": ["realtime", "chat", "multiplayer", "collaborative", "collaboration", "live", "presence"],
+        "summary": "Low-latency app with live updates, presence, and shared state.",
+        "frontend": "Next.js with TanStack Query and optimistic updates",
+        "backend": "Supabase Realtime or a Socket.IO server backed by Postgres",
+        "infrastructure": "Host websocket servers on Fly.io or Railway; keep the web app on Vercel",
+        "extras": ["Use Liveblocks or Yjs for collaborative editing", "Add Upstash Redis for pub/sub across instances"],
+    },
 ]
 
 DESIGN_KNOWLEDGE_DATA = [
@@ -584,229 +824,3597 @@ DESIGN_KNOWLEDGE_DATA = [
     },
 ]
 
-DESIGN_KNOWLEDGE_INDEX = {}
-for entry in DESIGN_KNOWLEDGE_DATA:
-    normalized_key = _normalize_key(entry["key"])
-    DESIGN_KNOWLEDGE_INDEX[normalized_key] = entry
-    for alias in entry.get("aliases", []):
-        DESIGN_KNOWLEDGE_INDEX[_normalize_key(alias)] = entry
+def _interned(values) -> tuple:
+    """Return a tuple of interned strings so repeated identifiers share one object."""
+    return tuple(sys.intern(value) for value in values)
 
 
-def _format_timestamp() -> str:
-    """Return current UTC timestamp in ISO format."""
-    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+@dataclass(frozen=True, slots=True)
+class ToolEntry:
+    """One catalog tool with its docs link, summary and install commands."""
 
+    key: str
+    aliases: tuple
+    label: str
+    category: str
+    homepage: str
+    summary: str
+    cli: tuple
 
-@mcp.tool()
-async def list_tool_categories(category: str = "") -> str:
-    """List available tool categories and members."""
-    logger.info("Listing tool categories for category=%s", category)
-    if category.strip():
-        normalized = _normalize_key(category)
-        matched = None
-        for key in CATEGORY_LOOKUP:
-            if _normalize_key(key) == normalized:
-                matched = key
+    @classmethod
+    def from_dict(cls, data: dict) -> "ToolEntry":
+        """Build an entry from a catalog mapping, interning its identifiers."""
+        return cls(
+            key=sys.intern(data["key"]),
+            aliases=_interned(data.get("aliases", ())),
+            label=sys.intern(data["label"]),
+            category=sys.intern(data["category"]),
+            homepage=data["homepage"],
+            summary=data["summary"],
+            cli=tuple(data["cli"]),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class FrameworkStarter:
+    """Scaffolding commands per package manager for one framework."""
+
+    key: str
+    label: str
+    docs: str
+    commands: dict
+    post: tuple
+    aliases: tuple = ()
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "FrameworkStarter":
+        """Build a starter from a catalog mapping, interning its identifiers."""
+        return cls(
+            key=sys.intern(data["key"]),
+            label=sys.intern(data["label"]),
+            docs=data["docs"],
+            commands={sys.intern(manager): command for manager, command in data["commands"].items()},
+            post=tuple(data["post"]),
+            aliases=_interned(data.get("aliases", ())),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class Playbook:
+    """Deployment steps and notes for one hosting provider."""
+
+    key: str
+    label: str
+    docs: str
+    steps: tuple
+    notes: tuple
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Playbook":
+        """Build a playbook from a catalog mapping, interning its identifiers."""
+        return cls(
+            key=sys.intern(data["key"]),
+            label=sys.intern(data["label"]),
+            docs=data["docs"],
+            steps=tuple(data["steps"]),
+            notes=tuple(data["notes"]),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class Recipe:
+    """A stack recommendation matched against project descriptions."""
+
+    id: str
+    match: tuple
+    summary: str
+    frontend: str
+    backend: str
+    infrastructure: str
+    extras: tuple = ()
+    label: str = ""
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Recipe":
+        """Build a recipe from a catalog mapping, interning its identifiers."""
+        return cls(
+            id=sys.intern(data["id"]),
+            match=_interned(data["match"]),
+            summary=data["summary"],
+            frontend=data["frontend"],
+            backend=data["backend"],
+            infrastructure=data["infrastructure"],
+            extras=tuple(data.get("extras", ())),
+            label=sys.intern(data.get("label", "")),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class DesignSource:
+    """A single design reference link."""
+
+    label: str
+    url: str
+
+
+@dataclass(frozen=True, slots=True)
+class DesignCategory:
+    """A group of design references."""
+
+    key: str
+    label: str
+    aliases: tuple
+    summary: str
+    items: tuple
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "DesignCategory":
+        """Build a design category from a catalog mapping, interning its identifiers."""
+        return cls(
+            key=sys.intern(data["key"]),
+            label=sys.intern(data["label"]),
+            aliases=_interned(data.get("aliases", ())),
+            summary=data["summary"],
+            items=tuple(DesignSource(sys.intern(item["label"]), item["url"]) for item in data["items"]),
+        )
+
+
+def _as_record(record_type, value, **fields):
+    """Return value as a record_type, converting catalog mappings and leaving records untouched."""
+    if isinstance(value, record_type):
+        return value
+    return record_type.from_dict({**value, **fields})
+
+
+def _as_records(record_type, mapping: dict) -> dict:
+    """Convert a keyed catalog section to records, keeping aliases that share one mapping as one record."""
+    converted = {}
+    records = {}
+    for key, value in mapping.items():
+        if isinstance(value, record_type):
+            records[key] = value
+            continue
+        if id(value) not in converted:
+            converted[id(value)] = _as_record(record_type, value, key=key)
+        records[key] = converted[id(value)]
+    return records
+
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+_STOPWORDS = frozenset(
+    "a an and are as at be by for from in into is it of on or the to via with your".split()
+)
+
+
+def _tokenize(text: str) -> list:
+    """Split text into lowercase search terms, adding joined forms like 'nextjs' for 'Next.js'."""
+    tokens = []
+    for chunk in text.lower().split():
+        parts = _TOKEN_PATTERN.findall(chunk)
+        tokens.extend(part for part in parts if part not in _STOPWORDS)
+        if len(parts) > 1:
+            tokens.append("".join(parts))
+    return tokens
+
+
+class _SearchIndex:
+    """Inverted index over catalog documents with prefix expansion and BM25 ranking."""
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75, max_expansions: int = 32):
+        self.k1 = k1
+        self.b = b
+        self.max_expansions = max_expansions
+        self.documents = []
+        self.postings = {}
+        self.doc_lengths = []
+        self.terms = []
+        self.avg_length = 0.0
+
+    def add(self, kind: str, title: str, url: str, summary: str, fields: list) -> None:
+        """Index one document; the first field is treated as the title and boosted."""
+        doc_id = len(self.documents)
+        self.documents.append({"kind": kind, "title": title, "url": url, "summary": summary})
+        counts = {}
+        for position, field in enumerate(fields):
+            weight = 3 if position == 0 else 1
+            for token in _tokenize(field):
+                counts[token] = counts.get(token, 0) + weight
+        for token, count in counts.items():
+            self.postings.setdefault(token, []).append((doc_id, count))
+        self.doc_lengths.append(sum(counts.values()))
+
+    def finalize(self) -> None:
+        """Compute corpus statistics and the sorted term list used for prefix matching."""
+        self.terms = sorted(self.postings)
+        self.avg_length = sum(self.doc_lengths) / len(self.doc_lengths) if self.doc_lengths else 0.0
+
+    def _expand(self, token: str) -> list:
+        """Return (term, weight) pairs for an exact match plus indexed terms starting with token."""
+        matches = [(token, 1.0)] if token in self.postings else []
+        start = bisect.bisect_left(self.terms, token)
+        for term in self.terms[start : start + self.max_expansions + 1]:
+            if not term.startswith(token):
                 break
-        if not matched:
-            return f"❌ Error: Unknown category '{category}'."
-        tools = sorted(CATEGORY_LOOKUP.get(matched, []))
-        items = "\n".join(f"- {tool}" for tool in tools)
-        return f"""📊 Category: {matched}
+            if term != token:
+                matches.append((term, 0.5))
+        return matches
 
-Tools:
-{items}
+    def search(self, query: str, limit: int = 10, kinds=None) -> list:
+        """Return up to limit (score, document) pairs ranked by BM25 relevance."""
+        total = len(self.documents)
+        scores = {}
+        for token in dict.fromkeys(_tokenize(query)):
+            for term, weight in self._expand(token):
+                postings = self.postings[term]
+                idf = math.log(1 + (total - len(postings) + 0.5) / (len(postings) + 0.5))
+                for doc_id, tf in postings:
+                    norm = self.k1 * (1 - self.b + self.b * self.doc_lengths[doc_id] / self.avg_length)
+                    gain = weight * idf * tf * (self.k1 + 1) / (tf + norm)
+                    scores[doc_id] = scores.get(doc_id, 0.0) + gain
+        if kinds:
+            documents = self.documents
+            scores = {doc_id: score for doc_id, score in scores.items() if documents[doc_id]["kind"] in kinds}
+        best = heapq.nlargest(limit, scores.items(), key=lambda item: (item[1], -item[0]))
+        return [(score, self.documents[doc_id]) for doc_id, score in best]
 
-Timestamp: {_format_timestamp()}"""
 
-    overview_lines = []
-    for cat, tools in sorted(CATEGORY_LOOKUP.items()):
-        overview_lines.append(f"- {cat} ({len(tools)} tools)")
-    content = "\n".join(overview_lines)
-    return f"""📁 Available Categories:
-{content}
+def _trigrams(text: str) -> set:
+    """Return padded character trigrams of text with punctuation removed."""
+    compact = "".join(_TOKEN_PATTERN.findall(text.lower()))
+    padded = f"  {compact} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
 
-Tip: Pass category=\"{next(iter(CATEGORY_LOOKUP))}\" to expand a category."""
 
+SHORT_QUERY_CHARS = 4
 
-@mcp.tool()
-async def fetch_tool_reference(tool: str = "", include_status: str = "") -> str:
-    """Retrieve documentation details for a tooling name."""
-    logger.info("Fetching tool reference for tool=%s include_status=%s", tool, include_status)
-    if not tool.strip():
-        return "❌ Error: Tool name is required."
-    normalized = _normalize_key(tool)
-    entry = TOOL_LOOKUP.get(normalized)
-    if not entry:
-        return f"❌ Error: Tool '{tool}' is not in the curated catalog."
 
-    status_line = ""
-    if include_status.strip().lower() in {"1", "true", "yes"}:
-        try:
-            async with httpx.AsyncClient(timeout=5) as client:
-                response = await client.head(entry["homepage"])
-                status_line = f"🌐 Status: {response.status_code} {response.reason_phrase}"
-        except httpx.HTTPStatusError as exc:
-            status_line = f"❌ HTTP Error: {exc.response.status_code}"
-        except Exception as exc:
-            status_line = f"⚠️ Status Check Failed: {str(exc)}"
+class _FuzzyIndex:
+    """Trigram index over lookup keys for typo-tolerant name resolution."""
 
-    cli_lines = "\n".join(f"- {cmd}" for cmd in entry["cli"])
-    result = f"""✅ {entry['label']} ({entry['category']})
-Summary: {entry['summary']}
-Docs: {entry['homepage']}
-CLI Setup:
-{cli_lines}"""
-    if status_line:
-        result = f"{result}\n{status_line}"
-    return result
+    def __init__(self, labels: dict, threshold: float = 0.75, margin: float = 0.1):
+        self.labels = labels
+        self.threshold = threshold
+        self.margin = margin
+        self.sizes = {}
+        self.grams = {}
+        for key in labels:
+            grams = _trigrams(key)
+            self.sizes[key] = len(grams)
+            for gram in grams:
+                self.grams.setdefault(gram, []).append(key)
 
+    def candidates(self, query: str, limit: int = 3) -> list:
+        """Return up to limit (score, key) pairs, one per distinct label, best first."""
+        query_grams = _trigrams(query)
+        if not query_grams:
+            return []
+        overlap = {}
+        for gram in query_grams:
+            for key in self.grams.get(gram, ()):
+                overlap[key] = overlap.get(key, 0) + 1
+        shortlist = heapq.nlargest(
+            limit * 4, overlap.items(), key=lambda item: 2 * item[1] / (len(query_grams) + self.sizes[item[0]])
+        )
+        compact_query = "".join(_TOKEN_PATTERN.findall(query.lower()))
+        scored = []
+        for key, shared in shortlist:
+            dice = 2 * shared / (len(query_grams) + self.sizes[key])
+            compact_key = "".join(_TOKEN_PATTERN.findall(key))
+            score = max(dice, difflib.SequenceMatcher(None, compact_query, compact_key).ratio())
+            if compact_key.startswith(compact_query) and len(compact_query) * 2 >= len(compact_key):
+                score = max(score, 0.8 + 0.2 * len(compact_query) / len(compact_key))
+            scored.append((score, key))
+        scored.sort(key=lambda item: (-item[0], item[1]))
+        best = {}
+        for score, key in scored:
+            best.setdefault(self.labels[key], (score, key))
+        return list(best.values())[:limit]
 
-@mcp.tool()
-async def framework_quickstart(framework: str = "", package_manager: str = "") -> str:
-    """Provide quickstart commands for a framework."""
-    logger.info("Providing quickstart for framework=%s package_manager=%s", framework, package_manager)
-    if not framework.strip():
-        return "❌ Error: Framework name is required."
-    normalized = _normalize_key(framework)
-    starter = FRAMEWORK_STARTERS.get(normalized)
-    if not starter:
-        return f"❌ Error: Framework '{framework}' is not supported."
-    pm = package_manager.strip().lower() if package_manager.strip() else "npm"
-    command = starter["commands"].get(pm)
-    if not command:
-        available = ", ".join(starter["commands"].keys())
-        return f"❌ Error: Package manager '{package_manager}' not supported. Try one of: {available}."
-    post_lines = "\n".join(f"- {step}" for step in starter["post"])
-    return f"""⚡ {starter['label']} Quickstart
-Command: {command}
-Next Steps:
-{post_lines}
-Docs: {starter['docs']}"""
+    def resolve(self, query: str) -> tuple:
+        """Return (key, suggestions): key is set when one candidate is a confident match."""
+        ranked = self.candidates(query)
+        if not ranked:
+            return "", []
+        top_score, top_key = ranked[0]
+        runner_up = ranked[1][0] if len(ranked) > 1 else 0.0
+        threshold, margin = self.threshold, self.margin
+        if len("".join(_TOKEN_PATTERN.findall(query.lower()))) <= SHORT_QUERY_CHARS:
+            # One edit in a short name moves it as close to a different name as to the intended one.
+            threshold, margin = max(threshold, 0.85), max(margin, 0.25)
+        if top_score >= threshold and top_score - runner_up >= margin:
+            return top_key, []
+        return "", [self.labels[key] for score, key in ranked if score >= 0.3]
 
 
-@mcp.tool()
-async def recommend_stack(project: str = "", experience: str = "", realtime: str = "") -> str:
-    """Suggest a full-stack combination for a project."""
-    logger.info("Recommending stack for project=%s experience=%s realtime=%s", project, experience, realtime)
-    if not project.strip():
-        return "❌ Error: Provide a brief project description."
-    project_tokens = {_normalize_key(token) for token in project.split()}
-    realtime_enabled = realtime.strip().lower() in {"yes", "true", "1", "enabled"}
-    experience_level = experience.strip().lower() if experience.strip() else "intermediate"
+def _did_you_mean(suggestions: list) -> str:
+    """Render fuzzy suggestions as a trailing hint for error messages."""
+    if not suggestions:
+        return ""
+    return f" Did you mean: {', '.join(suggestions)}?"
+
+
+def _stem(term: str) -> str:
+    """Strip common English suffixes so "dashboards" and "shopping" match "dashboard" and "shop"."""
+    if len(term) <= 4 or not term.isalpha():
+        return term
+    if term.endswith("ies"):
+        return term[:-3] + "y"
+    if term.endswith("ing") and len(term) > 6:
+        stem = term[:-3]
+        if len(stem) > 3 and stem[-1] == stem[-2] and stem[-1] not in "lsz":
+            stem = stem[:-1]
+        return stem
+    if term.endswith("s") and not term.endswith(("ss", "us", "is")):
+        return term[:-1]
+    return term
+
+
+class _RecipeIndex:
+    """Inverted index from stemmed match terms to stack recipes, ranked by IDF-weighted overlap."""
+
+    def __init__(self, recipes: tuple):
+        self.recipes = recipes
+        postings = {}
+        for position, recipe in enumerate(recipes):
+            terms = {_stem(token) for phrase in [*recipe.match, recipe.id] for token in _tokenize(phrase)}
+            for term in terms:
+                postings.setdefault(term, []).append(position)
+        # Terms shared by many recipes say little about which one fits, so they weigh less.
+        self.weights = {term: math.log(1 + len(recipes) / len(members)) for term, members in postings.items()}
+        self.postings = {term: tuple(members) for term, members in postings.items()}
+        norms = [0.0] * len(recipes)
+        for term, members in postings.items():
+            for position in members:
+                norms[position] += self.weights[term] ** 2
+        self.norms = [math.sqrt(norm) or 1.0 for norm in norms]
 
-    chosen = None
-    for recipe in STACK_RECIPES:
-        if any(term in project_tokens for term in recipe["match"]):
-            chosen = recipe
+    def rank(self, text: str, limit: int) -> list:
+        """Return up to limit (score, recipe, matched terms) tuples, best first, touching only matching recipes."""
+        scores = {}
+        matched = {}
+        for term in dict.fromkeys(_stem(token) for token in _tokenize(text)):
+            weight = self.weights.get(term)
+            if weight is None:
+                continue
+            for position in self.postings[term]:
+                scores[position] = scores.get(position, 0.0) + weight
+                matched.setdefault(position, []).append(term)
+        best = heapq.nlargest(limit, scores, key=lambda position: (scores[position] / self.norms[position], -position))
+        return [(scores[p] / self.norms[p], self.recipes[p], tuple(matched[p])) for p in best]
+
+
+def _compose_recipes(ranked: list) -> list:
+    """Pick the top recipe plus close runners-up that cover project terms the earlier picks missed."""
+    if not ranked:
+        return []
+    chosen = [ranked[0]]
+    covered = set(ranked[0][2])
+    for entry in ranked[1:]:
+        if len(chosen) >= RECIPE_MAX_COMPOSE:
             break
-    if not chosen:
-        chosen = {
-            "summary": "General purpose full-stack setup suitable for most product MVPs.",
-            "frontend": "Next.js + Tailwind CSS + Radix Primitives",
-            "backend": "Prisma with a hosted Postgres (Neon) via Supabase connection pooling",
-            "infrastructure": "Deploy frontend and server actions on Vercel; use Turborepo if monorepo grows.",
-            "extras": [
-                "Add Auth.js for authentication flows",
-                "Add Stripe or Resend depending on payments or email needs",
+        score, _, terms = entry
+        if score >= ranked[0][0] * RECIPE_COMPOSE_RATIO and not covered.issuperset(terms):
+            chosen.append(entry)
+            covered.update(terms)
+    return chosen
+
+
+def _name_forms(text: str, longest: int = 3) -> set:
+    """Return compact forms of every run of up to longest words, so "Tailwind CSS" yields "tailwindcss"."""
+    words = _TOKEN_PATTERN.findall(text.lower())
+    return {"".join(words[i : i + size]) for size in range(1, longest + 1) for i in range(len(words) - size + 1)}
+
+
+def _tool_features(catalog) -> tuple:
+    """Return per-tool {feature: weight} dicts from names, summary, category and recipes, plus term spellings."""
+    features = []
+    names = {}
+    spellings = {}
+    for row, entry in enumerate(catalog.tools):
+        counts = {f"category:{entry.category}": 2.0}
+        for text in (entry.label, entry.category, entry.summary):
+            for token in _tokenize(text):
+                term = _stem(token)
+                counts[term] = counts.get(term, 0.0) + 1.0
+                spellings.setdefault(term, token)
+        features.append(counts)
+        for name in (entry.key, entry.label, *entry.aliases):
+            form = "".join(_TOKEN_PATTERN.findall(name.lower()))
+            if len(form) > 2:
+                names.setdefault(form, set()).add(row)
+    # Tools named in the same stack recipe are used together, so each recipe is a shared feature.
+    for recipe in catalog.recipes:
+        text = " ".join([recipe.frontend, recipe.backend, recipe.infrastructure, *recipe.extras])
+        for form in _name_forms(text):
+            for row in names.get(form, ()):
+                features[row][f"recipe:{recipe.id}"] = 2.0
+    return features, spellings
+
+
+class _RelatedIndex:
+    """Sparse L2-normalized TF-IDF rows over catalog tools, queried for nearest neighbors by cosine similarity."""
+
+    def __init__(self, catalog, max_features: int = 2048, cache_k: int = 10):
+        import numpy
+
+        self.numpy = numpy
+        self.tools = catalog.tools
+        self.rows = {_normalize_key(entry.key): row for row, entry in enumerate(self.tools)}
+        self.cache_k = cache_k
+        self.neighbors = {}
+        self.features, self.spellings = _tool_features(catalog)
+        total = len(self.features)
+        frequency = {}
+        for counts in self.features:
+            for term in counts:
+                frequency[term] = frequency.get(term, 0) + 1
+        self.idf = {term: math.log((1 + total) / (1 + count)) + 1 for term, count in frequency.items()}
+        # A term held by one tool cannot make two tools similar, so it only counts toward that tool's norm.
+        shared = sorted((term for term, count in frequency.items() if count > 1), key=lambda t: (-frequency[t], t))
+        self.columns = {term: column for column, term in enumerate(shared[:max_features])}
+        # Each tool holds a few dozen of the shared terms, so rows are stored sparsely (CSR) together with
+        # their transpose (CSC): a dense tools x columns matrix would be mostly zeros.
+        cells = []
+        for row, counts in enumerate(self.features):
+            weights = {term: (1 + math.log(count)) * self.idf[term] for term, count in counts.items()}
+            norm = math.sqrt(sum(weight * weight for weight in weights.values())) or 1.0
+            for term, weight in weights.items():
+                column = self.columns.get(term)
+                if column is not None:
+                    cells.append((row, column, weight / norm))
+        rows = numpy.array([cell[0] for cell in cells], dtype=numpy.int32)
+        columns = numpy.array([cell[1] for cell in cells], dtype=numpy.int32)
+        values = numpy.array([cell[2] for cell in cells], dtype=numpy.float32)
+        self.row_start = numpy.concatenate(([0], numpy.cumsum(numpy.bincount(rows, minlength=total))))
+        self.row_columns, self.row_values = columns, values
+        order = numpy.argsort(columns, kind="stable")
+        self.column_start = numpy.concatenate(([0], numpy.cumsum(numpy.bincount(columns, minlength=len(self.columns)))))
+        self.column_rows, self.column_values = rows[order], values[order]
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the sparse arrays."""
+        arrays = (self.row_start, self.row_columns, self.row_values, self.column_start, self.column_rows)
+        return sum(array.nbytes for array in arrays) + self.column_values.nbytes
+
+    def _scores(self, row: int):
+        """Return the cosine similarity of row to every tool, summed over the columns the row holds."""
+        numpy = self.numpy
+        start, end = self.row_start[row], self.row_start[row + 1]
+        columns, weights = self.row_columns[start:end], self.row_values[start:end]
+        starts = self.column_start[columns]
+        lengths = self.column_start[columns + 1] - starts
+        offsets = numpy.arange(lengths.sum()) - numpy.repeat(numpy.cumsum(lengths) - lengths, lengths)
+        cells = numpy.repeat(starts, lengths) + offsets
+        contributions = numpy.repeat(weights, lengths) * self.column_values[cells]
+        return numpy.bincount(self.column_rows[cells], weights=contributions, minlength=len(self.tools))
+
+    def related(self, rows: list, limit: int) -> dict:
+        """Return {row: [(score, row), ...]} for each row, best first, caching the top neighbors of each row."""
+        numpy = self.numpy
+        count = min(max(limit, self.cache_k), len(self.tools) - 1)
+        pending = [row for row in dict.fromkeys(rows) if self.neighbors.get(row, (0,))[0] < count]
+        for row in pending if count > 0 else ():
+            scores = self._scores(row)
+            scores[row] = -1.0
+            top = numpy.argpartition(-scores, count - 1)[:count]
+            best = sorted(zip(scores[top].tolist(), top.tolist()), key=lambda pair: (-pair[0], pair[1]))
+            self.neighbors[row] = (count, [(score, other) for score, other in best if score > 0])
+        return {row: self.neighbors[row][1][:limit] if row in self.neighbors else [] for row in rows}
+
+    def shared_terms(self, row: int, other: int, limit: int = 4) -> list:
+        """Return the highest-weighted features two tools have in common, for explaining a match."""
+        common = self.features[row].keys() & self.features[other].keys()
+        ranked = sorted(common, key=lambda term: (-self.idf[term], term))[:limit]
+        return [self.spellings.get(term, term) for term in ranked]
+
+
+def _recipe_label(recipe: Recipe) -> str:
+    """Return a display name for a recipe."""
+    return recipe.label or recipe.id.replace("-", " ").title()
+
+
+def _build_search_index(catalog) -> _SearchIndex:
+    """Index tools, frameworks, deployments, stack recipes and design sources for search_catalog."""
+    index = _SearchIndex()
+    for entry in catalog.tools:
+        index.add(
+            "Tool",
+            entry.label,
+            entry.homepage,
+            entry.summary,
+            [entry.label, entry.key, " ".join(entry.aliases), entry.category, entry.summary, *entry.cli],
+        )
+    seen = set()
+    for key, starter in catalog.frameworks.items():
+        if id(starter) in seen:
+            continue
+        seen.add(id(starter))
+        index.add(
+            "Framework",
+            starter.label,
+            starter.docs,
+            f"Quickstart commands for {', '.join(starter.commands)}.",
+            [starter.label, key, *starter.commands.values(), *starter.post],
+        )
+    for key, playbook in catalog.deployments.items():
+        index.add(
+            "Deployment",
+            playbook.label,
+            playbook.docs,
+            playbook.notes[0] if playbook.notes else "",
+            [playbook.label, key, *playbook.steps, *playbook.notes],
+        )
+    for recipe in catalog.recipes:
+        index.add(
+            "Recipe",
+            recipe.id,
+            "",
+            recipe.summary,
+            [
+                recipe.id.replace("-", " "),
+                " ".join(recipe.match),
+                recipe.summary,
+                recipe.frontend,
+                recipe.backend,
+                recipe.infrastructure,
+                *recipe.extras,
             ],
+        )
+    for entry in catalog.design:
+        index.add(
+            "Design Category",
+            entry.label,
+            "",
+            entry.summary,
+            [entry.label, " ".join(entry.aliases), entry.summary],
+        )
+        for item in entry.items:
+            index.add("Design Source", item.label, item.url, entry.label, [item.label])
+    index.finalize()
+    return index
+
+
+CATEGORY_ALIASES = {
+    "runtimes": "Core Runtimes & Package Managers",
+    "runtime": "Core Runtimes & Package Managers",
+    "frameworks": "App Frameworks",
+    "framework": "App Frameworks",
+    "ui": "UI Libraries & Styling",
+    "css": "UI Libraries & Styling",
+    "3d": "WebGL / 3D / Shader Libraries",
+    "shaders": "WebGL / 3D / Shader Libraries",
+    "database": "Databases, ORM & Storage",
+    "db": "Databases, ORM & Storage",
+    "auth": "Authentication",
+    "payments": "Payments, Email & Analytics",
+    "email": "Payments, Email & Analytics",
+    "analytics": "Payments, Email & Analytics",
+    "hosting": "Deployment & Edge",
+    "deploy": "Deployment & Edge",
+    "build tools": "Build Tools & Monorepos",
+    "monorepo": "Build Tools & Monorepos",
+    "testing": "Testing, Linting & Quality",
+    "cms": "Headless CMS & Content",
+}
+
+
+def _category_aliases(category: str) -> set:
+    """Derive aliases from a category name's parts, e.g. 'Realtime & Messaging' -> realtime, messaging."""
+    aliases = set()
+    for part in re.split(r"\s*(?:&|,|/|\band\b)\s*", category.lower()):
+        part = part.strip()
+        if not part:
+            continue
+        aliases.add(part)
+        last_word = part.split()[-1]
+        if last_word.endswith("ies"):
+            aliases.add(part[:-3] + "y")
+        elif last_word.endswith("s") and not last_word.endswith("ss") and len(last_word) > 4:
+            aliases.add(part[:-1])
+    return aliases
+
+
+SEARCH_KINDS = ("Tool", "Framework", "Deployment", "Recipe", "Design Category", "Design Source")
+
+
+# json.dumps builds a new encoder whenever it is given options, so share one configured encoder.
+_JSON_ENCODER = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False)
+
+
+def _to_json(value) -> str:
+    """Serialize a value as compact JSON for output_format="json" responses."""
+    return _JSON_ENCODER.encode(value)
+
+
+class _Catalog:
+    """Catalog data plus every index derived from it, swapped in as one unit on reload."""
+
+    INDEXES = (
+        "tool_lookup",
+        "category_lookup",
+        "category_index",
+        "design_index",
+        "tool_fuzzy",
+        "framework_fuzzy",
+        "provider_fuzzy",
+        "search_index",
+        "recipe_index",
+        "related_index",
+        "json_entries",
+    )
+
+    def __init__(
+        self, tools, frameworks, deployments, recipes, design, source="built-in", version=1, signature=()
+    ):
+        self.tools = tuple(_as_record(ToolEntry, entry) for entry in tools)
+        self.frameworks = _as_records(FrameworkStarter, frameworks)
+        self.deployments = _as_records(Playbook, deployments)
+        self.recipes = tuple(_as_record(Recipe, recipe) for recipe in recipes)
+        self.design = tuple(_as_record(DesignCategory, entry) for entry in design)
+        self.source = source
+        self.version = version
+        self.signature = signature
+
+    @cached_property
+    def tool_lookup(self) -> dict:
+        """Map normalized tool keys and aliases to their entries."""
+        lookup = {}
+        for entry in self.tools:
+            lookup[_normalize_key(entry.key)] = entry
+            for alias in entry.aliases:
+                lookup[_normalize_key(alias)] = entry
+        return lookup
+
+    @cached_property
+    def category_lookup(self) -> dict:
+        """Map category names, in catalog order, to the sorted labels of their member tools."""
+        lookup = {}
+        for entry in self.tools:
+            lookup.setdefault(entry.category, []).append(entry.label)
+        return {category: tuple(sorted(labels)) for category, labels in lookup.items()}
+
+    @cached_property
+    def category_index(self) -> dict:
+        """Map normalized category names and aliases to their category name."""
+        index = {_normalize_key(category): category for category in self.category_lookup}
+        derived = {}
+        for category in self.category_lookup:
+            for alias in _category_aliases(category):
+                derived.setdefault(alias, set()).add(category)
+        for alias, categories in derived.items():
+            if len(categories) == 1:
+                index.setdefault(alias, next(iter(categories)))
+        for alias, category in CATEGORY_ALIASES.items():
+            if category in self.category_lookup:
+                index.setdefault(_normalize_key(alias), category)
+        return index
+
+    @cached_property
+    def design_index(self) -> dict:
+        """Map normalized design category keys and aliases to their entries."""
+        index = {}
+        for entry in self.design:
+            index[_normalize_key(entry.key)] = entry
+            for alias in entry.aliases:
+                index[_normalize_key(alias)] = entry
+        return index
+
+    @cached_property
+    def tool_fuzzy(self) -> _FuzzyIndex:
+        """Typo-tolerant index over tool keys and aliases."""
+        return _FuzzyIndex({key: entry.label for key, entry in self.tool_lookup.items()})
+
+    @cached_property
+    def framework_fuzzy(self) -> _FuzzyIndex:
+        """Typo-tolerant index over framework starter keys."""
+        return _FuzzyIndex({key: starter.label for key, starter in self.frameworks.items()})
+
+    @cached_property
+    def provider_fuzzy(self) -> _FuzzyIndex:
+        """Typo-tolerant index over deployment provider keys."""
+        return _FuzzyIndex({key: playbook.label for key, playbook in self.deployments.items()})
+
+    @cached_property
+    def search_index(self) -> _SearchIndex:
+        """Full-text index used by search_catalog."""
+        return _build_search_index(self)
+
+    @cached_property
+    def recipe_index(self) -> _RecipeIndex:
+        """Term index used to score stack recipes for recommend_stack."""
+        return _RecipeIndex(self.recipes)
+
+    @cached_property
+    def related_index(self) -> _RelatedIndex:
+        """Sparse TF-IDF similarity index used by related_tools; raises ImportError without NumPy."""
+        return _RelatedIndex(self, RELATED_MAX_FEATURES, RELATED_CACHE_K)
+
+    @cached_property
+    def json_entries(self) -> dict:
+        """Pre-serialized JSON for every static entry, keyed by section and normalized key."""
+        return {
+            "tool": {_normalize_key(entry.key): _to_json(asdict(entry)) for entry in self.tools},
+            "framework": {
+                key: _to_json({**asdict(starter), "key": key}) for key, starter in self.frameworks.items()
+            },
+            "deployment": {key: _to_json(asdict(playbook)) for key, playbook in self.deployments.items()},
+            "design": {_normalize_key(entry.key): _to_json(asdict(entry)) for entry in self.design},
         }
 
-    extras = list(chosen.get("extras", []))
-    if realtime_enabled and "Socket.IO" not in " ".join(extras):
-        extras.append("Integrate Socket.IO or Ably for realtime features")
-    if experience_level in {"beginner", "junior"}:
-        extras.append("Prioritize npm scripts and avoid complex monorepo setups initially")
-    elif experience_level in {"senior", "expert"}:
-        extras.append("Consider Turborepo with pnpm workspaces for scalable builds")
+    def build_all(self) -> "_Catalog":
+        """Materialize every lazy index, e.g. before a reload swap or forking workers."""
+        for name in self.INDEXES:
+            try:
+                getattr(self, name)
+            except ImportError:
+                # Only related_index has an optional dependency; related_tools reports it when called.
+                pass
+        return self
 
-    extras_lines = "\n".join(f"- {item}" for item in extras)
-    return f"""✅ Recommended Stack
-Summary: {chosen['summary']}
-Frontend: {chosen['frontend']}
-Backend: {chosen['backend']}
-Infrastructure: {chosen['infrastructure']}
-Extras:
-{extras_lines}"""
 
+CATALOG_SECTIONS = ("tools", "frameworks", "deployments", "recipes", "design")
 
-@mcp.tool()
-async def deployment_checklist(provider: str = "", preview: str = "") -> str:
-    """Return deployment checklist for a hosting provider."""
-    selected = provider.strip().lower() if provider.strip() else DEFAULT_PROVIDER
-    logger.info("Fetching deployment checklist for provider=%s preview=%s", selected, preview)
-    entry = DEPLOYMENT_PLAYBOOKS.get(selected)
-    if not entry and selected == DEFAULT_PROVIDER:
-        entry = DEPLOYMENT_PLAYBOOKS.get("vercel")
-    if not entry:
-        options = ", ".join(sorted(DEPLOYMENT_PLAYBOOKS.keys()))
-        return f"❌ Error: Unknown provider '{provider}'. Supported providers: {options}."
-    steps = "\n".join(f"- {step}" for step in entry["steps"])
-    notes = "\n".join(f"- {note}" for note in entry["notes"])
-    preview_hint = ""
-    if preview.strip().lower() in {"yes", "true", "1"}:
-        preview_hint = "\nPreview Mode: Enable preview deployments by linking feature branches."
-    return f"""🚀 {entry['label']} Deployment Checklist
-Docs: {entry['docs']}
-Steps:
-{steps}
-Notes:
-{notes}{preview_hint}"""
 
+def _require_fields(item, fields: tuple, where: str) -> None:
+    """Raise ValueError unless item is a mapping containing every field."""
+    if not isinstance(item, dict):
+        raise ValueError(f"{where}: expected an object, got {type(item).__name__}")
+    missing = [field for field in fields if field not in item]
+    if missing:
+        raise ValueError(f"{where}: missing field(s) {', '.join(missing)}")
 
-@mcp.tool()
-async def design_knowledge_sources(category: str = "", search: str = "") -> str:
-    """Return curated design knowledge references covering color, typography, brands, and systems."""
-    logger.info("Fetching design knowledge sources category=%s search=%s", category, search)
-    normalized_category = _normalize_key(category) if category.strip() else ""
-    normalized_search = search.strip().lower()
 
-    if normalized_search:
-        matches = []
-        for entry in DESIGN_KNOWLEDGE_DATA:
-            for item in entry["items"]:
-                label_lower = item["label"].lower()
-                if normalized_search in label_lower:
-                    matches.append((entry["label"], item))
-                    continue
-        if not matches:
-            return f"❌ No sources matched search '{search}'."
-        lines = [
-            f"- {item['label']} ({category_label}) → {item['url']}"
-            for category_label, item in matches
-        ]
-        joined = "\n".join(lines)
-        return f"""🧠 Design Knowledge Search Results
-Query: {search}
-Sources:
-{joined}"""
+def _validate_tools(data, path: str) -> list:
+    """Check a tools section: a list of entries shaped like RAW_TOOL_DATA."""
+    if not isinstance(data, list):
+        raise ValueError(f"{path}: tools must be a list")
+    for position, entry in enumerate(data):
+        _require_fields(entry, ("key", "label", "category", "homepage", "summary", "cli"), f"{path}[{position}]")
+        entry.setdefault("aliases", [])
+    return data
 
-    if normalized_category:
-        entry = DESIGN_KNOWLEDGE_INDEX.get(normalized_category)
-        if not entry:
-            available = ", ".join(sorted(e["label"] for e in DESIGN_KNOWLEDGE_DATA))
-            return f"❌ Unknown category '{category}'. Available categories: {available}."
-        lines = [f"- {item['label']} → {item['url']}" for item in entry["items"]]
-        content = "\n".join(lines)
-        return f"""🧠 {entry['label']}
-Summary: {entry['summary']}
-Sources:
-{content}"""
 
-    overview = "\n".join(
-        f"- {entry['label']} ({len(entry['items'])} sources)" for entry in DESIGN_KNOWLEDGE_DATA
+def _validate_frameworks(data, path: str) -> dict:
+    """Check a frameworks section and expand each starter's optional aliases into keys."""
+    if not isinstance(data, dict):
+        raise ValueError(f"{path}: frameworks must be an object keyed by framework name")
+    starters = {}
+    for name, starter in data.items():
+        _require_fields(starter, ("label", "docs", "commands", "post"), f"{path}:{name}")
+        for key in [name] + list(starter.get("aliases", [])):
+            starters[_normalize_key(key)] = starter
+    return starters
+
+
+def _validate_deployments(data, path: str) -> dict:
+    """Check a deployments section keyed by provider name."""
+    if not isinstance(data, dict):
+        raise ValueError(f"{path}: deployments must be an object keyed by provider name")
+    for name, playbook in data.items():
+        _require_fields(playbook, ("label", "docs", "steps", "notes"), f"{path}:{name}")
+    return {_normalize_key(name): playbook for name, playbook in data.items()}
+
+
+def _validate_recipes(data, path: str) -> list:
+    """Check a recipes section shaped like STACK_RECIPES."""
+    if not isinstance(data, list):
+        raise ValueError(f"{path}: recipes must be a list")
+    for position, recipe in enumerate(data):
+        fields = ("id", "match", "summary", "frontend", "backend", "infrastructure")
+        _require_fields(recipe, fields, f"{path}[{position}]")
+        recipe.setdefault("extras", [])
+    return data
+
+
+def _validate_design(data, path: str) -> list:
+    """Check a design section shaped like DESIGN_KNOWLEDGE_DATA."""
+    if not isinstance(data, list):
+        raise ValueError(f"{path}: design must be a list")
+    for position, entry in enumerate(data):
+        _require_fields(entry, ("key", "label", "summary", "items"), f"{path}[{position}]")
+        for item_position, item in enumerate(entry["items"]):
+            _require_fields(item, ("label", "url"), f"{path}[{position}].items[{item_position}]")
+        entry.setdefault("aliases", [])
+    return data
+
+
+_CATALOG_VALIDATORS = {
+    "tools": _validate_tools,
+    "frameworks": _validate_frameworks,
+    "deployments": _validate_deployments,
+    "recipes": _validate_recipes,
+    "design": _validate_design,
+}
+
+
+def _catalog_files(directory: str) -> dict:
+    """Map each catalog section to its file in directory, preferring JSON over TOML."""
+    files = {}
+    for section in CATALOG_SECTIONS:
+        for extension in (".json", ".toml"):
+            path = os.path.join(directory, section + extension)
+            if os.path.isfile(path):
+                files[section] = path
+                break
+    return files
+
+
+def _catalog_signature(directory: str) -> tuple:
+    """Return (path, mtime, size) for every catalog file so edits can be detected cheaply."""
+    signature = []
+    for path in sorted(_catalog_files(directory).values()):
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue
+        signature.append((path, stat.st_mtime_ns, stat.st_size))
+    return tuple(signature)
+
+
+def _read_catalog_file(path: str, section: str):
+    """Parse one JSON or TOML catalog file, unwrapping a top-level section key if present."""
+    if path.endswith(".toml"):
+        try:
+            import tomllib
+        except ImportError:
+            raise ValueError(f"{path}: TOML catalogs require Python 3.11+") from None
+        with open(path, "rb") as handle:
+            data = tomllib.load(handle)
+    else:
+        with open(path, "r", encoding="utf-8") as handle:
+            data = json.load(handle)
+    if isinstance(data, dict) and section in data and len(data) == 1:
+        data = data[section]
+    return data
+
+
+def _load_catalog(directory: str, version: int = 1) -> _Catalog:
+    """Build a catalog from files in directory, using built-in data for any missing section."""
+    sections = {
+        "tools": RAW_TOOL_DATA,
+        "frameworks": FRAMEWORK_STARTERS,
+        "deployments": DEPLOYMENT_PLAYBOOKS,
+        "recipes": STACK_RECIPES,
+        "design": DESIGN_KNOWLEDGE_DATA,
+    }
+    signature = ()
+    if directory:
+        if not os.path.isdir(directory):
+            raise ValueError(f"catalog directory {directory} does not exist")
+        signature = _catalog_signature(directory)
+        for section, path in _catalog_files(directory).items():
+            sections[section] = _CATALOG_VALIDATORS[section](_read_catalog_file(path, section), path)
+    return _Catalog(source=directory or "built-in", version=version, signature=signature, **sections)
+
+
+_CATALOG = None
+
+
+def _get_catalog() -> _Catalog:
+    """Return the active catalog, loading it on first use."""
+    global _CATALOG
+    if _CATALOG is None:
+        try:
+            _CATALOG = _load_catalog(CATALOG_DIR)
+        except (OSError, ValueError) as exc:
+            logger.error("Could not load catalog from %s, using built-in data: %s", CATALOG_DIR, exc)
+            _CATALOG = _load_catalog("")
+            _CATALOG.signature = _catalog_signature(CATALOG_DIR) if os.path.isdir(CATALOG_DIR) else ()
+    return _CATALOG
+
+
+def _swap_catalog(catalog: _Catalog) -> None:
+    """Make a fully built catalog the active one in a single assignment."""
+    global _CATALOG
+    _CATALOG = catalog
+    _RESPONSE_CACHE.clear()
+    _warm_response_cache(catalog)
+    logger.info(
+        "Catalog version %s loaded from %s (%s tools)", catalog.version, catalog.source, len(catalog.tools)
     )
-    return f"""🧠 Design Knowledge Catalog
-Scope: Comprehensive references for color theory, typography, brand psychology, and design systems.
-Categories:
-{overview}
 
-Tip: Pass category=\"color theory\" or search=\"typography\" to drill down."""
 
-if __name__ == "__main__":
+class _CatalogWatcher:
+    """Poll catalog file mtimes and rebuild the catalog off the event loop when they change."""
+
+    def __init__(self, directory: str, interval: float):
+        self.directory = directory
+        self.interval = interval
+        self.reloads = 0
+        self._failed_signature = None
+        self._task = None
+
+    @property
+    def running(self) -> bool:
+        """Return True while the polling task is active."""
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start polling on the running event loop if it is not already running."""
+        if not self.running:
+            self._task = asyncio.ensure_future(self._run())
+            logger.info("Watching catalog directory %s every %ss", self.directory, self.interval)
+
+    async def stop(self) -> None:
+        """Cancel the polling task and wait for it to finish."""
+        task, self._task = self._task, None
+        if task is None:
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    async def _run(self) -> None:
+        """Check for catalog changes every interval, forever."""
+        while True:
+            await asyncio.sleep(self.interval)
+            await self.check()
+
+    async def check(self) -> bool:
+        """Reload the catalog if its files changed since the active version was built."""
+        current = _get_catalog()
+        signature = await asyncio.to_thread(_catalog_signature, self.directory)
+        if signature == current.signature or signature == self._failed_signature:
+            return False
+        try:
+            catalog = await asyncio.to_thread(
+                lambda: _load_catalog(self.directory, current.version + 1).build_all()
+            )
+        except (OSError, ValueError) as exc:
+            self._failed_signature = signature
+            logger.error("Catalog reload failed, keeping version %s: %s", current.version, exc)
+            return False
+        self._failed_signature = None
+        _swap_catalog(catalog)
+        self.reloads += 1
+        return True
+
+
+_CATALOG_WATCHER = _CatalogWatcher(CATALOG_DIR, CATALOG_POLL_INTERVAL)
+
+
+def _format_timestamp() -> str:
+    """Return current UTC timestamp in ISO format."""
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+LATENCY_BUCKETS = tuple(0.0001 * 2**power for power in range(18))
+
+
+class _LatencyHistogram:
+    """Fixed-bucket latency histogram with cheap percentile estimates and Prometheus export."""
+
+    def __init__(self, buckets: tuple = LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+
+    def observe(self, seconds: float) -> None:
+        """Record one duration."""
+        self.counts[bisect.bisect_left(self.buckets, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+
+    def percentile(self, fraction: float) -> float:
+        """Estimate a percentile by interpolating inside the bucket that holds it."""
+        if not self.count:
+            return 0.0
+        rank = fraction * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            if count and seen + count >= rank:
+                if index == len(self.buckets):
+                    return self.buckets[-1]
+                lower = self.buckets[index - 1] if index else 0.0
+                return lower + (self.buckets[index] - lower) * (rank - seen) / count
+            seen += count
+        return self.buckets[-1]
+
+    def summary(self) -> str:
+        """Render p50/p95/p99 in milliseconds."""
+        return " / ".join(f"{self.percentile(q) * 1000:.2f}" for q in (0.5, 0.95, 0.99))
+
+    def prometheus(self, name: str, labels: str = "") -> list:
+        """Render the histogram as Prometheus text exposition lines."""
+        prefix = f"{labels}," if labels else ""
+        lines = []
+        cumulative = 0
+        for bound, count in zip(self.buckets, self.counts):
+            cumulative += count
+            lines.append(f'{name}_bucket{{{prefix}le="{bound:g}"}} {cumulative}')
+        lines.append(f'{name}_bucket{{{prefix}le="+Inf"}} {self.count}')
+        suffix = f"{{{labels}}}" if labels else ""
+        lines.append(f"{name}_sum{suffix} {self.total:.6f}")
+        lines.append(f"{name}_count{suffix} {self.count}")
+        return lines
+
+
+class _ToolMetrics:
+    """Call counts, error counts and latency histograms per tool."""
+
+    def __init__(self):
+        self.calls = {}
+        self.errors = {}
+        self.latency = {}
+        self.coalesced = {}
+        self.rejected = {}
+
+    def record(self, name: str, seconds: float, failed: bool) -> None:
+        """Record one tool call."""
+        histogram = self.latency.get(name)
+        if histogram is None:
+            histogram = self.latency[name] = _LatencyHistogram()
+            self.calls[name] = 0
+            self.errors[name] = 0
+        histogram.observe(seconds)
+        self.calls[name] += 1
+        if failed:
+            self.errors[name] += 1
+
+    @staticmethod
+    def count(counter: dict, name: str) -> None:
+        """Add one to a per-tool dispatch counter such as coalesced or rejected."""
+        counter[name] = counter.get(name, 0) + 1
+
+
+_TOOL_METRICS = _ToolMetrics()
+_STATUS_CHECK_LATENCY = _LatencyHistogram()
+_STATUS_CHECK_ERRORS = 0
+
+
+def _parse_sampling(value: str) -> dict:
+    """Parse "tool=rate,*=rate" into per-tool log sampling rates."""
+    rates = {}
+    for item in value.split(","):
+        name, _, rate = item.partition("=")
+        try:
+            rates[name.strip()] = min(1.0, max(0.0, float(rate)))
+        except ValueError:
+            if item.strip():
+                logger.warning("Ignoring log sampling entry %r", item)
+    return rates
+
+
+LOG_SAMPLING = _parse_sampling(os.environ.get("FULLSTACK_WEBDEV_LOG_SAMPLING", ""))
+
+
+class _CallArguments(dict):
+    """Tool arguments that are only rendered as text if a log record is actually emitted."""
+
+    def __str__(self) -> str:
+        return " ".join(f"{key}={value}" for key, value in self.items())
+
+
+# _with_output_format runs inside _instrumented, so a failed call may already be a JSON error object.
+ERROR_PREFIXES = ("❌", '{"error":')
+
+
+def _instrumented(func):
+    """Record latency, calls, and errors (exceptions or error replies) for an async tool handler, and log the call."""
+    name = func.__name__
+    sample_rate = LOG_SAMPLING.get(name, LOG_SAMPLING.get("*", 1.0))
+
+    @wraps(func)
+    async def wrapper(*args, **kwargs):
+        started = time.perf_counter()
+        failed = True
+        try:
+            result = await func(*args, **kwargs)
+            failed = isinstance(result, str) and result.startswith(ERROR_PREFIXES)
+            return result
+        finally:
+            elapsed = time.perf_counter() - started
+            _TOOL_METRICS.record(name, elapsed, failed)
+            # Cheapest checks first: no record is built when INFO is off or this call is not sampled.
+            if logger.isEnabledFor(logging.INFO) and (failed or sample_rate >= 1.0 or random.random() < sample_rate):
+                arguments = _CallArguments(
+                    (key, value) for key, value in kwargs.items() if not isinstance(value, Context)
+                )
+                logger.info(
+                    "%s %s (%.2f ms%s)",
+                    name,
+                    arguments,
+                    elapsed * 1000,
+                    ", error" if failed else "",
+                    extra={
+                        "tool": name,
+                        "duration_ms": round(elapsed * 1000, 3),
+                        "error": failed,
+                        "arguments": arguments,
+                    },
+                )
+
+    return wrapper
+
+
+OUTPUT_FORMATS = ("text", "json")
+
+
+def _wants_json(output_format: str) -> bool:
+    """Return True when a tool was asked for output_format="json"."""
+    return output_format.strip().lower() == "json"
+
+
+def _json_error(message: str) -> str:
+    """Convert a "❌ ..." text reply into a JSON error object."""
+    for prefix in ("❌ Error: ", "❌ "):
+        if message.startswith(prefix):
+            message = message[len(prefix) :]
+            break
+    return _to_json({"error": message})
+
+
+def _with_output_format(func):
+    """Validate a tool's output_format argument and return its error replies as JSON when asked."""
+
+    @wraps(func)
+    async def wrapper(*args, **kwargs):
+        output_format = kwargs.get("output_format", "").strip().lower()
+        if output_format and output_format not in OUTPUT_FORMATS:
+            return f"❌ Error: Unknown output_format '{output_format}'. Try one of: {', '.join(OUTPUT_FORMATS)}."
+        result = await func(*args, **kwargs)
+        if output_format == "json" and result.startswith("❌"):
+            return _json_error(result)
+        return result
+
+    return wrapper
+
+
+def _prometheus_metrics() -> str:
+    """Render tool, status check, and cache metrics in the Prometheus text format."""
+    lines = [
+        "# HELP fullstack_webdev_tool_calls_total Tool calls handled.",
+        "# TYPE fullstack_webdev_tool_calls_total counter",
+    ]
+    tools = sorted(_TOOL_METRICS.calls)
+    lines += [f'fullstack_webdev_tool_calls_total{{tool="{name}"}} {_TOOL_METRICS.calls[name]}' for name in tools]
+    lines += [
+        "# HELP fullstack_webdev_tool_errors_total Tool calls that raised or returned an error.",
+        "# TYPE fullstack_webdev_tool_errors_total counter",
+    ]
+    lines += [f'fullstack_webdev_tool_errors_total{{tool="{name}"}} {_TOOL_METRICS.errors[name]}' for name in tools]
+    lines += [
+        "# HELP fullstack_webdev_tool_duration_seconds Tool handler latency.",
+        "# TYPE fullstack_webdev_tool_duration_seconds histogram",
+    ]
+    for name in tools:
+        lines += _TOOL_METRICS.latency[name].prometheus("fullstack_webdev_tool_duration_seconds", f'tool="{name}"')
+    lines += [
+        "# HELP fullstack_webdev_status_check_duration_seconds Outbound HEAD request latency.",
+        "# TYPE fullstack_webdev_status_check_duration_seconds histogram",
+        *_STATUS_CHECK_LATENCY.prometheus("fullstack_webdev_status_check_duration_seconds"),
+        "# HELP fullstack_webdev_status_check_errors_total Outbound HEAD requests that failed.",
+        "# TYPE fullstack_webdev_status_check_errors_total counter",
+        f"fullstack_webdev_status_check_errors_total {_STATUS_CHECK_ERRORS}",
+        "# HELP fullstack_webdev_status_check_short_circuited_total Status checks skipped for hosts with open "
+        "circuits.",
+        "# TYPE fullstack_webdev_status_check_short_circuited_total counter",
+        f"fullstack_webdev_status_check_short_circuited_total {_HOST_CIRCUITS.short_circuited}",
+        "# TYPE fullstack_webdev_open_circuits gauge",
+        f"fullstack_webdev_open_circuits {len(_HOST_CIRCUITS.not_closed())}",
+    ]
+    for counter, help_text in (
+        ("coalesced", "Tool calls answered by joining an identical in-flight call."),
+        ("rejected", "Tool calls rejected by the per-client rate limit."),
+    ):
+        lines.append(f"# HELP fullstack_webdev_tool_calls_{counter}_total {help_text}")
+        lines.append(f"# TYPE fullstack_webdev_tool_calls_{counter}_total counter")
+        counts = getattr(_TOOL_METRICS, counter)
+        lines += [
+            f'fullstack_webdev_tool_calls_{counter}_total{{tool="{name}"}} {counts[name]}' for name in sorted(counts)
+        ]
+    caches = (
+        ("status_cache", _STATUS_CACHE.stats(), ("hits", "misses")),
+        ("response_cache", _RESPONSE_CACHE.stats(), ("hits", "misses")),
+        ("docs_cache", _DOCS_CACHE.stats(), ("hits", "misses", "revalidated", "stale")),
+        ("status_store", _STATUS_STORE.stats(), ("hits", "misses", "writes", "evictions", "errors")),
+    )
+    for prefix, stats, counters in caches:
+        for key in counters:
+            lines.append(f"# TYPE fullstack_webdev_{prefix}_{key}_total counter")
+            lines.append(f"fullstack_webdev_{prefix}_{key}_total {stats[key]}")
+        if "entries" in stats:
+            lines.append(f"# TYPE fullstack_webdev_{prefix}_entries gauge")
+            lines.append(f"fullstack_webdev_{prefix}_entries {stats['entries']}")
+    return "\n".join(lines) + "\n"
+
+
+class _MetricsExporter:
+    """Minimal HTTP listener that serves Prometheus metrics at /metrics."""
+
+    def __init__(self, host: str, port: int):
+        self.host = host
+        self.port = port
+        self._server = None
+
+    @property
+    def running(self) -> bool:
+        return self._server is not None
+
+    async def start(self) -> None:
+        """Start listening unless already running."""
+        if self._server is None:
+            self._server = await asyncio.start_server(self._handle, self.host, self.port)
+            logger.info("Prometheus metrics on http://%s:%s/metrics", self.host, self.port)
+
+    async def stop(self) -> None:
+        """Stop listening."""
+        server, self._server = self._server, None
+        if server is not None:
+            server.close()
+            await server.wait_closed()
+
+    async def _handle(self, reader, writer) -> None:
+        try:
+            request = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), 5)
+            method, path = request.split(b" ", 2)[:2]
+            if method == b"GET" and path.split(b"?")[0] == b"/metrics":
+                status, body = "200 OK", _prometheus_metrics().encode()
+            else:
+                status, body = "404 Not Found", b"not found\n"
+            writer.write(
+                f"HTTP/1.1 {status}\r\nContent-Type: text/plain; version=0.0.4; charset=utf-8\r\n"
+                f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode() + body
+            )
+            await writer.drain()
+        except (asyncio.TimeoutError, asyncio.IncompleteReadError, ValueError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+
+_METRICS_EXPORTER = _MetricsExporter(METRICS_HOST, METRICS_PORT)
+
+
+class _ClientRateLimiter:
+    """Token bucket per client: `rate` calls per second with bursts of up to `burst` calls."""
+
+    def __init__(self, rate: float, burst: float, max_clients: int):
+        self.rate = rate
+        self.burst = max(1.0, burst)
+        self.max_clients = max_clients
+        self._buckets = {}
+
+    @property
+    def enabled(self) -> bool:
+        return self.rate > 0
+
+    def acquire(self, client: str) -> float:
+        """Take one token for client, returning 0 on success or the seconds until a token is available."""
+        now = time.monotonic()
+        bucket = self._buckets.pop(client, None)
+        if bucket is None:
+            tokens = self.burst
+            while len(self._buckets) >= self.max_clients:
+                self._buckets.pop(next(iter(self._buckets)))
+        else:
+            tokens = min(self.burst, bucket[0] + (now - bucket[1]) * self.rate)
+        if tokens >= 1:
+            self._buckets[client] = (tokens - 1, now)
+            return 0.0
+        self._buckets[client] = (tokens, now)
+        return (1 - tokens) / self.rate
+
+    def clients(self) -> int:
+        """Return how many clients currently have a bucket."""
+        return len(self._buckets)
+
+
+_CLIENT_RATE_LIMITER = _ClientRateLimiter(RATE_LIMIT, RATE_BURST, RATE_LIMIT_CLIENTS)
+
+
+async def _await_shared(task: asyncio.Future, waiters: dict, key: str, cancellable: bool = True):
+    """Await a task shared between callers, cancelling it when the last caller still waiting is cancelled."""
+    waiters[key] = waiters.get(key, 0) + 1
+    try:
+        return await asyncio.shield(task)
+    finally:
+        waiters[key] -= 1
+        if not waiters[key]:
+            del waiters[key]
+            if cancellable and not task.done():
+                task.cancel()
+
+
+class _ToolCallCoalescer:
+    """Run identical concurrent tool calls from one client once and hand every caller the same result."""
+
+    def __init__(self):
+        self._inflight = {}
+        self._waiters = {}
+
+    async def run(self, client: str, name: str, arguments: dict, dispatch):
+        """Return dispatch()'s result, joining an identical call from the same client that is already running."""
+        key = f"{client}\0{name}\0{json.dumps(arguments, sort_keys=True, default=str)}"
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(dispatch())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        else:
+            _TOOL_METRICS.count(_TOOL_METRICS.coalesced, name)
+        return await _await_shared(task, self._waiters, key)
+
+    def inflight(self) -> int:
+        """Return how many distinct calls are currently running."""
+        return len(self._inflight)
+
+
+_TOOL_COALESCER = _ToolCallCoalescer()
+
+
+_HTTP_CLIENT = None
+_HTTP_CLIENT_LOOP = None
+
+
+def _http2_available() -> bool:
+    """Return True when the optional h2 package is installed for HTTP/2 support."""
+    return importlib.util.find_spec("h2") is not None
+
+
+def _get_http_client():
+    """Return the shared pooled HTTP client, creating it for the running event loop."""
+    global _HTTP_CLIENT, _HTTP_CLIENT_LOOP
+    loop = asyncio.get_running_loop()
+    if _HTTP_CLIENT is None or _HTTP_CLIENT.is_closed or _HTTP_CLIENT_LOOP is not loop:
+        import httpx
+
+        _HTTP_CLIENT = httpx.AsyncClient(
+            timeout=STATUS_TIMEOUT,
+            limits=httpx.Limits(
+                max_connections=HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=HTTP_MAX_CONNECTIONS,
+                keepalive_expiry=60,
+            ),
+            http2=_http2_available(),
+        )
+        _HTTP_CLIENT_LOOP = loop
+    return _HTTP_CLIENT
+
+
+async def _close_http_client() -> None:
+    """Close the shared HTTP client if it was opened on the running event loop."""
+    global _HTTP_CLIENT, _HTTP_CLIENT_LOOP
+    client, owner = _HTTP_CLIENT, _HTTP_CLIENT_LOOP
+    _HTTP_CLIENT = None
+    _HTTP_CLIENT_LOOP = None
+    if client is not None and not client.is_closed and owner is asyncio.get_running_loop():
+        await client.aclose()
+
+
+class _CircuitBreaker:
+    """Closed/open/half-open breaker for one host, doubling its open period after each failed trial."""
+
+    def __init__(self, failures: int, reset: float, max_reset: float):
+        self.threshold = max(1, failures)
+        self.reset = reset
+        self.max_reset = max_reset
+        self.failures = 0
+        self.opened = 0
+        self.open_until = 0.0
+        self.trial = False
+
+    @property
+    def state(self) -> str:
+        if not self.opened:
+            return "closed"
+        return "half-open" if self.trial or time.monotonic() >= self.open_until else "open"
+
+    def allow(self) -> bool:
+        """Return True when a request may go out; while half-open only one trial request is let through."""
+        if not self.opened:
+            return True
+        if self.trial or time.monotonic() < self.open_until:
+            return False
+        self.trial = True
+        return True
+
+    def retry_after(self) -> float:
+        """Return seconds until the next trial request is allowed."""
+        return max(0.0, self.open_until - time.monotonic())
+
+    def succeeded(self) -> None:
+        self.failures = 0
+        self.opened = 0
+        self.trial = False
+
+    def failed(self) -> None:
+        self.failures += 1
+        if self.trial or self.failures >= self.threshold:
+            self.opened += 1
+            self.open_until = time.monotonic() + min(self.max_reset, self.reset * 2 ** (self.opened - 1))
+        self.trial = False
+
+    def release(self) -> None:
+        """Give back a trial slot whose request was cancelled before it finished."""
+        self.trial = False
+
+
+class _HostCircuits:
+    """Circuit breakers keyed by host name."""
+
+    def __init__(self, failures: int, reset: float, max_reset: float):
+        self.failures = failures
+        self.reset = reset
+        self.max_reset = max_reset
+        self.short_circuited = 0
+        self._breakers = {}
+
+    def get(self, host: str) -> _CircuitBreaker:
+        breaker = self._breakers.get(host)
+        if breaker is None:
+            breaker = self._breakers[host] = _CircuitBreaker(self.failures, self.reset, self.max_reset)
+        return breaker
+
+    def not_closed(self) -> dict:
+        """Return {host: (state, retry_after)} for every breaker that is open or half-open."""
+        return {
+            host: (breaker.state, breaker.retry_after())
+            for host, breaker in sorted(self._breakers.items())
+            if breaker.opened
+        }
+
+
+_HOST_CIRCUITS = _HostCircuits(CIRCUIT_FAILURES, CIRCUIT_RESET, CIRCUIT_MAX_RESET)
+
+
+async def _probe_status(url: str) -> dict:
+    """Send a HEAD request to a URL within the status deadline, retrying once, and describe the outcome."""
+    global _STATUS_CHECK_ERRORS
+    host = urlsplit(url).hostname or ""
+    breaker = _HOST_CIRCUITS.get(host)
+    if not breaker.allow():
+        _HOST_CIRCUITS.short_circuited += 1
+        _STATUS_CHECK_ERRORS += 1
+        return {
+            "code": None,
+            "reason": "",
+            "error": f"{host} is unreachable (circuit open, next check in {_format_age(breaker.retry_after())})",
+            "short_circuited": True,
+        }
+    started = time.perf_counter()
+    deadline = time.monotonic() + STATUS_DEADLINE
+    attempts = max(1, STATUS_RETRIES + 1)
+    client = _get_http_client()
+    import httpx
+
+    error = ""
+    recorded = False
+    try:
+        for attempt in range(attempts):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                error = error or "deadline exceeded"
+                break
+            try:
+                response = await client.head(url, timeout=remaining / (attempts - attempt))
+            except httpx.TransportError as exc:
+                error = str(exc) or exc.__class__.__name__
+                if attempt + 1 < attempts:
+                    await asyncio.sleep(min(0.1 * 2**attempt, max(0.0, deadline - time.monotonic()) / 2))
+                continue
+            except Exception as exc:
+                _STATUS_CHECK_ERRORS += 1
+                return {"code": None, "reason": "", "error": str(exc) or exc.__class__.__name__}
+            if response.status_code >= 500 and attempt + 1 < attempts:
+                error = f"{response.status_code} {response.reason_phrase}"
+                continue
+            if response.status_code >= 500:
+                breaker.failed()
+            else:
+                breaker.succeeded()
+            recorded = True
+            return {"code": response.status_code, "reason": response.reason_phrase, "error": ""}
+        breaker.failed()
+        recorded = True
+        _STATUS_CHECK_ERRORS += 1
+        return {"code": None, "reason": "", "error": error}
+    finally:
+        if not recorded:
+            breaker.release()
+        _STATUS_CHECK_LATENCY.observe(time.perf_counter() - started)
+
+
+def _format_status_line(result: dict, age: float = 0.0) -> str:
+    """Render a status probe result as a single response line."""
+    checked = f" (checked {_format_age(age)} ago)" if age >= 1 else ""
+    if result["code"] is None:
+        return f"⚠️ Status Check Failed: {result['error']}{checked}"
+    return f"🌐 Status: {result['code']} {result['reason']}{checked}"
+
+
+def _format_age(seconds: float) -> str:
+    """Render an age in seconds as a short human-readable duration."""
+    if seconds < 60:
+        return f"{seconds:.0f}s"
+    if seconds < 3600:
+        return f"{seconds / 60:.0f}m"
+    return f"{seconds / 3600:.1f}h"
+
+
+class _ExcerptParser(HTMLParser):
+    """Collect a page's title and visible text, skipping scripts, styles and page chrome."""
+
+    SKIP = frozenset({"script", "style", "noscript", "template", "svg", "nav", "header", "footer", "aside", "form"})
+    BLOCKS = frozenset(
+        {"p", "div", "section", "article", "main", "li", "ul", "ol", "pre", "table", "tr", "br", "blockquote"}
+        | {"h1", "h2", "h3", "h4", "h5", "h6"}
+    )
+
+    def __init__(self, limit: int):
+        super().__init__(convert_charrefs=True)
+        self.limit = limit
+        self.title = []
+        self.parts = []
+        self.size = 0
+        self._skipping = 0
+        self._in_title = False
+
+    def handle_starttag(self, tag, attrs) -> None:
+        if tag in self.SKIP:
+            self._skipping += 1
+        elif tag == "title":
+            self._in_title = True
+        elif tag in self.BLOCKS:
+            self.parts.append("\n")
+
+    def handle_endtag(self, tag) -> None:
+        if tag in self.SKIP:
+            self._skipping = max(0, self._skipping - 1)
+        elif tag == "title":
+            self._in_title = False
+        elif tag in self.BLOCKS:
+            self.parts.append("\n")
+
+    def handle_data(self, data) -> None:
+        if self._in_title:
+            self.title.append(data)
+        elif not self._skipping and self.size < self.limit:
+            self.parts.append(data)
+            self.size += len(data)
+
+
+def _trim_text(text: str, limit: int) -> str:
+    """Collapse whitespace and cut text to at most limit characters on a word boundary."""
+    lines = (" ".join(line.split()) for line in text.splitlines())
+    text = "\n".join(line for line in lines if line)
+    if len(text) <= limit:
+        return text
+    cut = text.rfind(" ", 0, limit)
+    return text[: cut if cut > limit // 2 else limit].rstrip() + "…"
+
+
+def _extract_excerpt(text: str, content_type: str, limit: int) -> tuple:
+    """Return (title, excerpt) for a downloaded page, parsing HTML and passing plain text through."""
+    if "html" not in content_type and text.lstrip()[:1] != "<":
+        return "", _trim_text(text, limit)
+    parser = _ExcerptParser(limit * 2)
+    parser.feed(text)
+    parser.close()
+    return _trim_text("".join(parser.title), 200), _trim_text("".join(parser.parts), limit)
+
+
+class _DocsCache:
+    """Size-bounded on-disk cache of documentation excerpts, evicting the least recently used files."""
+
+    def __init__(self, directory: str, max_bytes: int):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._files = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.revalidated = 0
+        self.stale = 0
+        self.evictions = 0
+
+    def _path(self, url: str) -> str:
+        return os.path.join(self.directory, hashlib.sha256(url.encode()).hexdigest()[:32] + ".json")
+
+    def _index(self) -> dict:
+        """Return {path: [size, last_used]} for the cache directory, scanning it on first use."""
+        if self._files is None:
+            self._files = {}
+            try:
+                with os.scandir(self.directory) as entries:
+                    for entry in entries:
+                        if entry.name.endswith(".json") and entry.is_file():
+                            stat = entry.stat()
+                            self._files[entry.path] = [stat.st_size, stat.st_mtime]
+            except FileNotFoundError:
+                pass
+        return self._files
+
+    def load(self, url: str):
+        """Return the cached record for url, or None when it is missing or unreadable."""
+        path = self._path(url)
+        try:
+            with open(path, encoding="utf-8") as handle:
+                record = json.load(handle)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(record, dict) or record.get("url") != url:
+            return None
+        now = time.time()
+        try:
+            os.utime(path, (now, now))
+        except OSError:
+            pass
+        with self._lock:
+            files = self._index()
+            if path in files:
+                files[path][1] = now
+        return record
+
+    def store(self, record: dict) -> None:
+        """Write a record atomically, then evict old files until the cache fits its size budget."""
+        os.makedirs(self.directory, exist_ok=True)
+        path = self._path(record["url"])
+        data = json.dumps(record, ensure_ascii=False).encode()
+        temporary = f"{path}.{os.getpid()}.tmp"
+        with open(temporary, "wb") as handle:
+            handle.write(data)
+        os.replace(temporary, path)
+        with self._lock:
+            files = self._index()
+            files[path] = [len(data), time.time()]
+            total = sum(size for size, _ in files.values())
+            while total > self.max_bytes and len(files) > 1:
+                oldest = min((candidate for candidate in files if candidate != path), key=lambda key: files[key][1])
+                total -= files.pop(oldest)[0]
+                self.evictions += 1
+                try:
+                    os.remove(oldest)
+                except OSError:
+                    pass
+
+    def stats(self) -> dict:
+        """Return hit/miss counters and the cache's current size."""
+        with self._lock:
+            files = dict(self._index())
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "revalidated": self.revalidated,
+            "stale": self.stale,
+            "evictions": self.evictions,
+            "entries": len(files),
+            "bytes": sum(size for size, _ in files.values()),
+        }
+
+
+_DOCS_CACHE = _DocsCache(DOCS_CACHE_DIR, DOCS_CACHE_BYTES)
+
+
+async def _read_capped(response, limit: int) -> tuple:
+    """Stream a response body, stopping after limit bytes; return (body, truncated)."""
+    chunks = []
+    size = 0
+    async for chunk in response.aiter_bytes():
+        chunks.append(chunk)
+        size += len(chunk)
+        if size >= limit:
+            return b"".join(chunks)[:limit], True
+    return b"".join(chunks), False
+
+
+async def _docs_excerpt(url: str, refresh: bool = False) -> tuple:
+    """Return (record, outcome) for url from the disk cache, revalidating or downloading it as needed."""
+    record = await asyncio.to_thread(_DOCS_CACHE.load, url)
+    if record is not None and not refresh and time.time() - record["checked"] < DOCS_TTL:
+        _DOCS_CACHE.hits += 1
+        return record, "hit"
+    headers = {}
+    if record is not None:
+        if record.get("etag"):
+            headers["If-None-Match"] = record["etag"]
+        if record.get("last_modified"):
+            headers["If-Modified-Since"] = record["last_modified"]
+    try:
+        async with _get_http_client().stream(
+            "GET", url, headers=headers, follow_redirects=True, timeout=DOCS_TIMEOUT
+        ) as response:
+            if response.status_code == 304 and record is not None:
+                record = {**record, "checked": time.time()}
+                await asyncio.to_thread(_DOCS_CACHE.store, record)
+                _DOCS_CACHE.revalidated += 1
+                return record, "revalidated"
+            if response.status_code >= 400:
+                raise ValueError(f"HTTP {response.status_code} {response.reason_phrase}")
+            body, truncated = await _read_capped(response, DOCS_MAX_BYTES)
+            content_type = response.headers.get("content-type", "").lower()
+            encoding = response.charset_encoding or "utf-8"
+            etag = response.headers.get("etag", "")
+            last_modified = response.headers.get("last-modified", "")
+    except Exception as exc:
+        if record is None:
+            raise ValueError(f"Could not fetch {url}: {str(exc) or exc.__class__.__name__}") from None
+        _DOCS_CACHE.stale += 1
+        return record, f"stale ({str(exc) or exc.__class__.__name__})"
+    title, excerpt = await asyncio.to_thread(
+        _extract_excerpt, body.decode(encoding, errors="replace"), content_type, DOCS_EXCERPT_CHARS
+    )
+    now = time.time()
+    record = {
+        "url": url,
+        "title": title,
+        "excerpt": excerpt,
+        "etag": etag,
+        "last_modified": last_modified,
+        "bytes": len(body),
+        "truncated": truncated,
+        "fetched": now,
+        "checked": now,
+    }
+    await asyncio.to_thread(_DOCS_CACHE.store, record)
+    _DOCS_CACHE.misses += 1
+    return record, "fetched"
+
+
+class _StatusCache:
+    """In-memory TTL cache of status probes with single-flight and stale-while-revalidate."""
+
+    def __init__(self, ttl: float, error_ttl: float, max_entries: int = 1024):
+        self.ttl = ttl
+        self.error_ttl = error_ttl
+        self.max_entries = max_entries
+        self._entries = {}
+        self._inflight = {}
+        self._waiters = {}
+        self._detached = set()
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.stale = 0
+
+    async def get(self, key: str, loader, allow_stale: bool = False) -> tuple:
+        """Return (result, age) for key, running loader (which returns the same pair) at most once concurrently."""
+        cached = self._entries.get(key)
+        now = time.monotonic()
+        if cached is not None:
+            expires_at, fetched_at, result = cached
+            if expires_at > now:
+                self.hits += 1
+                return result, now - fetched_at
+            if allow_stale:
+                self.stale += 1
+                self.refresh(key, loader)
+                return result, now - fetched_at
+        if key in self._inflight:
+            self.coalesced += 1
+        else:
+            self.misses += 1
+        task = self.refresh(key, loader, detached=False)
+        return await _await_shared(task, self._waiters, key, cancellable=key not in self._detached)
+
+    def refresh(self, key: str, loader, detached: bool = True) -> asyncio.Future:
+        """Start loading key unless a load is already in flight; detached loads outlive cancelled callers."""
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._load(key, loader))
+            self._inflight[key] = task
+            if detached:
+                self._detached.add(key)
+        return task
+
+    async def _load(self, key: str, loader) -> tuple:
+        """Run loader and store its result with a TTL matching the outcome."""
+        try:
+            result, age = await loader()
+        finally:
+            self._inflight.pop(key, None)
+            self._detached.discard(key)
+        self.put(key, result, age)
+        return result, age
+
+    def peek(self, key: str):
+        """Return (result, age) for a fresh cached result for key without probing, or None."""
+        cached = self._entries.get(key)
+        now = time.monotonic()
+        if cached is not None and cached[0] > now:
+            self.hits += 1
+            return cached[2], now - cached[1]
+        return None
+
+    def put(self, key: str, result: dict, age: float = 0.0) -> None:
+        """Store a probe result that is age seconds old with a TTL matching its outcome."""
+        fetched_at = time.monotonic() - age
+        ttl = self.ttl if result["code"] is not None else self.error_ttl
+        self._entries.pop(key, None)
+        self._entries[key] = (fetched_at + ttl, fetched_at, result)
+        while len(self._entries) > self.max_entries:
+            self._entries.pop(next(iter(self._entries)))
+
+    def clear(self) -> None:
+        """Drop cached results and reset counters."""
+        self._entries.clear()
+        self.hits = self.misses = self.coalesced = self.stale = 0
+
+    def stats(self) -> dict:
+        """Return hit/miss counters and current cache size."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "stale": self.stale,
+            "entries": len(self._entries),
+            "inflight": len(self._inflight),
+        }
+
+
+_STATUS_CACHE = _StatusCache(STATUS_CACHE_TTL, STATUS_ERROR_TTL)
+
+
+class _SharedStatusStore:
+    """SQLite table in WAL mode that lets every local server process reuse each other's status results."""
+
+    PRUNE_EVERY = 100
+
+    def __init__(self, path: str, max_entries: int):
+        self.path = path
+        self.max_entries = max_entries
+        self._connection = None
+        self._pid = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+        self.errors = 0
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.path)
+
+    def _connect(self):
+        """Open the database on first use in this process, creating the table if needed."""
+        if self._connection is None or self._pid != os.getpid():
+            import sqlite3
+
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            connection = sqlite3.connect(self.path, timeout=2.0, isolation_level=None, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS status "
+                "(url TEXT PRIMARY KEY, result TEXT NOT NULL, checked REAL NOT NULL, expires REAL NOT NULL)"
+            )
+            connection.execute("CREATE INDEX IF NOT EXISTS status_checked ON status (checked)")
+            self._connection = connection
+            self._pid = os.getpid()
+        return self._connection
+
+    def _read(self, url: str):
+        now = time.time()
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT result, checked FROM status WHERE url = ? AND expires > ?", (url, now)
+            ).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return json.loads(row[0]), max(0.0, now - row[1])
+
+    def _write(self, url: str, result: dict, ttl: float) -> None:
+        now = time.time()
+        with self._lock:
+            connection = self._connect()
+            connection.execute(
+                "INSERT OR REPLACE INTO status VALUES (?, ?, ?, ?)", (url, json.dumps(result), now, now + ttl)
+            )
+            self.writes += 1
+            if self.writes % self.PRUNE_EVERY == 1:
+                self.evictions += connection.execute("DELETE FROM status WHERE expires <= ?", (now,)).rowcount
+                self.evictions += connection.execute(
+                    "DELETE FROM status WHERE url IN (SELECT url FROM status ORDER BY checked DESC LIMIT -1 OFFSET ?)",
+                    (self.max_entries,),
+                ).rowcount
+
+    def _failed(self, exc: Exception) -> None:
+        self.errors += 1
+        level = logging.WARNING if self.errors == 1 else logging.DEBUG
+        logger.log(level, "Status store %s unavailable: %s", self.path, exc)
+
+    async def get(self, url: str):
+        """Return (result, age) for a fresh stored result, or None, without blocking the event loop."""
+        try:
+            return await asyncio.to_thread(self._read, url)
+        except Exception as exc:
+            self._failed(exc)
+            return None
+
+    async def put(self, url: str, result: dict) -> None:
+        """Store a probe result with a TTL matching its outcome, without blocking the event loop."""
+        if result.get("short_circuited"):
+            # No request went out; other processes keep their own breakers and must not inherit this one's.
+            return
+        ttl = STATUS_CACHE_TTL if result["code"] is not None else STATUS_ERROR_TTL
+        try:
+            await asyncio.to_thread(self._write, url, result, ttl)
+        except Exception as exc:
+            self._failed(exc)
+
+    def close(self) -> None:
+        """Close this process's connection; the next access reopens it."""
+        with self._lock:
+            connection, self._connection = self._connection, None
+        if connection is not None and self._pid == os.getpid():
+            connection.close()
+
+    def stats(self) -> dict:
+        """Return read/write counters for this process."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "writes": self.writes,
+            "evictions": self.evictions,
+            "errors": self.errors,
+        }
+
+
+_STATUS_STORE = _SharedStatusStore(STATUS_STORE_PATH, STATUS_STORE_MAX_ENTRIES)
+
+
+def _format_store_line() -> str:
+    """Summarize the shared status store for server_metrics."""
+    if not _STATUS_STORE.enabled:
+        return "off"
+    stats = _STATUS_STORE.stats()
+    return (
+        f"{_STATUS_STORE.path} ({stats['hits']} hits, {stats['misses']} misses, {stats['writes']} writes, "
+        f"{stats['errors']} errors)"
+    )
+
+
+async def _load_status(url: str) -> tuple:
+    """Return (result, age) from the shared store when another process checked url recently, else probe it."""
+    if _STATUS_STORE.enabled:
+        stored = await _STATUS_STORE.get(url)
+        if stored is not None:
+            return stored
+    result = await _probe_status(url)
+    if _STATUS_STORE.enabled:
+        await _STATUS_STORE.put(url, result)
+    return result, 0.0
+
+
+async def _get_status(url: str) -> tuple:
+    """Return (result, age) for a URL, serving stale results while a refresh runs."""
+    return await _STATUS_CACHE.get(url, lambda: _load_status(url), allow_stale=True)
+
+
+class _StatusPrefetcher:
+    """Background task that refreshes catalog homepage status on a jittered schedule."""
+
+    def __init__(self, interval: float, concurrency: int, jitter: float = 0.2):
+        self.interval = interval
+        self.concurrency = concurrency
+        self.jitter = jitter
+        self.rounds = 0
+        self._task = None
+
+    @property
+    def running(self) -> bool:
+        """Return True while the refresh loop task is active."""
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start the refresh loop on the running event loop if it is not already running."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.ensure_future(self._run())
+            logger.info("Status prefetcher started (interval=%ss)", self.interval)
+
+    async def stop(self) -> None:
+        """Cancel the refresh loop and wait for it to finish."""
+        task, self._task = self._task, None
+        if task is None:
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        logger.info("Status prefetcher stopped")
+
+    async def _run(self) -> None:
+        """Refresh every homepage, then sleep for a jittered interval, forever."""
+        while True:
+            try:
+                await self.refresh_all()
+            except Exception as exc:
+                logger.warning("Status prefetch round failed: %s", exc)
+            spread = self.interval * self.jitter
+            await asyncio.sleep(self.interval + random.uniform(-spread, spread))
+
+    async def refresh_all(self) -> None:
+        """Refresh the status of every tool homepage with bounded concurrency."""
+        urls = sorted({entry.homepage for entry in _get_catalog().tools})
+        semaphore = asyncio.Semaphore(max(1, self.concurrency))
+
+        async def refresh(url: str) -> None:
+            await asyncio.sleep(random.uniform(0, self.interval * self.jitter / 4))
+            async with semaphore:
+                await _STATUS_CACHE.refresh(url, lambda: _load_status(url))
+
+        await asyncio.gather(*(refresh(url) for url in urls))
+        self.rounds += 1
+
+
+_STATUS_PREFETCHER = _StatusPrefetcher(STATUS_PREFETCH_INTERVAL, HEALTH_CONCURRENCY)
+
+
+class _HostRateLimiter:
+    """Space out requests to the same host to at most `rate` per second."""
+
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self._next_slot = {}
+
+    async def wait(self, host: str) -> None:
+        """Sleep until the next request slot for host is available."""
+        now = time.monotonic()
+        slot = max(now, self._next_slot.get(host, now))
+        self._next_slot[host] = slot + self.interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+def _catalog_urls(catalog: _Catalog) -> list:
+    """Collect every distinct documentation URL in the catalog with its source label."""
+    urls = {}
+    for entry in catalog.tools:
+        urls.setdefault(entry.homepage, f"{entry.label} (Tool)")
+    for starter in catalog.frameworks.values():
+        urls.setdefault(starter.docs, f"{starter.label} (Framework)")
+    for playbook in catalog.deployments.values():
+        urls.setdefault(playbook.docs, f"{playbook.label} (Deployment)")
+    for entry in catalog.design:
+        for item in entry.items:
+            urls.setdefault(item.url, f"{item.label} (Design)")
+    return list(urls.items())
+
+
+def _parse_positive(value: str, default: float, name: str) -> float:
+    """Parse a positive numeric tool argument, raising ValueError with a readable message."""
+    if not value.strip():
+        return default
+    try:
+        parsed = float(value)
+    except ValueError:
+        raise ValueError(f"{name} must be a number, got '{value}'") from None
+    if parsed <= 0:
+        raise ValueError(f"{name} must be greater than zero")
+    return parsed
+
+
+def _parse_count(value: str, default: int, name: str, minimum: int = 0) -> int:
+    """Parse an integer tool argument of at least minimum, raising ValueError with a readable message."""
+    if not value.strip():
+        return default
+    try:
+        parsed = int(value)
+    except ValueError:
+        raise ValueError(f"{name} must be a whole number, got '{value}'") from None
+    if parsed < minimum:
+        raise ValueError(f"{name} must be at least {minimum}")
+    return parsed
+
+
+async def _sweep_url(url: str, semaphore: asyncio.Semaphore, limiter: _HostRateLimiter, refresh: bool = False) -> tuple:
+    """Probe one URL under the sweep's concurrency and per-host limits; age is None unless a cached result was used."""
+    started = time.monotonic()
+    cached = None if refresh else _STATUS_CACHE.peek(url)
+    if cached is None and not refresh and _STATUS_STORE.enabled:
+        cached = await _STATUS_STORE.get(url)
+        if cached is not None:
+            _STATUS_CACHE.put(url, *cached)
+    if cached is not None:
+        result, age = cached
+        return url, result, time.monotonic() - started, age
+    await limiter.wait(urlsplit(url).hostname or "")
+    async with semaphore:
+        started = time.monotonic()
+        result = await _probe_status(url)
+    _STATUS_CACHE.put(url, result)
+    if _STATUS_STORE.enabled:
+        await _STATUS_STORE.put(url, result)
+    return url, result, time.monotonic() - started, None
+
+
+class _ResponseCache:
+    """LRU cache of rendered tool responses keyed on normalized arguments and catalog version, plus pinned overviews."""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._pinned = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_or_render(self, key: tuple, render, pinned: bool = False) -> str:
+        """Return the cached response for key, rendering and storing it on a miss; pinned ones are never evicted."""
+        if pinned:
+            value = self._pinned.get(key)
+            if value is None:
+                self.misses += 1
+                value = render()
+                if self.max_entries > 0:
+                    self._pinned[key] = value
+            else:
+                self.hits += 1
+            return value
+        try:
+            value = self._entries[key]
+        except KeyError:
+            self.misses += 1
+            value = render()
+            if self.max_entries > 0:
+                self._entries[key] = value
+                if len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+                    self.evictions += 1
+            return value
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return value
+
+    def clear(self) -> None:
+        """Drop every cached response, e.g. after a catalog reload."""
+        self._entries.clear()
+        self._pinned.clear()
+
+    def stats(self) -> dict:
+        """Return hit/miss/eviction counters and the current size."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "pinned": len(self._pinned),
+        }
+
+
+_RESPONSE_CACHE = _ResponseCache(RESPONSE_CACHE_SIZE)
+
+
+def _memoize_response(render, pinned: bool = False):
+    """Cache a pure render function of (catalog, *normalized_args) per catalog version."""
+
+    @wraps(render)
+    def wrapper(catalog, *args):
+        key = (render.__name__, catalog.version, args)
+        return _RESPONSE_CACHE.get_or_render(key, lambda: render(catalog, *args), pinned)
+
+    return wrapper
+
+
+def _pin_response(render):
+    """Cache an argument-free overview render outside the LRU, so a stream of distinct searches cannot evict it."""
+    return _memoize_response(render, pinned=True)
+
+
+def _warm_response_cache(catalog: _Catalog) -> None:
+    """Precompute the overview responses, which are the most frequently requested."""
+    _render_category_overview(catalog)
+    _render_design_overview(catalog)
+
+
+@_pin_response
+def _render_category_overview(catalog: _Catalog) -> str:
+    """Render the list_tool_categories overview."""
+    overview_lines = []
+    for cat, tools in sorted(catalog.category_lookup.items()):
+        overview_lines.append(f"- {cat} ({len(tools)} tools)")
+    content = "\n".join(overview_lines)
+    return f"""📁 Available Categories:
+{content}
+
+Tip: Pass category=\"{next(iter(catalog.category_lookup))}\" to expand a category."""
+
+
+@_memoize_response
+def _render_category(catalog: _Catalog, category: str, offset: int, limit: int) -> str:
+    """Render one page of a category's members, without the per-call timestamp."""
+    members = catalog.category_lookup[category]
+    page = members[offset : offset + limit]
+    items = "\n".join(f"- {tool}" for tool in page) if page else "- (none)"
+    paging = ""
+    if not page:
+        paging = f"\nOffset {offset} is past the last of {len(members)} tools"
+    elif offset or len(members) > offset + limit:
+        paging = f"\nShowing {offset + 1}-{offset + len(page)} of {len(members)}"
+        if len(members) > offset + limit:
+            paging += f' (pass offset="{offset + limit}" for more)'
+    return f"""📊 Category: {category}
+
+Tools:
+{items}{paging}"""
+
+
+@_pin_response
+def _render_category_overview_json(catalog: _Catalog) -> str:
+    """Render the list_tool_categories overview as JSON."""
+    return _to_json(
+        {"categories": [{"name": cat, "tools": len(tools)} for cat, tools in sorted(catalog.category_lookup.items())]}
+    )
+
+
+@_memoize_response
+def _render_category_json(catalog: _Catalog, category: str, offset: int, limit: int) -> str:
+    """Render one page of a category as JSON, without the per-call timestamp."""
+    members = catalog.category_lookup[category]
+    return _to_json(
+        {
+            "category": category,
+            "tools": members[offset : offset + limit],
+            "offset": offset,
+            "limit": limit,
+            "total": len(members),
+        }
+    )
+
+
+@mcp.tool()
+@_instrumented
+@_with_output_format
+async def list_tool_categories(category: str = "", offset: str = "", limit: str = "", output_format: str = "") -> str:
+    """List available tool categories and members, paginating large categories."""
+    catalog = _get_catalog()
+    as_json = _wants_json(output_format)
+    if category.strip():
+        matched = catalog.category_index.get(_normalize_key(category))
+        if not matched:
+            return f"❌ Error: Unknown category '{category}'."
+        try:
+            start = _parse_count(offset, 0, "offset")
+            page_size = _parse_count(limit, CATEGORY_PAGE_SIZE, "limit", minimum=1)
+        except ValueError as exc:
+            return f"❌ Error: {exc}."
+        if as_json:
+            page = _render_category_json(catalog, matched, start, page_size)
+            return page[:-1] + ',"timestamp":' + _to_json(_format_timestamp()) + "}"
+        return f"""{_render_category(catalog, matched, start, page_size)}
+
+Timestamp: {_format_timestamp()}"""
+
+    if as_json:
+        return _render_category_overview_json(catalog)
+    return _render_category_overview(catalog)
+
+
+def _resolve_tool(catalog: _Catalog, name: str) -> tuple:
+    """Resolve a tool name or alias to (entry, fuzzy_matched, suggestions); entry is None when nothing fits."""
+    normalized = _normalize_key(name)
+    entry = catalog.tool_lookup.get(normalized)
+    if entry:
+        return entry, False, []
+    resolved, suggestions = catalog.tool_fuzzy.resolve(normalized)
+    if not resolved:
+        return None, False, suggestions
+    return catalog.tool_lookup[resolved], True, []
+
+
+@mcp.tool()
+@_instrumented
+@_with_output_format
+async def fetch_tool_reference(tool: str = "", include_status: str = "", output_format: str = "") -> str:
+    """Retrieve documentation details for a tooling name."""
+    catalog = _get_catalog()
+    if not tool.strip():
+        return "❌ Error: Tool name is required."
+    entry, matched, suggestions = _resolve_tool(catalog, tool)
+    if not entry:
+        return f"❌ Error: Tool '{tool}' is not in the curated catalog.{_did_you_mean(suggestions)}"
+    matched_note = f"🔁 Matched '{tool}' to {entry.label}\n" if matched else ""
+
+    status_line = ""
+    if include_status.strip().lower() in {"1", "true", "yes"}:
+        result, age = await _get_status(entry.homepage)
+        if _wants_json(output_format):
+            status_line = _to_json({**result, "age": round(age, 1)})
+        else:
+            status_line = _format_status_line(result, age)
+
+    if _wants_json(output_format):
+        parts = ['{"tool":', catalog.json_entries["tool"][_normalize_key(entry.key)]]
+        if matched_note:
+            parts += [',"matched":', _to_json(tool)]
+        if status_line:
+            parts += [',"status":', status_line]
+        parts.append("}")
+        return "".join(parts)
+
+    cli_lines = "\n".join(f"- {cmd}" for cmd in entry.cli)
+    result = f"""{matched_note}✅ {entry.label} ({entry.category})
+Summary: {entry.summary}
+Docs: {entry.homepage}
+CLI Setup:
+{cli_lines}"""
+    if status_line:
+        result = f"{result}\n{status_line}"
+    return result
+
+
+DOCS_KINDS = {"tool": "tool", "tools": "tool", "framework": "framework", "frameworks": "framework"}
+DOCS_KINDS.update({"deployment": "deployment", "provider": "deployment", "deployments": "deployment"})
+
+
+def _docs_target(catalog: _Catalog, name: str, kind: str) -> tuple:
+    """Resolve a catalog name or documentation URL to (label, url, fuzzy_matched, suggestions)."""
+    if name.startswith(("http://", "https://")):
+        for url, label in _catalog_urls(catalog):
+            if url == name:
+                return label, url, False, []
+        return "", "", False, []
+    sections = {
+        "tool": (catalog.tool_lookup, catalog.tool_fuzzy, "homepage"),
+        "framework": (catalog.frameworks, catalog.framework_fuzzy, "docs"),
+        "deployment": (catalog.deployments, catalog.provider_fuzzy, "docs"),
+    }
+    kinds = [kind] if kind else list(sections)
+    normalized = _normalize_key(name)
+    for section in kinds:
+        entries, _, field = sections[section]
+        if normalized in entries:
+            entry = entries[normalized]
+            return entry.label, getattr(entry, field), False, []
+    suggestions = []
+    for section in kinds:
+        entries, fuzzy, field = sections[section]
+        resolved, found = fuzzy.resolve(normalized)
+        if resolved:
+            entry = entries[resolved]
+            return entry.label, getattr(entry, field), True, []
+        suggestions += [label for label in found if label not in suggestions]
+    return "", "", False, suggestions[:5]
+
+
+@mcp.tool()
+@_instrumented
+@_with_output_format
+async def fetch_docs_excerpt(
+    name: str = "", kind: str = "", max_chars: str = "", refresh: str = "", output_format: str = ""
+) -> str:
+    """Fetch the docs page of a tool, framework, or provider as text, up to FULLSTACK_WEBDEV_DOCS_EXCERPT_CHARS."""
+    if not name.strip():
+        return "❌ Error: Name is required."
+    section = DOCS_KINDS.get(kind.strip().lower(), "") if kind.strip() else ""
+    if kind.strip() and not section:
+        return f"❌ Error: Unknown kind '{kind}'. Try one of: tool, framework, deployment."
+    try:
+        limit = _parse_count(max_chars, DOCS_EXCERPT_CHARS, "max_chars", minimum=1)
+        if limit > DOCS_EXCERPT_CHARS:
+            # Only DOCS_EXCERPT_CHARS characters of each page are extracted and cached.
+            raise ValueError(f"max_chars must be at most {DOCS_EXCERPT_CHARS}")
+    except ValueError as exc:
+        return f"❌ Error: {exc}."
+    label, url, matched, suggestions = _docs_target(_get_catalog(), name.strip(), section)
+    if not url:
+        return f"❌ Error: '{name}' is not in the curated catalog.{_did_you_mean(suggestions)}"
+    try:
+        record, outcome = await _docs_excerpt(url, refresh.strip().lower() in {"1", "true", "yes"})
+    except ValueError as exc:
+        return f"❌ Error: {exc}."
+    excerpt = _trim_text(record["excerpt"], limit)
+    age = max(0.0, time.time() - record["fetched"])
+    cache, _, refresh_error = outcome.partition(" ")
+    if _wants_json(output_format):
+        payload = {
+            "name": label,
+            "url": url,
+            "title": record["title"],
+            "cache": cache,
+            "age": round(age, 1),
+            "bytes": record["bytes"],
+            "truncated": record["truncated"],
+            "excerpt": excerpt,
+        }
+        if refresh_error:
+            payload["refresh_error"] = refresh_error.strip("()")
+        if matched:
+            payload["matched"] = name
+        return _to_json(payload)
+    if cache == "hit":
+        cache_line = f"cached on disk (fetched {_format_age(age)} ago)"
+    elif cache == "revalidated":
+        cache_line = f"revalidated, not modified (fetched {_format_age(age)} ago)"
+    elif cache == "stale":
+        cache_line = f"stale copy from {_format_age(age)} ago, refresh failed: {refresh_error.strip('()')}"
+    else:
+        capped = " (stopped at size cap)" if record["truncated"] else ""
+        cache_line = f"downloaded {record['bytes'] / 1024:.0f} KB{capped}"
+    matched_note = f"🔁 Matched '{name}' to {label}\n" if matched else ""
+    title = f"Title: {record['title']}\n" if record["title"] else ""
+    return f"""{matched_note}📄 {label} Docs Excerpt
+Source: {url}
+{title}Cache: {cache_line}
+Excerpt:
+{excerpt or "(no readable text found)"}"""
+
+
+@_memoize_response
+def _render_quickstart(catalog: _Catalog, framework: str, package_manager: str) -> str:
+    """Render quickstart commands for a resolved framework key and package manager."""
+    starter = catalog.frameworks[framework]
+    post_lines = "\n".join(f"- {step}" for step in starter.post)
+    return f"""⚡ {starter.label} Quickstart
+Command: {starter.commands[package_manager]}
+Next Steps:
+{post_lines}
+Docs: {starter.docs}"""
+
+
+@mcp.tool()
+@_instrumented
+@_with_output_format
+async def framework_quickstart(framework: str = "", package_manager: str = "", output_format: str = "") -> str:
+    """Provide quickstart commands for a framework."""
+    catalog = _get_catalog()
+    if not framework.strip():
+        return "❌ Error: Framework name is required."
+    normalized = _normalize_key(framework)
+    starter = catalog.frameworks.get(normalized)
+    matched_note = ""
+    if not starter:
+        resolved, suggestions = catalog.framework_fuzzy.resolve(normalized)
+        if not resolved:
+            return f"❌ Error: Framework '{framework}' is not supported.{_did_you_mean(suggestions)}"
+        starter = catalog.frameworks[resolved]
+        matched_note = f"🔁 Matched '{framework}' to {starter.label}\n"
+        normalized = resolved
+    pm = package_manager.strip().lower() if package_manager.strip() else "npm"
+    if pm not in starter.commands:
+        available = ", ".join(starter.commands.keys())
+        return f"❌ Error: Package manager '{package_manager}' not supported. Try one of: {available}."
+    if _wants_json(output_format):
+        parts = [
+            '{"framework":',
+            catalog.json_entries["framework"][normalized],
+            ',"package_manager":',
+            _to_json(pm),
+            ',"command":',
+            _to_json(starter.commands[pm]),
+        ]
+        if matched_note:
+            parts += [',"matched":', _to_json(framework)]
+        parts.append("}")
+        return "".join(parts)
+    return f"{matched_note}{_render_quickstart(catalog, normalized, pm)}"
+
+
+PACKAGE_MANAGER_COMMANDS = {
+    "npm": {
+        "runtime": "npm install",
+        "dev": "npm install --save-dev",
+        "global": "npm install -g",
+        "create": "npm create",
+        "exec": "npx",
+        "dlx": "npx",
+    },
+    "pnpm": {
+        "runtime": "pnpm add",
+        "dev": "pnpm add -D",
+        "global": "pnpm add -g",
+        "create": "pnpm create",
+        "exec": "pnpm exec",
+        "dlx": "pnpm dlx",
+    },
+    "yarn": {
+        "runtime": "yarn add",
+        "dev": "yarn add -D",
+        "global": "npm install -g",
+        "create": "yarn create",
+        "exec": "yarn",
+        "dlx": "yarn dlx",
+    },
+    "bun": {
+        "runtime": "bun add",
+        "dev": "bun add -d",
+        "global": "bun add -g",
+        "create": "bun create",
+        "exec": "bunx",
+        "dlx": "bunx",
+    },
+}
+# Yarn commands, including the FRAMEWORK_STARTERS ones (yarn dlx), follow Yarn 2+; it has no global installs.
+PACKAGE_MANAGER_NOTES = {
+    "yarn": "Commands use Yarn 2+ (Berry) syntax; global CLIs are installed with npm since Yarn 2+ has no global add.",
+}
+# Steps run phase by phase, so every step comes after everything it can depend on.
+INSTALL_PHASES = {
+    "system": "Runtime",
+    "toolchain": "Package manager",
+    "app": "Scaffold app",
+    "scaffold": "Scaffold",
+    "global": "Global CLIs",
+    "runtime": "Dependencies",
+    "dev": "Dev dependencies",
+    "init": "Initialize",
+    "other": "Other",
+}
+_DEV_FLAGS = frozenset({"-D", "--save-dev", "--dev", "-d"})
+
+
+def _package_name(spec: str) -> str:
+    """Strip the version from a package spec, e.g. "@react-three/fiber@8" -> "@react-three/fiber"."""
+    head, at, _ = spec[1:].partition("@")
+    return spec[0] + head if at else spec
+
+
+def _classify_cli(command: str) -> tuple:
+    """Split an npm-style catalog command into (phase, packages or arguments); other commands are kept verbatim."""
+    words = command.split()
+    if not words or words[0] not in {"npm", "npx"} or "|" in words or "&&" in words:
+        return ("system" if words and words[0] in {"curl", "sudo", "apt-get", "brew"} else "other"), command
+    if words[0] == "npx" and len(words) > 1:
+        return ("scaffold" if _package_name(words[1]).startswith("create-") else "init"), words[1:]
+    if len(words) > 2 and words[1] in {"create", "init"}:
+        return "scaffold", words[2:]
+    if len(words) > 1 and words[1] in {"install", "i", "add"}:
+        flags = {word for word in words[2:] if word.startswith("-")}
+        packages = [word for word in words[2:] if not word.startswith("-")]
+        if packages and flags & {"-g", "--global"}:
+            return "global", packages
+        if packages and not flags - _DEV_FLAGS:
+            return ("dev" if flags else "runtime"), packages
+    return "other", command
+
+
+def _framework_starter(catalog: _Catalog, entry: ToolEntry):
+    """Return the quickstart starter for a tool that is also a framework, or None."""
+    for name in (entry.key, *entry.aliases):
+        starter = catalog.frameworks.get(_normalize_key(name))
+        if starter is not None:
+            return starter
+    return None
+
+
+def _install_plan(catalog: _Catalog, keys: tuple, package_manager: str) -> dict:
+    """Merge the catalog commands of the given tools into as few steps as possible, ordered by phase."""
+    commands = PACKAGE_MANAGER_COMMANDS[package_manager]
+    entries = [catalog.tool_lookup[key] for key in keys]
+    steps = []
+    notes = []
+    merged = {phase: {} for phase in ("global", "runtime", "dev")}
+    owners = {phase: [] for phase in merged}
+    original = 0
+    app = None
+    for entry in entries:
+        starter = _framework_starter(catalog, entry)
+        if starter is not None and package_manager in starter.commands:
+            original += len(entry.cli)
+            if app is not None:
+                notes.append(f"Skipped scaffolding {entry.label}: {app.label} already creates the project.")
+                continue
+            app = entry
+            steps.append({"phase": "app", "command": starter.commands[package_manager], "tools": [entry.label]})
+            directory = next((step for step in starter.post if step.startswith("cd ")), "")
+            if directory:
+                steps.append({"phase": "app", "command": directory, "tools": [entry.label]})
+            continue
+        for command in entry.cli:
+            original += 1
+            phase, detail = _classify_cli(command)
+            if phase == "global" and all(_package_name(name) in PACKAGE_MANAGER_COMMANDS for name in detail):
+                # A package manager cannot install itself, so this stays an npm command that runs early.
+                phase, detail = "toolchain", command
+            if phase in merged:
+                for name in detail:
+                    merged[phase].setdefault(_package_name(name), name)
+                owners[phase].append(entry.label)
+            elif phase in {"scaffold", "init"}:
+                steps.append({"phase": phase, "command": "", "tools": [entry.label], "words": detail})
+            else:
+                steps.append({"phase": phase, "command": detail, "tools": [entry.label]})
+    # A package one tool needs at runtime and another as a dev dependency is installed once, at runtime.
+    for name in merged["runtime"]:
+        merged["dev"].pop(name, None)
+    for phase, packages in merged.items():
+        if packages:
+            command = f"{commands[phase]} {' '.join(packages.values())}"
+            steps.append({"phase": phase, "command": command, "tools": list(dict.fromkeys(owners[phase]))})
+    local = merged["runtime"].keys() | merged["dev"].keys()
+    for step in steps:
+        words = step.pop("words", None)
+        if words is None:
+            continue
+        if step["phase"] == "scaffold" and not _package_name(words[0]).startswith("create-"):
+            step["command"] = f"{commands['create']} {' '.join(words)}"
+        else:
+            runner = commands["exec"] if _package_name(words[0]) in local else commands["dlx"]
+            step["command"] = f"{runner} {' '.join(words)}"
+    ranks = {phase: rank for rank, phase in enumerate(INSTALL_PHASES)}
+    steps.sort(key=lambda step: ranks[step["phase"]])
+    if package_manager in PACKAGE_MANAGER_NOTES:
+        notes.append(PACKAGE_MANAGER_NOTES[package_manager])
+    if app is None and any(step["phase"] in {"runtime", "dev", "init"} for step in steps):
+        notes.append("No framework was listed, so run these steps inside an existing project.")
+    return {
+        "package_manager": package_manager,
+        "tools": [entry.label for entry in entries],
+        "steps": steps,
+        "catalog_commands": original,
+        "notes": notes,
+    }
+
+
+@_memoize_response
+def _render_install_plan(catalog: _Catalog, keys: tuple, package_manager: str) -> str:
+    """Render the merged install plan for resolved tool keys and a package manager."""
+    plan = _install_plan(catalog, keys, package_manager)
+    lines = [
+        f"{position}. {step['command']}  [{INSTALL_PHASES[step['phase']]}: {', '.join(step['tools'])}]"
+        for position, step in enumerate(plan["steps"], 1)
+    ]
+    joined = "\n".join(lines) or "- Nothing to install."
+    result = f"""📦 Install Plan ({package_manager})
+Tools: {', '.join(plan['tools'])}
+Steps:
+{joined}
+Merged {plan['catalog_commands']} catalog commands into {len(plan['steps'])} steps."""
+    if plan["notes"]:
+        result += "\nNotes:\n" + "\n".join(f"- {note}" for note in plan["notes"])
+    return result
+
+
+@_memoize_response
+def _render_install_plan_json(catalog: _Catalog, keys: tuple, package_manager: str) -> str:
+    """Render the merged install plan as JSON."""
+    return _to_json(_install_plan(catalog, keys, package_manager))
+
+
+@mcp.tool()
+@_instrumented
+@_with_output_format
+async def install_plan(tools: str = "", package_manager: str = "", output_format: str = "") -> str:
+    """Merge the install commands of comma-separated catalog tools into one ordered setup plan."""
+    names = [name.strip() for name in tools.split(",") if name.strip()]
+    if not names:
+        return "❌ Error: Provide comma-separated tool names, e.g. 'next.js, prisma, tailwind'."
+    if len(names) > BATCH_MAX_ITEMS:
+        return f"❌ Error: at most {BATCH_MAX_ITEMS} tools per call (got {len(names)})."
+    catalog = _get_catalog()
+    supported = list(PACKAGE_MANAGER_COMMANDS)
+    pm = package_manager.strip().lower() if package_manager.strip() else "npm"
+    if pm not in supported:
+        return f"❌ Error: Package manager '{package_manager}' not supported. Try one of: {', '.join(supported)}."
+    keys = []
+    matched = {}
+    for name in names:
+        entry, fuzzy, suggestions = _resolve_tool(catalog, name)
+        if not entry:
+            return f"❌ Error: Tool '{name}' is not in the curated catalog.{_did_you_mean(suggestions)}"
+        if fuzzy:
+            matched[name] = entry.label
+        keys.append(_normalize_key(entry.key))
+    keys = tuple(dict.fromkeys(keys))
+    if _wants_json(output_format):
+        result = _render_install_plan_json(catalog, keys, pm)
+        return f"{result[:-1]},\"matched\":{_to_json(matched)}}}" if matched else result
+    matched_note = "".join(f"🔁 Matched '{name}' to {label}\n" for name, label in matched.items())
+    return f"{matched_note}{_render_install_plan(catalog, keys, pm)}"
+
+
+GENERAL_RECIPE = Recipe(
+    id="general",
+    match=(),
+    summary="General purpose full-stack setup suitable for most product MVPs.",
+    frontend="Next.js + Tailwind CSS + Radix Primitives",
+    backend="Prisma with a hosted Postgres (Neon) via Supabase connection pooling",
+    infrastructure="Deploy frontend and server actions on Vercel; use Turborepo if monorepo grows.",
+    extras=(
+        "Add Auth.js for authentication flows",
+        "Add Stripe or Resend depending on payments or email needs",
+    ),
+)
+
+
+@mcp.tool()
+@_instrumented
+@_with_output_format
+async def recommend_stack(
+    project: str = "", experience: str = "", realtime: str = "", limit: str = "", output_format: str = ""
+) -> str:
+    """Rank stack recipes against a project description and recommend the best fit or a combination."""
+    if not project.strip():
+        return "❌ Error: Provide a brief project description."
+    try:
+        top_k = _parse_count(limit, 3, "limit", minimum=1)
+    except ValueError as exc:
+        return f"❌ Error: {exc}."
+    realtime_enabled = realtime.strip().lower() in {"yes", "true", "1", "enabled"}
+    experience_level = experience.strip().lower() if experience.strip() else "intermediate"
+
+    ranked = _get_catalog().recipe_index.rank(project, max(top_k, RECIPE_MAX_COMPOSE))
+    composed = _compose_recipes(ranked)
+    chosen = composed[0][1] if composed else GENERAL_RECIPE
+    secondary = [recipe for _, recipe, _ in composed[1:]]
+
+    extras = list(chosen.extras)
+    for recipe in secondary:
+        extras.extend(item for item in recipe.extras if item not in extras)
+    covered_text = " ".join([*extras, *(recipe.backend for recipe in secondary)])
+    if realtime_enabled and "Socket.IO" not in covered_text:
+        extras.append("Integrate Socket.IO or Ably for realtime features")
+    if experience_level in {"beginner", "junior"}:
+        extras.append("Prioritize npm scripts and avoid complex monorepo setups initially")
+    elif experience_level in {"senior", "expert"}:
+        extras.append("Consider Turborepo with pnpm workspaces for scalable builds")
+
+    if _wants_json(output_format):
+        return _to_json(
+            {
+                "summary": chosen.summary,
+                "frontend": chosen.frontend,
+                "backend": chosen.backend,
+                "infrastructure": chosen.infrastructure,
+                "extras": extras,
+                "combines": [recipe.id for _, recipe, _ in composed],
+                "also": [
+                    {"id": recipe.id, "backend": recipe.backend, "infrastructure": recipe.infrastructure}
+                    for recipe in secondary
+                ],
+                "ranking": [
+                    {"id": recipe.id, "score": round(score, 3), "matched": list(terms)}
+                    for score, recipe, terms in ranked[:top_k]
+                ],
+            }
+        )
+
+    combination = ""
+    if secondary:
+        labels = " + ".join(_recipe_label(recipe) for _, recipe, _ in composed)
+        also_lines = "\n".join(
+            f"- {_recipe_label(recipe)}: {recipe.backend}; {recipe.infrastructure}" for recipe in secondary
+        )
+        combination = f"\nCombines: {labels}\nAlso Add:\n{also_lines}"
+    if ranked:
+        ranking_lines = "\n".join(
+            f"- {_recipe_label(recipe)} (score {score:.2f}, matched: {', '.join(terms)})"
+            for score, recipe, terms in ranked[:top_k]
+        )
+    else:
+        ranking_lines = "- No recipe matched; showing the general-purpose stack"
+    extras_lines = "\n".join(f"- {item}" for item in extras)
+    return f"""✅ Recommended Stack
+Summary: {chosen.summary}
+Frontend: {chosen.frontend}
+Backend: {chosen.backend}
+Infrastructure: {chosen.infrastructure}{combination}
+Extras:
+{extras_lines}
+Ranking:
+{ranking_lines}"""
+
+
+@_memoize_response
+def _render_checklist(catalog: _Catalog, provider: str, preview_enabled: bool) -> str:
+    """Render the deployment checklist for a resolved provider key."""
+    entry = catalog.deployments[provider]
+    steps = "\n".join(f"- {step}" for step in entry.steps)
+    notes = "\n".join(f"- {note}" for note in entry.notes)
+    preview_hint = ""
+    if preview_enabled:
+        preview_hint = "\nPreview Mode: Enable preview deployments by linking feature branches."
+    return f"""🚀 {entry.label} Deployment Checklist
+Docs: {entry.docs}
+Steps:
+{steps}
+Notes:
+{notes}{preview_hint}"""
+
+
+@mcp.tool()
+@_instrumented
+@_with_output_format
+async def deployment_checklist(provider: str = "", preview: str = "", output_format: str = "") -> str:
+    """Return deployment checklist for a hosting provider."""
+    selected = provider.strip().lower() if provider.strip() else DEFAULT_PROVIDER
+    catalog = _get_catalog()
+    key = selected
+    if key not in catalog.deployments and selected == DEFAULT_PROVIDER:
+        key = "vercel"
+    matched_note = ""
+    if key not in catalog.deployments:
+        key, suggestions = catalog.provider_fuzzy.resolve(selected)
+        if not key:
+            options = ", ".join(sorted(catalog.deployments.keys()))
+            hint = _did_you_mean(suggestions)
+            return f"❌ Error: Unknown provider '{provider}'. Supported providers: {options}.{hint}"
+        matched_note = f"🔁 Matched '{provider}' to {catalog.deployments[key].label}\n"
+    preview_enabled = preview.strip().lower() in {"yes", "true", "1"}
+    if _wants_json(output_format):
+        parts = ['{"deployment":', catalog.json_entries["deployment"][key], ',"preview":', _to_json(preview_enabled)]
+        if matched_note:
+            parts += [',"matched":', _to_json(provider)]
+        parts.append("}")
+        return "".join(parts)
+    return f"{matched_note}{_render_checklist(catalog, key, preview_enabled)}"
+
+
+def _design_matches(catalog: _Catalog, query: str) -> list:
+    """Return (category label, source) pairs, in catalog order, whose label contains a normalized query."""
+    return [(entry.label, item) for entry in catalog.design for item in entry.items if query in item.label.lower()]
+
+
+@_memoize_response
+def _render_design_search(catalog: _Catalog, query: str) -> str:
+    """Render the source lines matching a normalized query, or an empty string when none match."""
+    matches = _design_matches(catalog, query)
+    return "\n".join(f"- {item.label} ({category_label}) → {item.url}" for category_label, item in matches)
+
+
+@_memoize_response
+def _render_design_category(catalog: _Catalog, category: str) -> str:
+    """Render one design knowledge category, or an empty string when it is unknown."""
+    entry = catalog.design_index.get(category)
+    if not entry:
+        return ""
+    lines = [f"- {item.label} → {item.url}" for item in entry.items]
+    content = "\n".join(lines)
+    return f"""🧠 {entry.label}
+Summary: {entry.summary}
+Sources:
+{content}"""
+
+
+@_pin_response
+def _render_design_overview(catalog: _Catalog) -> str:
+    """Render the design_knowledge_sources overview."""
+    overview = "\n".join(
+        f"- {entry.label} ({len(entry.items)} sources)" for entry in catalog.design
+    )
+    return f"""🧠 Design Knowledge Catalog
+Scope: Comprehensive references for color theory, typography, brand psychology, and design systems.
+Categories:
+{overview}
+
+Tip: Pass category=\"color theory\" or search=\"typography\" to drill down."""
+
+
+@_memoize_response
+def _render_design_search_json(catalog: _Catalog, query: str) -> str:
+    """Render the sources matching a normalized query as a JSON array, or an empty string when none match."""
+    matches = _design_matches(catalog, query)
+    if not matches:
+        return ""
+    return _to_json(
+        [{"label": item.label, "url": item.url, "category": category_label} for category_label, item in matches]
+    )
+
+
+@_pin_response
+def _render_design_overview_json(catalog: _Catalog) -> str:
+    """Render the design_knowledge_sources overview as JSON."""
+    return _to_json(
+        {
+            "categories": [
+                {"key": entry.key, "label": entry.label, "sources": len(entry.items)}
+                for entry in catalog.design
+            ]
+        }
+    )
+
+
+@mcp.tool()
+@_instrumented
+@_with_output_format
+async def design_knowledge_sources(category: str = "", search: str = "", output_format: str = "") -> str:
+    """Return curated design knowledge references covering color, typography, brands, and systems."""
+    catalog = _get_catalog()
+    normalized_category = _normalize_key(category) if category.strip() else ""
+    normalized_search = search.strip().lower()
+    as_json = _wants_json(output_format)
+
+    if normalized_search:
+        # Matches are cached per normalized query; the reply echoes the search as the caller wrote it.
+        if as_json:
+            sources = _render_design_search_json(catalog, normalized_search)
+        else:
+            sources = _render_design_search(catalog, normalized_search)
+        if not sources:
+            return f"❌ No sources matched search '{search}'."
+        if as_json:
+            return '{"query":' + _to_json(search) + ',"sources":' + sources + "}"
+        return f"""🧠 Design Knowledge Search Results
+Query: {search}
+Sources:
+{sources}"""
+
+    if normalized_category:
+        entry = catalog.design_index.get(normalized_category)
+        if as_json and entry:
+            return '{"category":' + catalog.json_entries["design"][_normalize_key(entry.key)] + "}"
+        response = _render_design_category(catalog, normalized_category)
+        if not response:
+            available = ", ".join(sorted(e.label for e in catalog.design))
+            return f"❌ Unknown category '{category}'. Available categories: {available}."
+        return response
+
+    if as_json:
+        return _render_design_overview_json(catalog)
+    return _render_design_overview(catalog)
+
+
+@mcp.tool()
+@_instrumented
+@_with_output_format
+async def search_catalog(query: str = "", kind: str = "", limit: str = "", output_format: str = "") -> str:
+    """Search tools, frameworks, deployments, stack recipes and design sources by keyword."""
+    if not query.strip():
+        return "❌ Error: Search query is required."
+    try:
+        top_k = _parse_count(limit, 10, "limit", minimum=1)
+    except ValueError as exc:
+        return f"❌ Error: {exc}."
+    kinds = None
+    if kind.strip():
+        normalized_kind = _normalize_key(kind)
+        kinds = {name for name in SEARCH_KINDS if name.lower().startswith(normalized_kind)}
+        if not kinds:
+            return f"❌ Error: Unknown kind '{kind}'. Try one of: {', '.join(SEARCH_KINDS)}."
+    results = _get_catalog().search_index.search(query, limit=top_k, kinds=kinds)
+    if not results:
+        return f"❌ No catalog entries matched '{query}'."
+    if _wants_json(output_format):
+        matches = [
+            {
+                "kind": document["kind"],
+                "title": document["title"],
+                "summary": document["summary"],
+                "url": document["url"],
+                "score": round(score, 4),
+            }
+            for score, document in results
+        ]
+        return _to_json({"query": query, "results": matches})
+    lines = []
+    for score, document in results:
+        link = f" → {document['url']}" if document["url"] else ""
+        lines.append(f"- [{document['kind']}] {document['title']}: {document['summary']}{link} (score {score:.2f})")
+    joined = "\n".join(lines)
+    return f"""🔎 Catalog Search Results
+Query: {query}
+Top {len(results)} matches:
+{joined}"""
+
+
+def _related_label(term: str) -> str:
+    """Render a similarity feature for display, e.g. "recipe:saas-dashboard" -> "recipe saas-dashboard"."""
+    if term.startswith("category:"):
+        return "same category"
+    return term.replace(":", " ", 1)
+
+
+@mcp.tool()
+@_instrumented
+@_with_output_format
+async def related_tools(tool: str = "", limit: str = "", output_format: str = "") -> str:
+    """List the catalog tools most similar to one or more comma-separated tool names."""
+    names = [name.strip() for name in tool.split(",") if name.strip()]
+    if not names:
+        return "❌ Error: Tool name is required."
+    if len(names) > BATCH_MAX_ITEMS:
+        return f"❌ Error: at most {BATCH_MAX_ITEMS} tools per call (got {len(names)})."
+    try:
+        top_k = _parse_count(limit, 5, "limit", minimum=1)
+    except ValueError as exc:
+        return f"❌ Error: {exc}."
+    catalog = _get_catalog()
+    try:
+        index = catalog.related_index
+    except ImportError:
+        return "❌ Error: related_tools needs NumPy; install it with 'pip install numpy'."
+    queries = []
+    for name in names:
+        entry, matched, suggestions = _resolve_tool(catalog, name)
+        if not entry:
+            queries.append((name, None, f"Tool '{name}' is not in the curated catalog.{_did_you_mean(suggestions)}"))
+            continue
+        queries.append((name, index.rows[_normalize_key(entry.key)], matched))
+    found = [row for _, row, _ in queries if row is not None]
+    if not found:
+        if len(queries) == 1:
+            return f"❌ Error: {queries[0][2]}"
+        return "❌ Error: None of the tools are in the curated catalog."
+    neighbors = index.related(found, top_k)
+    if _wants_json(output_format):
+        results = []
+        for name, row, note in queries:
+            if row is None:
+                results.append({"query": name, "error": note})
+                continue
+            related = [
+                {
+                    "tool": catalog.tools[other].label,
+                    "category": catalog.tools[other].category,
+                    "score": round(score, 4),
+                    "shared": [_related_label(term) for term in index.shared_terms(row, other)],
+                }
+                for score, other in neighbors[row]
+            ]
+            result = {"query": name, "tool": catalog.tools[row].label, "related": related}
+            if note:
+                result["matched"] = True
+            results.append(result)
+        return _to_json({"results": results})
+    sections = []
+    for name, row, note in queries:
+        if row is None:
+            sections.append(f"❌ Error: {note}")
+            continue
+        entry = catalog.tools[row]
+        lines = [f"🔁 Matched '{name}' to {entry.label}"] if note else []
+        lines.append(f"🧭 Related to {entry.label} ({entry.category})")
+        for score, other in neighbors[row]:
+            shared = ", ".join(dict.fromkeys(_related_label(term) for term in index.shared_terms(row, other)))
+            neighbor = catalog.tools[other]
+            lines.append(f"- {neighbor.label} ({neighbor.category}): {shared} (score {score:.2f})")
+        if not neighbors[row]:
+            lines.append("- No related tools found.")
+        sections.append("\n".join(lines))
+    return "\n\n".join(sections)
+
+
+@mcp.tool()
+@_instrumented
+@_with_output_format
+async def check_catalog_health(
+    concurrency: str = "",
+    host_rate: str = "",
+    deadline: str = "",
+    refresh: str = "",
+    output_format: str = "",
+    ctx: Context = None,
+) -> str:
+    """Probe every catalog documentation URL concurrently and report link health; refresh=yes skips cached results."""
+    try:
+        max_concurrency = int(_parse_positive(concurrency, HEALTH_CONCURRENCY, "concurrency"))
+        rate = _parse_positive(host_rate, HEALTH_HOST_RATE, "host_rate")
+        budget = _parse_positive(deadline, HEALTH_DEADLINE, "deadline")
+    except ValueError as exc:
+        return f"❌ Error: {exc}."
+
+    targets = _catalog_urls(_get_catalog())
+    labels = dict(targets)
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+    limiter = _HostRateLimiter(rate)
+    started = time.monotonic()
+    probe_all = refresh.strip().lower() in {"1", "true", "yes"}
+    pending = [asyncio.ensure_future(_sweep_url(url, semaphore, limiter, probe_all)) for url, _ in targets]
+    lines = []
+    checks = []
+    healthy = 0
+    cached = 0
+    try:
+        for finished in asyncio.as_completed(pending, timeout=budget):
+            try:
+                url, result, elapsed, age = await finished
+            except asyncio.TimeoutError:
+                break
+            if result["code"] is not None and result["code"] < 400:
+                healthy += 1
+                icon = "✅"
+            else:
+                icon = "❌"
+            if age is None:
+                timing = f"{elapsed * 1000:.0f} ms"
+            else:
+                cached += 1
+                timing = f"cached, checked {_format_age(age)} ago"
+            line = f"- {icon} {labels[url]} → {url} | {_format_status_line(result)} ({timing})"
+            lines.append(line)
+            check = {"label": labels[url], "url": url, **result, "ms": round(elapsed * 1000, 1)}
+            check["cached"] = age is not None
+            if age is not None:
+                check["age"] = round(age, 1)
+            checks.append(check)
+            if ctx is not None:
+                await ctx.info(line)
+                await ctx.report_progress(len(lines), len(targets))
+    finally:
+        for task in pending:
+            task.cancel()
+
+    timed_out = len(targets) - len(lines)
+    if _wants_json(output_format):
+        return _to_json(
+            {
+                "checked": len(lines),
+                "total": len(targets),
+                "seconds": round(time.monotonic() - started, 3),
+                "healthy": healthy,
+                "failing": len(lines) - healthy,
+                "timed_out": timed_out,
+                "cached": cached,
+                "limits": {"concurrency": max_concurrency, "host_rate": rate, "deadline": budget},
+                "results": checks,
+                "timestamp": _format_timestamp(),
+            }
+        )
+    content = "\n".join(lines) if lines else "- No URLs finished before the deadline."
+    return f"""🩺 Catalog Health Check
+Checked: {len(lines)}/{len(targets)} URLs in {time.monotonic() - started:.2f}s
+Healthy: {healthy} | Failing: {len(lines) - healthy} | Timed Out: {timed_out} | Cached: {cached}
+Limits: concurrency={max_concurrency}, host_rate={rate:g}/s, deadline={budget:g}s
+Results:
+{content}
+
+Timestamp: {_format_timestamp()}"""
+
+
+BATCH_KINDS = {
+    "tool": (fetch_tool_reference, ("tool", "include_status")),
+    "quickstart": (framework_quickstart, ("framework", "package_manager")),
+    "checklist": (deployment_checklist, ("provider", "preview")),
+    "design": (design_knowledge_sources, ("category", "search")),
+    "recipe": (recommend_stack, ("project", "experience", "realtime")),
+    "category": (list_tool_categories, ("category", "offset", "limit")),
+    "search": (search_catalog, ("query", "kind", "limit")),
+    "docs": (fetch_docs_excerpt, ("name", "kind", "max_chars", "refresh")),
+    "related": (related_tools, ("tool", "limit")),
+    "install": (install_plan, ("tools", "package_manager")),
+}
+BATCH_KIND_ALIASES = {handler.__name__: kind for kind, (handler, _) in BATCH_KINDS.items()}
+
+
+def _parse_batch(requests: str) -> list:
+    """Decode batch_lookup requests into a list of dicts, raising ValueError for malformed input."""
+    try:
+        items = json.loads(requests)
+    except json.JSONDecodeError as exc:
+        raise ValueError(f"requests must be a JSON array ({exc.msg})") from None
+    if isinstance(items, dict):
+        items = [items]
+    if not isinstance(items, list) or not items:
+        raise ValueError("requests must be a non-empty JSON array of objects")
+    if len(items) > BATCH_MAX_ITEMS:
+        raise ValueError(f"at most {BATCH_MAX_ITEMS} requests per batch (got {len(items)})")
+    return items
+
+
+async def _resolve_batch_item(item, include_status: str, output_format: str) -> tuple:
+    """Run one batch request through its tool and return (kind, label, response); failures become error text."""
+    if not isinstance(item, dict):
+        return "invalid", "invalid", "❌ Error: Each request must be a JSON object."
+    kind = str(item.get("type", "")).strip().lower()
+    kind = BATCH_KIND_ALIASES.get(kind, kind)
+    if kind not in BATCH_KINDS:
+        return kind, kind or "invalid", f"❌ Error: Unknown type '{kind}'. Try one of: {', '.join(BATCH_KINDS)}."
+    handler, params = BATCH_KINDS[kind]
+    arguments = {
+        key: str(item[key]).lower() if isinstance(item[key], bool) else str(item[key]) for key in params if key in item
+    }
+    label = " ".join([kind, *(arguments[key] for key in params[:1] if arguments.get(key))])
+    unknown = sorted(set(item) - set(params) - {"type"})
+    if unknown:
+        allowed = ", ".join(params)
+        return kind, label, f"❌ Error: Unexpected field(s) for {kind}: {', '.join(unknown)}. Allowed: {allowed}."
+    if kind == "tool" and "include_status" not in arguments:
+        arguments["include_status"] = include_status
+    try:
+        return kind, label, await handler(**arguments, output_format=output_format)
+    except Exception as exc:
+        logger.exception("Batch item %s failed", label)
+        return kind, label, f"❌ Error: {exc or exc.__class__.__name__}."
+
+
+@mcp.tool()
+@_instrumented
+@_with_output_format
+async def batch_lookup(requests: str = "", include_status: str = "", output_format: str = "") -> str:
+    """Resolve several catalog lookups (tool, quickstart, checklist, search, install and more) in one call."""
+    if not requests.strip():
+        return (
+            "❌ Error: Provide requests as a JSON array, e.g. "
+            '[{"type": "tool", "tool": "prisma"}, {"type": "quickstart", "framework": "next.js"}].'
+        )
+    try:
+        items = _parse_batch(requests)
+    except ValueError as exc:
+        return f"❌ Error: {exc}."
+    # Items run concurrently, so status checks for different tools overlap instead of queueing.
+    results = await asyncio.gather(*(_resolve_batch_item(item, include_status, output_format) for item in items))
+    if _wants_json(output_format):
+        # Item responses are already JSON, so they are spliced in rather than decoded and re-encoded.
+        entries = []
+        for kind, label, response in results:
+            ok = not response.startswith(ERROR_PREFIXES)
+            result = response if not response.startswith("❌") else _json_error(response)
+            entries.append(
+                '{"type":' + _to_json(kind) + ',"label":' + _to_json(label) + ',"ok":' + _to_json(ok)
+                + ',"result":' + result + "}"
+            )
+        return '{"results":[' + ",".join(entries) + "]}"
+    failed = sum(1 for _, _, response in results if response.startswith("❌"))
+    sections = "\n\n".join(
+        f"[{index}] {label}\n{response}" for index, (_, label, response) in enumerate(results, 1)
+    )
+    return f"📦 Batch Lookup ({len(results)} requests, {failed} failed)\n\n{sections}"
+
+
+@mcp.tool()
+@_instrumented
+@_with_output_format
+async def server_metrics(output_format: str = "") -> str:
+    """Report per-tool latency, cache counters, and HTTP client statistics."""
+    stats = _STATUS_CACHE.stats()
+    catalog = _get_catalog()
+    served = stats["hits"] + stats["coalesced"] + stats["stale"]
+    lookups = served + stats["misses"]
+    hit_rate = served / lookups * 100 if lookups else 0.0
+    responses = _RESPONSE_CACHE.stats()
+    docs = _DOCS_CACHE.stats()
+    rendered = responses["hits"] + responses["misses"]
+    response_hit_rate = responses["hits"] / rendered * 100 if rendered else 0.0
+    tool_lines = "\n".join(
+        f"- {name}: {_TOOL_METRICS.calls[name]} calls, {_TOOL_METRICS.errors[name]} errors, "
+        f"p50/p95/p99 {_TOOL_METRICS.latency[name].summary()} ms"
+        for name in sorted(_TOOL_METRICS.calls)
+    ) or "- No calls yet"
+    checks = _STATUS_CHECK_LATENCY
+    coalesced = sum(_TOOL_METRICS.coalesced.values())
+    rejected = sum(_TOOL_METRICS.rejected.values())
+    limiter = _CLIENT_RATE_LIMITER
+    circuits = _HOST_CIRCUITS.not_closed()
+    circuit_summary = ", ".join(
+        f"{host} {state}" + (f" for {_format_age(retry_after)}" if state == "open" else "")
+        for host, (state, retry_after) in circuits.items()
+    ) or "none"
+    if _wants_json(output_format):
+        return _to_json(
+            {
+                "tools": {
+                    name: {
+                        "calls": _TOOL_METRICS.calls[name],
+                        "errors": _TOOL_METRICS.errors[name],
+                        **{
+                            f"p{int(q * 100)}_ms": round(_TOOL_METRICS.latency[name].percentile(q) * 1000, 3)
+                            for q in (0.5, 0.95, 0.99)
+                        },
+                    }
+                    for name in sorted(_TOOL_METRICS.calls)
+                },
+                "status_cache": {
+                    **stats, "hit_rate": round(hit_rate, 1), "prefetch_rounds": _STATUS_PREFETCHER.rounds
+                },
+                "response_cache": {**responses, "max_entries": _RESPONSE_CACHE.max_entries},
+                "status_store": {"path": _STATUS_STORE.path, **_STATUS_STORE.stats()},
+                "docs_cache": {**docs, "max_bytes": _DOCS_CACHE.max_bytes, "directory": _DOCS_CACHE.directory},
+                "catalog": {
+                    "source": catalog.source,
+                    "version": catalog.version,
+                    "tools": len(catalog.tools),
+                    "reloads": _CATALOG_WATCHER.reloads,
+                },
+                "process": {"pid": os.getpid(), "worker": _WORKER_ID, "workers": HTTP_WORKERS},
+                "dispatch": {
+                    "coalescing": COALESCE_CALLS,
+                    "coalesced": coalesced,
+                    "inflight": _TOOL_COALESCER.inflight(),
+                    "rate_limit": limiter.rate,
+                    "rate_burst": limiter.burst,
+                    "rejected": rejected,
+                    "clients": limiter.clients(),
+                    "by_tool": {
+                        name: {
+                            "coalesced": _TOOL_METRICS.coalesced.get(name, 0),
+                            "rejected": _TOOL_METRICS.rejected.get(name, 0),
+                        }
+                        for name in sorted({*_TOOL_METRICS.coalesced, *_TOOL_METRICS.rejected})
+                    },
+                },
+                "status_checks": {
+                    "count": checks.count,
+                    "failed": _STATUS_CHECK_ERRORS,
+                    "short_circuited": _HOST_CIRCUITS.short_circuited,
+                    "open_circuits": {
+                        host: {"state": state, "retry_after": round(retry_after, 1)}
+                        for host, (state, retry_after) in circuits.items()
+                    },
+                    **{f"p{int(q * 100)}_ms": round(checks.percentile(q) * 1000, 3) for q in (0.5, 0.95, 0.99)},
+                },
+                "timestamp": _format_timestamp(),
+            }
+        )
+    return f"""📈 Server Metrics
+Tools:
+{tool_lines}
+Status Cache:
+- Hits: {stats['hits']}
+- Misses: {stats['misses']}
+- Coalesced: {stats['coalesced']}
+- Served Stale: {stats['stale']}
+- Hit Rate: {hit_rate:.1f}%
+- Entries: {stats['entries']} (TTL {_STATUS_CACHE.ttl:g}s, errors {_STATUS_CACHE.error_ttl:g}s)
+- Prefetcher: {"running" if _STATUS_PREFETCHER.running else "off"} ({_STATUS_PREFETCHER.rounds} rounds)
+- Shared Store: {_format_store_line()}
+Response Cache:
+- Hits: {responses['hits']}
+- Misses: {responses['misses']}
+- Hit Rate: {response_hit_rate:.1f}%
+- Entries: {responses['entries']}/{_RESPONSE_CACHE.max_entries} ({responses['evictions']} evicted)
+- Pinned Overviews: {responses['pinned']}
+Docs Cache:
+- Hits: {docs['hits']}
+- Downloads: {docs['misses']}
+- Revalidated: {docs['revalidated']}
+- Served Stale: {docs['stale']}
+- Size: {docs['bytes'] / 1024:.0f}/{_DOCS_CACHE.max_bytes / 1024:.0f} KB in {docs['entries']} files
+- Evicted: {docs['evictions']}
+Catalog:
+- Source: {catalog.source}
+- Version: {catalog.version} ({len(catalog.tools)} tools, {_CATALOG_WATCHER.reloads} reloads)
+Process:
+- PID: {os.getpid()}{f" (worker {_WORKER_ID} of {HTTP_WORKERS})" if _WORKER_ID else ""}
+Dispatch:
+- Coalesced Calls: {coalesced if COALESCE_CALLS else "off"} ({_TOOL_COALESCER.inflight()} in flight)
+- Rate Limit: {f"{limiter.rate:g}/s per client, burst {limiter.burst:g}" if limiter.enabled else "off"}
+- Rejected Calls: {rejected} ({limiter.clients()} clients tracked)
+HTTP Client:
+- Max Connections: {HTTP_MAX_CONNECTIONS}
+- HTTP/2: {"enabled" if _http2_available() else "unavailable (pip install h2)"}
+- Status Checks: {checks.count} ({_STATUS_CHECK_ERRORS} failed), p50/p95/p99 {checks.summary()} ms
+- Open Circuits: {circuit_summary} ({_HOST_CIRCUITS.short_circuited} checks skipped)
+- Prometheus: {f"http://{METRICS_HOST}:{_METRICS_EXPORTER.port}/metrics" if _METRICS_EXPORTER.running else "off"}
+
+Timestamp: {_format_timestamp()}"""
+
+
+TRANSPORTS = {"stdio": "stdio", "http": "streamable-http", "streamable-http": "streamable-http", "sse": "sse"}
+
+
+def _configure_http(host: str, port: int) -> None:
+    """Point FastMCP's HTTP settings at host/port, relaxing localhost-only host checks for other binds."""
+    mcp.settings.host = host
+    mcp.settings.port = port
+    if host not in {"127.0.0.1", "localhost", "::1"}:
+        mcp.settings.transport_security = None
+
+
+async def _serve_http(transport: str, sockets=None) -> None:
+    """Serve many concurrent MCP clients over streamable HTTP or SSE from one process."""
+    import uvicorn
+
+    app = mcp.sse_app() if transport == "sse" else mcp.streamable_http_app()
+    config = uvicorn.Config(
+        app,
+        host=mcp.settings.host,
+        port=mcp.settings.port,
+        log_level=mcp.settings.log_level.lower(),
+        log_config=None,
+        timeout_graceful_shutdown=HTTP_SHUTDOWN_TIMEOUT,
+    )
+    server = uvicorn.Server(config)
+    # uvicorn re-raises the signal once it has stopped, which would skip our own cleanup.
+    server.capture_signals = nullcontext
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, server.handle_exit, sig, None)
+        except (NotImplementedError, RuntimeError):
+            pass
+    async with _shared_resources():
+        await server.serve(sockets=sockets)
+    logger.info("HTTP server stopped")
+
+
+_WORKER_ID = 0
+
+
+async def _worker_heartbeat(fd: int) -> None:
+    """Tell the supervisor this worker's event loop is still responsive."""
+    while True:
+        try:
+            os.write(fd, b".")
+        except BlockingIOError:
+            pass
+        await asyncio.sleep(WORKER_HEARTBEAT_INTERVAL)
+
+
+async def _run_worker(transport: str, sock, heartbeat_fd: int) -> None:
+    """Serve HTTP on an inherited listening socket while sending heartbeats."""
+    heartbeat = asyncio.create_task(_worker_heartbeat(heartbeat_fd))
+    try:
+        await _serve_http(transport, sockets=[sock])
+    finally:
+        heartbeat.cancel()
+
+
+class _WorkerSupervisor:
+    """Pre-fork HTTP workers that share one listening socket and one copy-on-write catalog."""
+
+    def __init__(self, transport: str, workers: int, heartbeat_timeout: float):
+        self.transport = transport
+        self.workers = workers
+        self.heartbeat_timeout = heartbeat_timeout
+        self.children = {}
+        self.restarts = 0
+        self.stopping = False
+        self.sock = None
+
+    def run(self) -> None:
+        """Load the catalog once, fork the workers, and keep them alive until signalled."""
+        # Build every index before forking so workers share the pages instead of each building a copy;
+        # freezing moves them out of the collector's reach so GC passes don't dirty the shared pages.
+        catalog = _get_catalog()
+        catalog.build_all()
+        _warm_response_cache(catalog)
+        gc.freeze()
+        self.sock = socket.create_server((mcp.settings.host, mcp.settings.port), backlog=2048)
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            signal.signal(sig, self._handle_exit)
+        logger.info(
+            "Supervisor %s serving %s tools to %s workers on %s:%s",
+            os.getpid(), len(catalog.tools), self.workers, mcp.settings.host, mcp.settings.port,
+        )
+        try:
+            for worker_id in range(1, self.workers + 1):
+                self._spawn(worker_id)
+            while not self.stopping:
+                self._check()
+        finally:
+            self._shutdown()
+            self.sock.close()
+
+    def _spawn(self, worker_id: int) -> None:
+        """Fork one worker process serving on the shared socket."""
+        global _WORKER_ID
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            code = 0
+            try:
+                os.close(read_fd)
+                for child in self.children.values():
+                    os.close(child["fd"])
+                for sig in (signal.SIGINT, signal.SIGTERM):
+                    signal.signal(sig, signal.SIG_DFL)
+                os.set_blocking(write_fd, False)
+                _WORKER_ID = worker_id
+                # The log listener thread did not survive the fork; give this worker its own.
+                _configure_logging()
+                _METRICS_EXPORTER.port = METRICS_PORT + worker_id - 1
+                asyncio.run(_run_worker(self.transport, self.sock, write_fd))
+            except BaseException:
+                logger.exception("Worker %s crashed", worker_id)
+                code = 1
+            finally:
+                _stop_logging()
+                logging.shutdown()
+                os._exit(code)
+        os.close(write_fd)
+        now = time.monotonic()
+        self.children[pid] = {
+            "id": worker_id, "fd": read_fd, "started": now, "beat": now, "closed": False, "killed": False
+        }
+        logger.info("Started worker %s (pid %s)", worker_id, pid)
+
+    def _check(self) -> None:
+        """Drain heartbeats, restart exited workers, and kill workers whose loop stopped responding."""
+        fds = {child["fd"]: pid for pid, child in self.children.items() if not child["closed"]}
+        try:
+            ready, _, _ = select.select(list(fds), [], [], 1.0 if fds else 0.1)
+        except InterruptedError:
+            ready = []
+        now = time.monotonic()
+        for fd in ready:
+            child = self.children[fds[fd]]
+            if os.read(fd, 4096):
+                child["beat"] = now
+            else:
+                child["closed"] = True
+        for pid, child in self.children.items():
+            if not child["killed"] and now - child["beat"] > self.heartbeat_timeout:
+                logger.warning("Worker %s (pid %s) missed heartbeats, killing it", child["id"], pid)
+                self._kill(pid, signal.SIGKILL)
+                child["killed"] = True
+        while self.children:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                break
+            if pid == 0:
+                break
+            child = self.children.pop(pid, None)
+            if child is None:
+                continue
+            os.close(child["fd"])
+            if self.stopping:
+                continue
+            logger.warning(
+                "Worker %s (pid %s) exited with status %s, restarting",
+                child["id"],
+                pid,
+                os.waitstatus_to_exitcode(status),
+            )
+            # Back off when a worker dies right after starting so a broken build cannot fork-bomb the host.
+            if time.monotonic() - child["started"] < 1.0:
+                time.sleep(min(30.0, 0.5 * 2 ** min(self.restarts, 6)))
+                self.restarts += 1
+            else:
+                self.restarts = 0
+            self._spawn(child["id"])
+
+    def _kill(self, pid: int, sig: int) -> None:
+        """Send a signal to a worker that may already have exited."""
+        try:
+            os.kill(pid, sig)
+        except ProcessLookupError:
+            pass
+
+    def _handle_exit(self, signum, frame) -> None:
+        """Stop restarting workers and begin shutdown."""
+        self.stopping = True
+
+    def _shutdown(self) -> None:
+        """Ask every worker to finish gracefully, killing any that outlive the shutdown timeout."""
+        for pid in self.children:
+            self._kill(pid, signal.SIGTERM)
+        deadline = time.monotonic() + HTTP_SHUTDOWN_TIMEOUT + 5.0
+        while self.children and time.monotonic() < deadline:
+            pid, _ = os.waitpid(-1, os.WNOHANG)
+            if pid == 0:
+                time.sleep(0.05)
+                continue
+            child = self.children.pop(pid, None)
+            if child:
+                os.close(child["fd"])
+        for pid, child in self.children.items():
+            logger.warning("Worker %s (pid %s) did not stop in time, killing it", child["id"], pid)
+            self._kill(pid, signal.SIGKILL)
+            os.waitpid(pid, 0)
+            os.close(child["fd"])
+        self.children.clear()
+        logger.info("All workers stopped")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Full Stack Web Dev MCP server")
+    parser.add_argument(
+        "--transport",
+        choices=sorted(TRANSPORTS),
+        default=TRANSPORT if TRANSPORT in TRANSPORTS else "stdio",
+        help="stdio for one client per process, http (streamable HTTP) or sse for many (default: %(default)s)",
+    )
+    parser.add_argument("--host", default=HTTP_HOST, help="HTTP bind address (default: %(default)s)")
+    parser.add_argument("--port", type=int, default=HTTP_PORT, help="HTTP port (default: %(default)s)")
+    parser.add_argument(
+        "--workers", type=int, default=HTTP_WORKERS, help="pre-forked HTTP worker processes (default: %(default)s)"
+    )
+    args = parser.parse_args()
+    _configure_logging()
+    atexit.register(_stop_logging)
+
+    transport = TRANSPORTS[args.transport]
     logger.info("Starting Full Stack Web Dev MCP server...")
     try:
-        mcp.run(transport="stdio")
+        if transport == "stdio":
+            mcp.run(transport="stdio")
+        elif args.workers > 1:
+            if transport != "streamable-http" or not hasattr(os, "fork"):
+                parser.error("--workers needs --transport http on a platform with fork()")
+            _configure_http(args.host, args.port)
+            # Any worker may receive any request, so sessions cannot live in one worker's memory.
+            mcp.settings.stateless_http = True
+            HTTP_WORKERS = args.workers
+            _WorkerSupervisor(transport, args.workers, WORKER_TIMEOUT).run()
+        else:
+            _configure_http(args.host, args.port)
+            logger.info("Serving %s on %s:%s", transport, args.host, args.port)
+            asyncio.run(_serve_http(transport))
+    except KeyboardInterrupt:
+        pass
     except Exception as exc:
         logger.error("Server error: %s", exc, exc_info=True)
         sys.exit(1)
@@ -0,0 +1,38 @@
+"""
+Numeric tool arguments are whole numbers: fractional or too small values are rejected, not truncated.
+"""
+import os
+import sys
+import json
+import asyncio
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import fullstack_webdev_server as server  # noqa: E402
+
+
+@pytest.mark.parametrize(
+    "limit, error",
+    [
+        ("2.5", "❌ Error: limit must be a whole number, got '2.5'."),
+        ("0.9", "❌ Error: limit must be a whole number, got '0.9'."),
+        ("0", "❌ Error: limit must be at least 1."),
+    ],
+)
+def test_search_catalog_rejects_bad_limit(limit, error):
+    assert asyncio.run(server.search_catalog(query="react", limit=limit)) == error
+
+
+def test_search_catalog_limit_caps_results():
+    reply = asyncio.run(server.search_catalog(query="react", limit="2", output_format="json"))
+    assert len(json.loads(reply)["results"]) == 2
+
+
+@pytest.mark.parametrize(
+    "limit, error",
+    [("1.5", "❌ Error: limit must be a whole number, got '1.5'."), ("0", "❌ Error: limit must be at least 1.")],
+)
+def test_recommend_stack_rejects_bad_limit(limit, error):
+    assert asyncio.run(server.recommend_stack(project="realtime chat app", limit=limit)) == error
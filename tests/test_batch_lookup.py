@@ -0,0 +1,57 @@
+"""
+batch_lookup with valid and invalid requests mixed in one call: each item succeeds or fails on its own.
+"""
+import os
+import sys
+import json
+import asyncio
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import fullstack_webdev_server as server  # noqa: E402
+
+MIXED = json.dumps(
+    [
+        {"type": "tool", "tool": "prisma"},
+        {"type": "tool", "tool": "zzzz"},
+        {"type": "nope"},
+        "prisma",
+        {"type": "quickstart", "framework": "next.js", "bogus": 1},
+        {"type": "search_catalog", "query": "react", "limit": 2},
+    ]
+)
+
+
+def test_mixed_batch_text_reports_each_item_in_order():
+    reply = asyncio.run(server.batch_lookup(requests=MIXED))
+    assert reply.startswith("📦 Batch Lookup (6 requests, 4 failed)\n\n[1] tool prisma\n✅ Prisma (")
+    assert "[2] tool zzzz\n❌ Error: Tool 'zzzz' is not in the curated catalog." in reply
+    assert "[3] nope\n❌ Error: Unknown type 'nope'. Try one of: tool, quickstart," in reply
+    assert "[4] invalid\n❌ Error: Each request must be a JSON object." in reply
+    assert "[5] quickstart next.js\n❌ Error: Unexpected field(s) for quickstart: bogus." in reply
+    assert "[6] search react\n🔎 Catalog Search Results\nQuery: react\nTop 2 matches:" in reply
+
+
+def test_mixed_batch_json_keeps_successes_and_errors_apart():
+    results = json.loads(asyncio.run(server.batch_lookup(requests=MIXED, output_format="json")))["results"]
+    assert [(item["type"], item["ok"]) for item in results] == [
+        ("tool", True),
+        ("tool", False),
+        ("nope", False),
+        ("invalid", False),
+        ("quickstart", False),
+        ("search", True),
+    ]
+    for item in results:
+        assert set(item) == {"type", "label", "ok", "result"}
+        assert ("error" in item["result"]) is not item["ok"]
+    direct = asyncio.run(server.fetch_tool_reference(tool="prisma", output_format="json"))
+    assert results[0]["result"] == json.loads(direct)
+    assert len(results[5]["result"]["results"]) == 2
+
+
+def test_batch_with_only_invalid_items_still_answers_each():
+    requests = json.dumps([{"type": "tool"}, {"type": "tool", "tool": "zzzz"}])
+    reply = asyncio.run(server.batch_lookup(requests=requests))
+    assert reply.startswith("📦 Batch Lookup (2 requests, 2 failed)")
+    assert "[1] tool\n❌ Error: Tool name is required." in reply
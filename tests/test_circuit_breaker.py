@@ -0,0 +1,168 @@
+"""
+Status check circuit breakers, deadlines and cancellation against a local stand-in HTTP server.
+"""
+import os
+import sys
+import time
+import asyncio
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import fullstack_webdev_server as server  # noqa: E402
+
+RESET = 0.3
+
+
+class FlakyHandler(BaseHTTPRequestHandler):
+    """Answer HEAD requests with a configurable status after a configurable delay, counting them."""
+
+    status = 503
+    delay = 0.0
+    requests = 0
+    lock = threading.Lock()
+
+    def do_HEAD(self):
+        with self.lock:
+            FlakyHandler.requests += 1
+        time.sleep(self.delay)
+        self.send_response(self.status)
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def flaky_url():
+    """Serve FlakyHandler on a free local port for one test."""
+    FlakyHandler.status = 503
+    FlakyHandler.delay = 0.0
+    FlakyHandler.requests = 0
+    stub = ThreadingHTTPServer(("127.0.0.1", 0), FlakyHandler)
+    threading.Thread(target=stub.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True).start()
+    yield f"http://127.0.0.1:{stub.server_address[1]}/docs"
+    stub.shutdown()
+    stub.server_close()
+
+
+@pytest.fixture
+def circuits(monkeypatch):
+    """Swap in fresh breakers that open after two failures, with single-attempt checks."""
+    breakers = server._HostCircuits(2, RESET, 10 * RESET)
+    monkeypatch.setattr(server, "_HOST_CIRCUITS", breakers)
+    monkeypatch.setattr(server, "STATUS_RETRIES", 0)
+    return breakers
+
+
+def run(coroutine_function):
+    """Run an async scenario and close the shared HTTP client on its loop afterwards."""
+
+    async def scenario():
+        try:
+            return await coroutine_function()
+        finally:
+            await server._close_http_client()
+
+    return asyncio.run(scenario())
+
+
+def test_circuit_opens_after_repeated_failures(flaky_url, circuits):
+    async def scenario():
+        return [await server._probe_status(flaky_url) for _ in range(3)]
+
+    first, second, third = run(scenario)
+    assert first["code"] == second["code"] == 503
+    assert FlakyHandler.requests == 2
+    assert third["code"] is None
+    assert "circuit open" in third["error"]
+    assert third["short_circuited"] is True
+    assert circuits.short_circuited == 1
+    assert circuits.not_closed()["127.0.0.1"][0] == "open"
+
+
+def test_half_open_lets_one_trial_through_and_success_closes(flaky_url, circuits):
+    async def scenario():
+        for _ in range(2):
+            await server._probe_status(flaky_url)
+        await asyncio.sleep(RESET + 0.05)
+        FlakyHandler.status = 200
+        FlakyHandler.delay = 0.1
+        trial, blocked = await asyncio.gather(server._probe_status(flaky_url), server._probe_status(flaky_url))
+        return trial, blocked
+
+    trial, blocked = run(scenario)
+    assert trial["code"] == 200
+    assert blocked.get("short_circuited") is True
+    assert FlakyHandler.requests == 3
+    assert circuits.get("127.0.0.1").state == "closed"
+    assert circuits.not_closed() == {}
+
+
+def test_failed_trial_doubles_the_open_period(flaky_url, circuits):
+    async def scenario():
+        for _ in range(2):
+            await server._probe_status(flaky_url)
+        await asyncio.sleep(RESET + 0.05)
+        return await server._probe_status(flaky_url)
+
+    trial = run(scenario)
+    breaker = circuits.get("127.0.0.1")
+    assert trial["code"] == 503
+    assert breaker.state == "open"
+    assert breaker.retry_after() > RESET * 1.5
+
+
+def test_check_gives_up_at_the_deadline(flaky_url, circuits, monkeypatch):
+    monkeypatch.setattr(server, "STATUS_DEADLINE", 0.2)
+    FlakyHandler.delay = 1.0
+    started = time.monotonic()
+    result = run(lambda: server._probe_status(flaky_url))
+    assert result["code"] is None
+    assert time.monotonic() - started < 0.6
+    assert circuits.get("127.0.0.1").failures == 1
+
+
+def test_cancelled_caller_leaves_nothing_in_flight(flaky_url, circuits, monkeypatch):
+    cache = server._StatusCache(60, 60)
+    monkeypatch.setattr(server, "_STATUS_CACHE", cache)
+    FlakyHandler.status = 200
+    FlakyHandler.delay = 0.5
+
+    async def scenario():
+        check = asyncio.ensure_future(server._get_status(flaky_url))
+        await asyncio.sleep(0.1)
+        check.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await check
+        # Give the cancelled probe a moment to unwind through the HTTP client.
+        await asyncio.sleep(0.05)
+        return dict(cache._inflight), dict(cache._waiters)
+
+    inflight, waiters = run(scenario)
+    assert inflight == {}
+    assert waiters == {}
+    assert cache.peek(flaky_url) is None
+    breaker = circuits.get("127.0.0.1")
+    assert breaker.failures == 0
+    assert breaker.allow()
+
+
+def test_short_circuited_results_are_not_stored(flaky_url, circuits, tmp_path, monkeypatch):
+    store = server._SharedStatusStore(str(tmp_path / "status.sqlite3"), 100)
+    monkeypatch.setattr(server, "_STATUS_STORE", store)
+
+    async def scenario():
+        for _ in range(2):
+            await server._probe_status(flaky_url)
+        result, _ = await server._load_status(flaky_url)
+        return result, await store.get(flaky_url)
+
+    result, stored = run(scenario)
+    assert result["short_circuited"] is True
+    assert store.writes == 0
+    assert stored is None
+    store.close()
@@ -0,0 +1,58 @@
+"""
+design_knowledge_sources(search=...) matches source labels by substring, unlike the ranked search_catalog, and
+echoes the query as written.
+"""
+import os
+import sys
+import json
+import asyncio
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import fullstack_webdev_server as server  # noqa: E402
+
+
+def search_labels(query: str) -> list:
+    """Return the labels of the design sources that design_knowledge_sources finds for query."""
+    reply = asyncio.run(server.design_knowledge_sources(search=query, output_format="json"))
+    return [source["label"] for source in json.loads(reply).get("sources", [])]
+
+
+def test_search_matches_label_substrings():
+    assert len(search_labels("graphy")) == 5
+    assert len(search_labels("the")) == 7
+
+
+def test_search_requires_the_whole_query_in_one_label():
+    assert search_labels("color psych") == ["Faber Birren — Color Psychology and Color Therapy"]
+
+
+def test_search_keeps_catalog_order():
+    expected = [
+        item["label"]
+        for entry in server.DESIGN_KNOWLEDGE_DATA
+        for item in entry["items"]
+        if "typography" in item["label"].lower()
+    ]
+    assert search_labels("Typography") == expected
+
+
+def test_search_echoes_the_query_as_written():
+    text = asyncio.run(server.design_knowledge_sources(search="Color Psych"))
+    reply = json.loads(asyncio.run(server.design_knowledge_sources(search="Color Psych", output_format="json")))
+    assert "\nQuery: Color Psych\n" in text
+    assert reply["query"] == "Color Psych"
+
+
+def test_searches_do_not_evict_the_overviews(monkeypatch):
+    cache = server._ResponseCache(4)
+    monkeypatch.setattr(server, "_RESPONSE_CACHE", cache)
+    server._warm_response_cache(server._get_catalog())
+    for query in ("graphy", "color", "brand", "system", "the", "design"):
+        asyncio.run(server.design_knowledge_sources(search=query))
+    misses = cache.stats()["misses"]
+    asyncio.run(server.design_knowledge_sources())
+    asyncio.run(server.list_tool_categories())
+    assert cache.stats()["misses"] == misses
+    assert cache.stats()["pinned"] == 2
+    assert cache.stats()["evictions"] == 2
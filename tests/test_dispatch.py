@@ -0,0 +1,111 @@
+"""
+Tool call dispatch: how clients are told apart, per-client rate limits, and sharing of identical running calls.
+"""
+import os
+import sys
+import asyncio
+from functools import partial
+from types import SimpleNamespace
+
+import pytest
+from mcp.server.lowlevel.server import request_ctx
+from mcp.shared.context import RequestContext
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import fullstack_webdev_server as server  # noqa: E402
+
+
+@pytest.fixture
+def http_request():
+    """Make the current MCP request an HTTP request with the given headers from a fixed address."""
+    tokens = []
+
+    def enter(headers: dict):
+        request = SimpleNamespace(headers=headers, client=SimpleNamespace(host="203.0.113.7"))
+        tokens.append(request_ctx.set(RequestContext("1", None, object(), {}, request=request)))
+
+    yield enter
+    for token in reversed(tokens):
+        request_ctx.reset(token)
+
+
+def test_client_supplied_session_id_does_not_change_client(http_request, monkeypatch):
+    monkeypatch.setattr(server, "CLIENT_ID_HEADER", "")
+    http_request({"mcp-session-id": "a"})
+    first = server.mcp.client_id()
+    http_request({"mcp-session-id": "b"})
+    assert server.mcp.client_id() == first == "203.0.113.7"
+
+
+def test_configured_header_identifies_client(http_request, monkeypatch):
+    monkeypatch.setattr(server, "CLIENT_ID_HEADER", "x-forwarded-user")
+    http_request({"x-forwarded-user": "alice", "mcp-session-id": "a"})
+    assert server.mcp.client_id() == "alice"
+    http_request({"mcp-session-id": "a"})
+    assert server.mcp.client_id() == "203.0.113.7"
+
+
+def test_client_outside_a_request_is_local():
+    assert server.mcp.client_id() == "local"
+
+
+def test_bucket_rejects_when_empty_and_refills(monkeypatch):
+    clock = [100.0]
+    monkeypatch.setattr(server.time, "monotonic", lambda: clock[0])
+    limiter = server._ClientRateLimiter(2.0, 3, 16)
+    assert [limiter.acquire("a") for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert limiter.acquire("a") == pytest.approx(0.5)
+    assert limiter.acquire("b") == 0.0
+    clock[0] += 0.5
+    assert limiter.acquire("a") == 0.0
+    assert limiter.acquire("a") > 0
+    clock[0] += 10
+    assert [limiter.acquire("a") for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert limiter.acquire("a") > 0
+
+
+def test_over_limit_call_is_rejected_before_the_tool_runs(monkeypatch):
+    monkeypatch.setattr(server, "_CLIENT_RATE_LIMITER", server._ClientRateLimiter(0.01, 1, 16))
+    first = asyncio.run(server.mcp.call_tool("search_catalog", {"query": "react"}))
+    second = asyncio.run(server.mcp.call_tool("search_catalog", {"query": "react"}))
+    assert not getattr(first, "isError", False)
+    assert second.isError
+    assert second.content[0].text.startswith("❌ Error: Rate limit exceeded, retry in")
+
+
+def run_concurrently(calls: list) -> tuple:
+    """Send (client, arguments) calls through one coalescer at once; return results and executions."""
+    coalescer = server._ToolCallCoalescer()
+    executions = []
+
+    async def dispatch(client):
+        executions.append(client)
+        await asyncio.sleep(0.05)
+        return f"result for {client}"
+
+    async def scenario():
+        return await asyncio.gather(
+            *(coalescer.run(client, "tool", arguments, partial(dispatch, client)) for client, arguments in calls)
+        )
+
+    results = asyncio.run(scenario())
+    assert coalescer.inflight() == 0
+    return results, executions
+
+
+def test_identical_calls_from_one_client_run_once():
+    results, executions = run_concurrently([("a", {"query": "react"})] * 3)
+    assert executions == ["a"]
+    assert results == ["result for a"] * 3
+
+
+def test_identical_calls_from_different_clients_run_separately():
+    results, executions = run_concurrently([("a", {"query": "react"}), ("b", {"query": "react"})])
+    assert sorted(executions) == ["a", "b"]
+    assert results == ["result for a", "result for b"]
+
+
+def test_different_arguments_run_separately():
+    _, executions = run_concurrently([("a", {"query": "react"}), ("a", {"query": "vue"})])
+    assert executions == ["a", "a"]
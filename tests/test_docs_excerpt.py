@@ -0,0 +1,145 @@
+"""
+Docs excerpts against a local stand-in docs server: revalidation, the download cap, stale fallback and max_chars.
+"""
+import os
+import sys
+import asyncio
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import fullstack_webdev_server as server  # noqa: E402
+
+ETAG = '"v1"'
+LAST_MODIFIED = "Sat, 17 Oct 2026 12:00:00 GMT"
+
+
+class DocsHandler(BaseHTTPRequestHandler):
+    """Serve one HTML page with validators, answering matching conditional requests with 304."""
+
+    body = b"<html><head><title>Stub Docs</title></head><body><p>Install the stub package.</p></body></html>"
+    status = 200
+    seen = []
+
+    def do_GET(self):
+        DocsHandler.seen.append((self.headers.get("If-None-Match"), self.headers.get("If-Modified-Since")))
+        if self.status != 200:
+            self.send_response(self.status)
+            self.end_headers()
+            return
+        if self.headers.get("If-None-Match") == ETAG:
+            self.send_response(304)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(self.body)))
+        self.send_header("ETag", ETAG)
+        self.send_header("Last-Modified", LAST_MODIFIED)
+        self.end_headers()
+        self.wfile.write(self.body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def docs_url():
+    """Serve DocsHandler on a free local port for one test."""
+    DocsHandler.seen = []
+    DocsHandler.status = 200
+    stub = ThreadingHTTPServer(("127.0.0.1", 0), DocsHandler)
+    threading.Thread(target=stub.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{stub.server_address[1]}/docs"
+    stub.shutdown()
+    stub.server_close()
+
+
+@pytest.fixture
+def docs_cache(tmp_path, monkeypatch):
+    """Swap in an empty on-disk docs cache whose entries always need revalidation."""
+    cache = server._DocsCache(str(tmp_path), 1024 * 1024)
+    monkeypatch.setattr(server, "_DOCS_CACHE", cache)
+    monkeypatch.setattr(server, "DOCS_TTL", 0.0)
+    return cache
+
+
+def fetch_twice(url: str) -> list:
+    """Fetch url twice through the docs cache and return both (record, outcome) pairs."""
+
+    async def scenario():
+        try:
+            return [await server._docs_excerpt(url), await server._docs_excerpt(url)]
+        finally:
+            await server._close_http_client()
+
+    return asyncio.run(scenario())
+
+
+def test_expired_excerpt_is_revalidated_with_validators(docs_url, docs_cache):
+    (first, first_outcome), (second, second_outcome) = fetch_twice(docs_url)
+    assert first_outcome == "fetched"
+    assert first["title"] == "Stub Docs"
+    assert "Install the stub package." in first["excerpt"]
+    assert DocsHandler.seen == [(None, None), (ETAG, LAST_MODIFIED)]
+    assert second_outcome == "revalidated"
+    assert second["excerpt"] == first["excerpt"]
+    assert second["fetched"] == first["fetched"]
+    assert docs_cache.stats()["revalidated"] == 1
+
+
+def test_download_stops_at_byte_cap(docs_url, docs_cache, monkeypatch):
+    monkeypatch.setattr(server, "DOCS_MAX_BYTES", 64)
+    monkeypatch.setattr(DocsHandler, "body", b"<p>" + b"word " * 4000 + b"</p>")
+
+    async def scenario():
+        try:
+            return await server._docs_excerpt(docs_url)
+        finally:
+            await server._close_http_client()
+
+    record, outcome = asyncio.run(scenario())
+    assert outcome == "fetched"
+    assert record["bytes"] == 64
+    assert record["truncated"] is True
+
+
+def test_failed_refresh_serves_stale_copy(docs_url, docs_cache, monkeypatch):
+    async def scenario():
+        try:
+            fresh, _ = await server._docs_excerpt(docs_url)
+            DocsHandler.status = 500
+            stale = await server._docs_excerpt(docs_url)
+            await asyncio.to_thread(os.remove, docs_cache._path(docs_url))
+            with pytest.raises(ValueError, match="Could not fetch"):
+                await server._docs_excerpt(docs_url)
+            return fresh, stale
+        finally:
+            await server._close_http_client()
+
+    fresh, (stale, outcome) = asyncio.run(scenario())
+    assert outcome.startswith("stale (HTTP 500")
+    assert stale["excerpt"] == fresh["excerpt"]
+    assert docs_cache.stats()["stale"] == 1
+
+
+@pytest.mark.parametrize(
+    "max_chars, error",
+    [
+        ("0", "❌ Error: max_chars must be at least 1."),
+        ("1.5", "❌ Error: max_chars must be a whole number, got '1.5'."),
+        ("2001", "❌ Error: max_chars must be at most 2000."),
+    ],
+)
+def test_max_chars_is_validated_before_fetching(max_chars, error, monkeypatch):
+    monkeypatch.setattr(server, "DOCS_EXCERPT_CHARS", 2000)
+    assert asyncio.run(server.fetch_docs_excerpt(name="prisma", max_chars=max_chars)) == error
+
+
+def test_max_chars_cap_follows_excerpt_setting(monkeypatch):
+    monkeypatch.setattr(server, "DOCS_EXCERPT_CHARS", 500)
+    reply = asyncio.run(server.fetch_docs_excerpt(name="prisma", max_chars="501"))
+    assert reply == "❌ Error: max_chars must be at most 500."
@@ -0,0 +1,44 @@
+"""
+Typo-tolerant name lookups: near misses resolve, ambiguous typos fall back to suggestions.
+"""
+import os
+import sys
+import asyncio
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import fullstack_webdev_server as server  # noqa: E402
+
+
+@pytest.mark.parametrize(
+    "query, label",
+    [("sveltkit", "SvelteKit"), ("nextjs", "Next.js"), ("nexjs", "Next.js"), ("nuxtjs", "Nuxt"), ("remx", "Remix")],
+)
+def test_framework_near_miss_resolves(query, label):
+    reply = asyncio.run(server.framework_quickstart(framework=query))
+    assert reply.startswith(("🔁", "⚡"))
+    assert f"⚡ {label} Quickstart" in reply
+
+
+@pytest.mark.parametrize("query, label", [("prsma", "Prisma"), ("tailwnd", "Tailwind CSS"), ("nextjs", "Next.js")])
+def test_tool_near_miss_resolves(query, label):
+    reply = asyncio.run(server.fetch_tool_reference(tool=query))
+    assert f"✅ {label} (" in reply
+
+
+@pytest.mark.parametrize("query", ["nxt", "nxtjs"])
+def test_ambiguous_typo_suggests_instead_of_guessing(query):
+    framework = asyncio.run(server.framework_quickstart(framework=query))
+    tool = asyncio.run(server.fetch_tool_reference(tool=query))
+    for reply in (framework, tool):
+        assert reply.startswith("❌ Error:")
+        assert "Did you mean: Next.js, Nuxt" in reply
+
+
+def test_short_query_needs_a_clear_winner():
+    catalog = server._get_catalog()
+    assert catalog.framework_fuzzy.resolve("nxt")[0] == ""
+    assert catalog.framework_fuzzy.resolve("vu")[0] == "vue"
+    assert catalog.framework_fuzzy.resolve("remx")[0] == "remix"
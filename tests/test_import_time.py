@@ -0,0 +1,41 @@
+"""
+Importing the server stays cheap: the module body fits its -X importtime budget and builds nothing eagerly.
+"""
+import os
+import sys
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MODULE = "fullstack_webdev_server"
+
+# The module body measures about 40-70 ms here; the budget leaves room for slower CI machines.
+SELF_BUDGET_MS = 100.0
+
+
+def import_in_fresh_interpreter(*options: str, code: str = f"import {MODULE}", **env) -> subprocess.CompletedProcess:
+    """Run code in a new interpreter that can import the server."""
+    env = dict(os.environ, PYTHONPATH=ROOT, **env)
+    return subprocess.run([sys.executable, *options, "-c", code], env=env, capture_output=True, text=True, check=True)
+
+
+def module_self_ms(bytecode_dir: str) -> float:
+    """Return the milliseconds -X importtime attributes to the server module body itself."""
+    # Bytecode goes to a private directory, so runs after the first one never include compiling the source.
+    completed = import_in_fresh_interpreter(
+        "-X", "importtime", PYTHONPYCACHEPREFIX=bytecode_dir, PYTHONDONTWRITEBYTECODE=""
+    )
+    for line in completed.stderr.splitlines():
+        fields = line.split("|")
+        if len(fields) == 3 and fields[2].strip() == MODULE:
+            return int(fields[0].split(":")[1]) / 1000
+    raise AssertionError(f"{MODULE} missing from -X importtime output")
+
+
+def test_module_body_fits_import_budget(tmp_path):
+    fastest = min(module_self_ms(str(tmp_path)) for _ in range(3))
+    assert fastest <= SELF_BUDGET_MS, f"module body took {fastest:.1f} ms (budget {SELF_BUDGET_MS:g} ms)"
+
+
+def test_import_builds_no_catalog_or_http_client():
+    probe = f"import {MODULE} as server; print(server._CATALOG is None, server._HTTP_CLIENT is None)"
+    assert import_in_fresh_interpreter(code=probe).stdout.split() == ["True", "True"]
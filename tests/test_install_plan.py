@@ -0,0 +1,54 @@
+"""
+install_plan accepts a fixed set of package managers and writes Yarn commands in Yarn 2+ syntax.
+"""
+import os
+import sys
+import json
+import asyncio
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import fullstack_webdev_server as server  # noqa: E402
+
+
+def plan(tools: str, package_manager: str) -> dict:
+    """Return install_plan's JSON reply for tools and package_manager."""
+    reply = asyncio.run(server.install_plan(tools=tools, package_manager=package_manager, output_format="json"))
+    return json.loads(reply)
+
+
+def test_unknown_package_manager_lists_the_fixed_set():
+    reply = asyncio.run(server.install_plan(tools="prisma", package_manager="pip"))
+    assert reply == "❌ Error: Package manager 'pip' not supported. Try one of: npm, pnpm, yarn, bun."
+
+
+def test_supported_package_managers_do_not_depend_on_the_starters(monkeypatch):
+    npm_only = {"next.js": {**server.FRAMEWORK_STARTERS["next.js"], "commands": {"npm": "npx create-next-app@latest"}}}
+    catalog = server._Catalog(
+        server.RAW_TOOL_DATA, npm_only, server.DEPLOYMENT_PLAYBOOKS, server.STACK_RECIPES, server.DESIGN_KNOWLEDGE_DATA
+    )
+    monkeypatch.setattr(server, "_CATALOG", catalog)
+    monkeypatch.setattr(server, "_RESPONSE_CACHE", server._ResponseCache(16))
+    steps = plan("next.js, prisma", "bun")["steps"]
+    assert steps[0]["command"] == "bunx create-next-app@latest"
+    assert "bun add -d prisma" in [step["command"] for step in steps]
+
+
+def test_yarn_plan_uses_yarn_2_syntax():
+    result = plan("next.js, prisma, tailwind, vercel, shadcn/ui", "yarn")
+    commands = [step["command"] for step in result["steps"]]
+    assert commands == [
+        "yarn create next-app my-app",
+        "cd my-app",
+        "npm install -g vercel",
+        "yarn add -D prisma tailwindcss postcss autoprefixer",
+        "yarn prisma init",
+        "yarn dlx shadcn@latest init",
+    ]
+    assert not any(command.startswith("yarn global") for command in commands)
+    assert server.PACKAGE_MANAGER_NOTES["yarn"] in result["notes"]
+
+
+def test_yarn_scaffolds_with_dlx_and_create():
+    commands = [step["command"] for step in plan("playwright, nuxt", "yarn")["steps"]]
+    assert commands == ["yarn dlx nuxi@latest init my-app", "cd my-app", "yarn create playwright@latest"]
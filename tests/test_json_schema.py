@@ -0,0 +1,181 @@
+"""
+The JSON shape of every tool that accepts output_format, so a renamed or dropped field fails here first.
+"""
+import os
+import sys
+import json
+import time
+import inspect
+import asyncio
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import fullstack_webdev_server as server  # noqa: E402
+
+TOOL = ["key", "aliases", "label", "category", "homepage", "summary", "cli"]
+
+# Each case is (tool, arguments, key paths); "a[].b" is key b of the objects listed under a.
+SCHEMAS = [
+    ("list_tool_categories", {}, ["categories", "categories[].name", "categories[].tools"]),
+    (
+        "list_tool_categories",
+        {"category": "app frameworks"},
+        ["category", "tools", "offset", "limit", "total", "timestamp"],
+    ),
+    ("fetch_tool_reference", {"tool": "prisma"}, ["tool", *(f"tool.{key}" for key in TOOL)]),
+    (
+        "fetch_docs_excerpt",
+        {"name": "prisma"},
+        ["name", "url", "title", "cache", "age", "bytes", "truncated", "excerpt"],
+    ),
+    (
+        "framework_quickstart",
+        {"framework": "next.js"},
+        [
+            "framework",
+            *(f"framework.{key}" for key in ["key", "label", "docs", "commands", "post", "aliases"]),
+            *(f"framework.commands.{manager}" for manager in server.PACKAGE_MANAGER_COMMANDS),
+            "package_manager",
+            "command",
+        ],
+    ),
+    (
+        "install_plan",
+        {"tools": "next.js, prisma"},
+        ["package_manager", "tools", "steps", "steps[].phase", "steps[].command", "steps[].tools"]
+        + ["catalog_commands", "notes"],
+    ),
+    (
+        "recommend_stack",
+        {"project": "saas dashboard"},
+        ["summary", "frontend", "backend", "infrastructure", "extras", "combines", "also", "ranking"]
+        + ["ranking[].id", "ranking[].score", "ranking[].matched"],
+    ),
+    (
+        "deployment_checklist",
+        {"provider": "vercel"},
+        ["deployment", *(f"deployment.{key}" for key in ["key", "label", "docs", "steps", "notes"]), "preview"],
+    ),
+    (
+        "design_knowledge_sources",
+        {},
+        ["categories", "categories[].key", "categories[].label", "categories[].sources"],
+    ),
+    (
+        "design_knowledge_sources",
+        {"category": "typography"},
+        ["category", *(f"category.{key}" for key in ["key", "label", "aliases", "summary", "items"])]
+        + ["category.items[].label", "category.items[].url"],
+    ),
+    (
+        "design_knowledge_sources",
+        {"search": "typography"},
+        ["query", "sources", "sources[].label", "sources[].url", "sources[].category"],
+    ),
+    (
+        "search_catalog",
+        {"query": "react"},
+        ["query", "results", *(f"results[].{key}" for key in ["kind", "title", "summary", "url", "score"])],
+    ),
+    (
+        "related_tools",
+        {"tool": "prisma"},
+        ["results", "results[].query", "results[].tool", "results[].related"]
+        + [f"results[].related[].{key}" for key in ["tool", "category", "score", "shared"]],
+    ),
+    (
+        "check_catalog_health",
+        {},
+        ["checked", "total", "seconds", "healthy", "failing", "timed_out", "cached", "limits", "results"]
+        + ["limits.concurrency", "limits.host_rate", "limits.deadline", "timestamp"],
+    ),
+    (
+        "batch_lookup",
+        {"requests": '[{"type": "tool", "tool": "prisma"}]'},
+        ["results", "results[].type", "results[].label", "results[].ok", "results[].result"]
+        + ["results[].result.tool", *(f"results[].result.tool.{key}" for key in TOOL)],
+    ),
+]
+
+METRICS_SECTIONS = {
+    "status_cache": ["hits", "misses", "coalesced", "stale", "entries", "inflight", "hit_rate", "prefetch_rounds"],
+    "response_cache": ["hits", "misses", "evictions", "entries", "pinned", "max_entries"],
+    "status_store": ["path", "hits", "misses", "writes", "evictions", "errors"],
+    "docs_cache": ["hits", "misses", "revalidated", "stale", "evictions", "entries", "bytes", "max_bytes", "directory"],
+    "catalog": ["source", "version", "tools", "reloads"],
+    "process": ["pid", "worker", "workers"],
+    "dispatch": ["coalescing", "coalesced", "inflight", "rate_limit", "rate_burst", "rejected", "clients", "by_tool"],
+    "status_checks": ["count", "failed", "short_circuited", "open_circuits", "p50_ms", "p95_ms", "p99_ms"],
+}
+
+
+def key_paths(value, prefix: str = "") -> set:
+    """Return the dotted key paths of a decoded JSON value, following the first object of each list."""
+    found = set()
+    if isinstance(value, dict):
+        for key, item in value.items():
+            found.add(prefix + key)
+            found |= key_paths(item, prefix + key + ".")
+    elif isinstance(value, list) and value and isinstance(value[0], dict):
+        found |= key_paths(value[0], prefix[:-1] + "[].")
+    return found
+
+
+@pytest.fixture
+def offline(monkeypatch):
+    """Keep tools that would go to the network local: a canned docs page and no URLs to sweep."""
+
+    async def docs_excerpt(url, refresh=False):
+        return {"title": "Stub", "excerpt": "Text.", "fetched": time.time(), "bytes": 5, "truncated": False}, "fetched"
+
+    monkeypatch.setattr(server, "_docs_excerpt", docs_excerpt)
+    monkeypatch.setattr(server, "_catalog_urls", lambda catalog: [])
+
+
+def call_json(name: str, arguments: dict) -> dict:
+    """Call a tool with output_format=json and decode its reply."""
+    return json.loads(asyncio.run(getattr(server, name)(**arguments, output_format="json")))
+
+
+@pytest.mark.parametrize("name, arguments, expected", SCHEMAS, ids=[f"{case[0]}-{i}" for i, case in enumerate(SCHEMAS)])
+def test_json_reply_has_a_stable_shape(name, arguments, expected, offline):
+    assert key_paths(call_json(name, arguments)) == set(expected)
+
+
+def test_server_metrics_json_has_a_stable_shape():
+    payload = call_json("server_metrics", {})
+    assert set(payload) == {"tools", "timestamp", *METRICS_SECTIONS}
+    for section, keys in METRICS_SECTIONS.items():
+        assert list(payload[section]) == keys
+    for stats in payload["tools"].values():
+        assert list(stats) == ["calls", "errors", "p50_ms", "p95_ms", "p99_ms"]
+
+
+def test_every_json_tool_has_a_schema_case():
+    covered = {case[0] for case in SCHEMAS} | {"server_metrics"}
+    json_tools = {
+        tool.name
+        for tool in server.mcp._tool_manager.list_tools()
+        if "output_format" in inspect.signature(tool.fn).parameters
+    }
+    assert json_tools == covered
+
+
+@pytest.mark.parametrize(
+    "name, arguments",
+    [
+        ("fetch_tool_reference", {"tool": "zzzz"}),
+        ("framework_quickstart", {"framework": "zzzz"}),
+        ("deployment_checklist", {"provider": "zzzz"}),
+        ("search_catalog", {"query": "react", "limit": "0"}),
+        ("related_tools", {"tool": ""}),
+        ("install_plan", {"tools": "prisma", "package_manager": "pip"}),
+        ("batch_lookup", {"requests": "[]"}),
+    ],
+)
+def test_json_errors_are_a_single_error_field(name, arguments):
+    payload = call_json(name, arguments)
+    assert list(payload) == ["error"]
+    assert isinstance(payload["error"], str) and not payload["error"].startswith("❌")
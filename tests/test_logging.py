@@ -0,0 +1,41 @@
+"""
+Logging is configured by the command line entry point, never by importing the module.
+"""
+import os
+import sys
+import logging
+import subprocess
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import fullstack_webdev_server as server  # noqa: E402
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_import_leaves_logging_and_threads_alone():
+    script = (
+        "import threading, fullstack_webdev_server as server; "
+        "print(len(server.logger.handlers), server.logger.propagate, threading.active_count())"
+    )
+    env = {**os.environ, "FULLSTACK_WEBDEV_LOG_FORMAT": "json"}
+    output = subprocess.run([sys.executable, "-c", script], cwd=ROOT, env=env, capture_output=True, text=True)
+    assert output.stdout.split() == ["0", "True", "1"]
+
+
+def test_configuring_touches_only_the_server_logger(monkeypatch):
+    monkeypatch.setenv("FULLSTACK_WEBDEV_LOG_QUEUE", "0")
+    root = logging.getLogger()
+    root_handlers = list(root.handlers)
+    try:
+        server._configure_logging()
+        first = server._LOG_HANDLER
+        server._configure_logging()
+        assert server.logger.handlers == [server._LOG_HANDLER]
+        assert first is not server._LOG_HANDLER
+        assert root.handlers == root_handlers
+    finally:
+        server.logger.removeHandler(server._LOG_HANDLER)
+        server.logger.setLevel(logging.NOTSET)
+        server.logger.propagate = True
+        server._LOG_HANDLER = None
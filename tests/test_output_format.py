@@ -0,0 +1,43 @@
+"""
+Tool errors returned as JSON must still be counted as failed calls.
+"""
+import os
+import sys
+import json
+import asyncio
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import fullstack_webdev_server as server  # noqa: E402
+
+
+def call_and_count(handler, **arguments) -> tuple:
+    """Run a tool handler and return its reply plus how many errors it added to the tool metrics."""
+    name = handler.__name__
+    before = server._TOOL_METRICS.errors.get(name, 0)
+    reply = asyncio.run(handler(**arguments))
+    return reply, server._TOOL_METRICS.errors.get(name, 0) - before
+
+
+def test_json_error_reply_is_recorded_as_failure():
+    reply, errors = call_and_count(server.fetch_tool_reference, tool="nxt", output_format="json")
+    assert "error" in json.loads(reply)
+    assert errors == 1
+
+
+def test_json_unknown_category_is_recorded_as_failure():
+    reply, errors = call_and_count(server.list_tool_categories, category="zzz", output_format="json")
+    assert json.loads(reply) == {"error": "Unknown category 'zzz'."}
+    assert errors == 1
+
+
+def test_json_success_is_not_recorded_as_failure():
+    reply, errors = call_and_count(server.fetch_tool_reference, tool="prisma", output_format="json")
+    assert json.loads(reply)["tool"]["label"] == "Prisma"
+    assert errors == 0
+
+
+def test_text_error_reply_is_recorded_as_failure():
+    reply, errors = call_and_count(server.fetch_tool_reference, tool="zzzz")
+    assert reply.startswith("❌")
+    assert errors == 1
@@ -0,0 +1,68 @@
+"""
+related_tools: sparse cosine scores, the text and JSON replies, and building the index with the catalog.
+"""
+import os
+import sys
+import json
+import math
+import asyncio
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import fullstack_webdev_server as server  # noqa: E402
+
+
+def cosine(index, row: int, other: int) -> float:
+    """Cosine similarity of two tools computed directly from their feature dicts over the index's columns."""
+    vectors = []
+    for counts in (index.features[row], index.features[other]):
+        weights = {term: (1 + math.log(count)) * index.idf[term] for term, count in counts.items()}
+        norm = math.sqrt(sum(weight * weight for weight in weights.values()))
+        vectors.append({term: weight / norm for term, weight in weights.items() if term in index.columns})
+    return sum(weight * vectors[1].get(term, 0.0) for term, weight in vectors[0].items())
+
+
+def test_sparse_scores_match_direct_cosine():
+    index = server._RelatedIndex(server._get_catalog())
+    for row in range(len(index.tools)):
+        scores = index._scores(row)
+        for other in range(len(index.tools)):
+            assert scores[other] == pytest.approx(cosine(index, row, other), abs=1e-5)
+
+
+def test_related_text_lists_neighbors_with_shared_terms():
+    reply = asyncio.run(server.related_tools(tool="prisma", limit="3"))
+    lines = reply.splitlines()
+    assert lines[0] == "🧭 Related to Prisma (Databases, ORM & Storage)"
+    assert lines[1] == "- Supabase (Databases, ORM & Storage): same category, databases, orm, storage (score 0.45)"
+    assert len(lines) == 4
+    assert all("recipe saas-dashboard" in line for line in lines[2:])
+
+
+def test_related_json_reports_each_query():
+    reply = asyncio.run(server.related_tools(tool="prsma, nope-tool", limit="2", output_format="json"))
+    found, missing = json.loads(reply)["results"]
+    assert found["query"] == "prsma"
+    assert found["tool"] == "Prisma"
+    assert found["matched"] is True
+    assert [item["tool"] for item in found["related"]][:1] == ["Supabase"]
+    assert len(found["related"]) == 2
+    assert found["related"][0]["score"] >= found["related"][1]["score"] > 0
+    assert set(found["related"][0]) == {"tool", "category", "score", "shared"}
+    assert missing["query"] == "nope-tool"
+    assert "not in the curated catalog" in missing["error"]
+
+
+def test_related_index_is_built_with_the_catalog():
+    catalog = server._Catalog(
+        server.RAW_TOOL_DATA,
+        server.FRAMEWORK_STARTERS,
+        server.DEPLOYMENT_PLAYBOOKS,
+        server.STACK_RECIPES,
+        server.DESIGN_KNOWLEDGE_DATA,
+    )
+    assert "related_index" not in vars(catalog)
+    catalog.build_all()
+    assert isinstance(vars(catalog)["related_index"], server._RelatedIndex)
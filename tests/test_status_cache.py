@@ -0,0 +1,126 @@
+"""
+Status checks against a local stand-in HTTP server: concurrent checks share one probe, results expire, and
+sweeps label the results they reuse.
+"""
+import os
+import sys
+import json
+import time
+import asyncio
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import fullstack_webdev_server as server  # noqa: E402
+
+TTL = 0.5
+
+
+class CountingHandler(BaseHTTPRequestHandler):
+    """Answer HEAD requests with 200 after a short delay, counting them."""
+
+    requests = 0
+    lock = threading.Lock()
+
+    def do_HEAD(self):
+        with self.lock:
+            CountingHandler.requests += 1
+        time.sleep(0.1)
+        self.send_response(200)
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub_url():
+    """Serve CountingHandler on a free local port for one test."""
+    CountingHandler.requests = 0
+    stub = ThreadingHTTPServer(("127.0.0.1", 0), CountingHandler)
+    threading.Thread(target=stub.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{stub.server_address[1]}/docs"
+    stub.shutdown()
+    stub.server_close()
+
+
+@pytest.fixture
+def status_cache(monkeypatch):
+    """Swap in an empty status cache with a short TTL."""
+    cache = server._StatusCache(TTL, TTL)
+    monkeypatch.setattr(server, "_STATUS_CACHE", cache)
+    return cache
+
+
+def test_concurrent_checks_share_one_probe(stub_url, status_cache):
+    async def scenario():
+        try:
+            probes_before = server._STATUS_CHECK_LATENCY.count
+            results = await asyncio.gather(*(server._get_status(stub_url) for _ in range(10)))
+            probes = server._STATUS_CHECK_LATENCY.count - probes_before
+            again, _ = await server._get_status(stub_url)
+            return results, probes, again
+        finally:
+            await server._close_http_client()
+
+    results, probes, again = asyncio.run(scenario())
+    assert CountingHandler.requests == 1
+    assert probes == 1
+    assert all(result["code"] == 200 for result, _ in results)
+    assert again["code"] == 200
+    assert status_cache.stats()["misses"] == 1
+    assert status_cache.stats()["coalesced"] == 9
+    assert status_cache.stats()["hits"] == 1
+
+
+def test_cached_status_expires_after_ttl(stub_url, status_cache):
+    async def scenario():
+        try:
+            await server._get_status(stub_url)
+            await server._get_status(stub_url)
+            requests_while_fresh = CountingHandler.requests
+            await asyncio.sleep(TTL + 0.1)
+            # An expired result is served stale while one refresh runs in the background.
+            stale, age = await server._get_status(stub_url)
+            await asyncio.gather(*status_cache._inflight.values())
+            return requests_while_fresh, stale, age
+        finally:
+            await server._close_http_client()
+
+    requests_while_fresh, stale, age = asyncio.run(scenario())
+    assert requests_while_fresh == 1
+    assert stale["code"] == 200
+    assert age >= TTL
+    assert CountingHandler.requests == 2
+    assert status_cache.stats()["stale"] == 1
+    assert status_cache.peek(stub_url)[0]["code"] == 200
+
+
+def test_sweep_marks_cached_results_and_refresh_probes_again(stub_url, monkeypatch):
+    monkeypatch.setattr(server, "_catalog_urls", lambda catalog: [(stub_url, "Stub (Tool)")])
+    monkeypatch.setattr(server, "_STATUS_CACHE", server._StatusCache(600, 600))
+    server._STATUS_CACHE.put(stub_url, {"code": 503, "reason": "Service Unavailable", "error": ""}, 120.0)
+
+    async def scenario():
+        try:
+            cached = await server.check_catalog_health()
+            cached_json = json.loads(await server.check_catalog_health(output_format="json"))
+            fresh_json = json.loads(await server.check_catalog_health(refresh="yes", output_format="json"))
+            return cached, cached_json, fresh_json
+        finally:
+            await server._close_http_client()
+
+    cached, cached_json, fresh_json = asyncio.run(scenario())
+    assert "Cached: 1" in cached
+    assert "| 🌐 Status: 503 Service Unavailable (cached, checked 2m ago)" in cached
+    assert cached_json["cached"] == 1
+    assert cached_json["results"][0]["cached"] is True
+    assert cached_json["results"][0]["age"] >= 120
+    assert CountingHandler.requests == 1
+    assert fresh_json["cached"] == 0
+    assert fresh_json["results"][0]["code"] == 200
+    assert fresh_json["results"][0]["cached"] is False
+    assert "age" not in fresh_json["results"][0]